@@ -1,39 +1,181 @@
-from datetime import datetime, timezone
-from time import strftime
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from time import gmtime, strftime
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Optional
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
     from aiologbuch.shared.types import LogRecordProtocol
 
 
+class _CacheKey:
+    __slots__ = ("__weakref__",)
+
+
+# NOTE: One key per formatter configuration, shared by all formatters that have it. The
+# formatters hold their key, so a configuration (and the class in it) is forgotten once
+# the last formatter that has it is gone.
+_cache_keys: WeakValueDictionary[Hashable, _CacheKey] = WeakValueDictionary()
+
+
 class BaseFormatter:
     # NOTE: The default datetime format follows ISO 8601 using UTC time zone.
     DEFAULT_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
     DEFAULT_MSEC_FORMAT = "%s.%03dZ"
     TERMINATOR = b"\n"
 
+    FIELDS = (
+        "timestamp",
+        "level",
+        "process_id",
+        "process_name",
+        "thread_id",
+        "thread_name",
+        "name",
+        "filename",
+        "function_name",
+        "line_number",
+        "traceback",
+        "message",
+    )
+    CALLER_FIELDS = frozenset({"filename", "function_name", "line_number"})
+    THREAD_FIELDS = frozenset({"thread_id", "thread_name"})
+
+    # NOTE: The record attribute each field is read from, except for 'timestamp',
+    # which the formatter renders
+    FIELD_ATTRIBUTES = {
+        "level": "levelname",
+        "process_id": "process",
+        "process_name": "processName",
+        "thread_id": "thread",
+        "thread_name": "threadName",
+        "name": "name",
+        "filename": "pathname",
+        "function_name": "funcName",
+        "line_number": "lineno",
+        "traceback": "exc_text",
+        "message": "msg",
+    }
+
+    _date_format = DEFAULT_DATE_FORMAT
+    _msec_format = DEFAULT_MSEC_FORMAT
+    _time_cache: tuple[Optional[int], str] = (None, "")
+    _cache_key: Optional[_CacheKey] = None
+    _fields: tuple[str, ...]
+    _attributes_getter: Callable[["LogRecordProtocol"], tuple[Any, ...]]
+    _timestamp_index: Optional[int]
+
+    def __init__(
+        self,
+        date_format: Optional[str] = None,
+        msec_format: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        self._date_format = date_format or self.DEFAULT_DATE_FORMAT
+        self._msec_format = msec_format or self.DEFAULT_MSEC_FORMAT
+        self._fields = self.FIELDS if fields is None else self._check_fields(fields)
+        self._attributes_getter, self._timestamp_index = self._build_getter(
+            self._fields
+        )
+
+    @property
+    def fields(self):
+        return self._fields
+
+    @property
+    def needs_caller(self):
+        return not self.CALLER_FIELDS.isdisjoint(self._fields)
+
+    @property
+    def needs_thread(self):
+        return not self.THREAD_FIELDS.isdisjoint(self._fields)
+
+    @property
+    def needs_traceback(self):
+        return "traceback" in self._fields
+
+    @property
+    def cache_key(self):
+        # NOTE: Formatters with the same configuration render a record to the same
+        # bytes, so they get the very same key and handlers can reuse each other's
+        # output. Subclasses that add options must add them to '_config' as well.
+        if self._cache_key is None:
+            self._cache_key = _cache_keys.setdefault(self._config(), _CacheKey())
+        return self._cache_key
+
+    def _config(self) -> tuple[Hashable, ...]:
+        return (
+            type(self),
+            self.TERMINATOR,
+            self._date_format,
+            self._msec_format,
+            self._fields,
+        )
+
+    def _check_fields(self, fields: Iterable[str]):
+        fields = tuple(fields)
+
+        if unknown := [field for field in fields if field not in self.FIELDS]:
+            raise ValueError(
+                f"Unknown fields: {', '.join(map(repr, unknown))}. The available "
+                f"fields are: {', '.join(self.FIELDS)}"
+            )
+
+        if len(set(fields)) != len(fields):
+            raise ValueError("Fields can not be repeated")
+
+        return fields
+
+    def _build_getter(self, fields: tuple[str, ...]):
+        # NOTE: Only the given fields are read from a record, all at once by a single
+        # 'attrgetter', which returns them as a tuple. The timestamp is rendered on its
+        # own and put back where it belongs.
+        attributes = [
+            self.FIELD_ATTRIBUTES[field] for field in fields if field != "timestamp"
+        ]
+        index = fields.index("timestamp") if "timestamp" in fields else None
+
+        if len(attributes) > 1:
+            return attrgetter(*attributes), index
+        if attributes:
+            getter = attrgetter(attributes[0])
+            return (lambda record: (getter(record),)), index
+        return (lambda record: ()), index
+
     def format(self, record: "LogRecordProtocol") -> bytes:
         raise NotImplementedError("format() must be implemented in subclasses")
 
+    @property
+    def date_format(self):
+        return self._date_format
+
+    @property
+    def msec_format(self):
+        return self._msec_format
+
     def _converter(self, secs: float):
-        return datetime.fromtimestamp(secs, tz=timezone.utc).timetuple()
+        return gmtime(secs)
 
     def _format_time(self, record: "LogRecordProtocol"):
-        timestamp = strftime(self.DEFAULT_DATE_FORMAT, self._converter(record.created))
-        return self.DEFAULT_MSEC_FORMAT % (timestamp, record.msecs)
+        # NOTE: 'strftime' has no sub-second directives, so the rendered date is the
+        # same for every record within a whole second and is cached until it changes.
+        # The cache is a single tuple, which is swapped at once, so threads can never
+        # see the second of one entry alongside the date of another.
+        seconds = int(record.created)
+        cached_seconds, timestamp = self._time_cache
+        if cached_seconds != seconds:
+            timestamp = strftime(self._date_format, self._converter(seconds))
+            self._time_cache = (seconds, timestamp)
+
+        return self._msec_format % (timestamp, record.msecs)
+
+    def record_values(self, record: "LogRecordProtocol") -> tuple[Any, ...]:
+        # NOTE: The values follow the order of 'fields'
+        values = self._attributes_getter(record)
+        if (index := self._timestamp_index) is None:
+            return values
+        if index == 0:
+            return (self._format_time(record), *values)
+        return (*values[:index], self._format_time(record), *values[index:])
 
     def prepare_record(self, record: "LogRecordProtocol"):
-        return {
-            "timestamp": self._format_time(record),
-            "level": record.levelname,
-            "process_id": record.process,
-            "process_name": record.processName,
-            "thread_id": record.thread,
-            "thread_name": record.threadName,
-            "name": record.name,
-            "filename": record.pathname,
-            "function_name": record.funcName,
-            "line_number": record.lineno,
-            "traceback": record.exc_text,
-            "message": record.msg,
-        }
+        return dict(zip(self._fields, self.record_values(record)))
@@ -0,0 +1,73 @@
+from json import dumps
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from aiologbuch.shared.context import Context
+    from aiologbuch.shared.types import JsonEncoderType
+
+
+def get_json_encoder(name: Optional["JsonEncoderType"] = None):
+    if name is None:
+        name = "stdlib"
+
+    encoders = {
+        "stdlib": _StdlibEncoder,
+    }
+
+    if encoder := encoders.get(name):
+        return encoder
+
+    raise ValueError(f"Unsupported json encoder: {name!r}")
+
+
+class _StdlibEncoder:
+    # NOTE: Renders the values of a record as a json object laid out exactly like
+    # 'json.dumps' does with its default options (ascii only, ", " and ": " as
+    # separators), with every backslash doubled. The keys never change, so they're
+    # encoded once into a template and each record only encodes its values. Keys and
+    # numbers never contain backslashes, so they're doubled in each encoded value,
+    # where 'replace' returns the very same string when there's none, instead of
+    # copying the whole output once more.
+    _template: str
+    _head: str
+    _separator: str
+    _tail: str
+
+    def __init__(self, fields: Iterable[str], terminator: bytes):
+        fragments = [
+            "%s: %%s" % encode_basestring_ascii(key).replace("%", "%%")
+            for key in fields
+        ]
+        members = ", ".join(fragments)
+        self._template = (
+            "{" + members + "}" + terminator.decode("latin-1").replace("%", "%%")
+        )
+
+        # NOTE: Records with a context are rendered without the end of the object, then
+        # the context's members are spliced in before it
+        self._head = "{" + members
+        self._separator = ", " if fragments else ""
+        self._tail = "}" + terminator.decode("latin-1")
+
+    def encode(self, values: tuple[Any, ...], context: Optional["Context"] = None):
+        # NOTE: Every encoded value is ascii only, so the terminator is the only thing
+        # that might need 'latin-1' to make it back to the same bytes.
+        encoded = tuple(
+            [
+                encode_basestring_ascii(value).replace("\\", "\\\\")
+                if type(value) is str
+                else "null"
+                if value is None
+                else int.__repr__(value)
+                if type(value) is int
+                else dumps(value).replace("\\", "\\\\")
+                for value in values
+            ]
+        )
+        if context is None:
+            return (self._template % encoded).encode("latin-1")
+
+        text = self._head % encoded
+        text = f"{text}{self._separator}{context.fragment}{self._tail}"
+        return text.encode("latin-1")
@@ -1,17 +1,35 @@
-import json
-import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from .base import BaseFormatter
+from .encoders import get_json_encoder
 
 if TYPE_CHECKING:
-    from aiologbuch.shared.types import LogRecordProtocol
+    from aiologbuch.shared.types import JsonEncoderType, LogRecordProtocol
 
 
 class JsonFormatter(BaseFormatter):
-    def _ensure_safe(self, text: str):
-        return re.sub(r"\\", r"\\\\", text)
+    def __init__(
+        self,
+        date_format: Optional[str] = None,
+        msec_format: Optional[str] = None,
+        encoder: Optional["JsonEncoderType"] = None,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        super().__init__(
+            date_format=date_format, msec_format=msec_format, fields=fields
+        )
+        self._encoder = get_json_encoder(encoder)(
+            fields=self.fields, terminator=self.TERMINATOR
+        )
+
+    @property
+    def encoder(self):
+        return self._encoder
+
+    def _config(self):
+        return super()._config() + (type(self._encoder),)
 
     def format(self, record: "LogRecordProtocol"):
-        data = self.prepare_record(record=record)
-        return self._ensure_safe(json.dumps(data)).encode() + self.TERMINATOR
+        # NOTE: The context is already encoded, so it costs the same however many
+        # fields it has
+        return self._encoder.encode(self.record_values(record), record.context)
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any
+import re
+from typing import TYPE_CHECKING, Optional
 
 from .base import BaseFormatter
 
@@ -7,24 +8,60 @@ if TYPE_CHECKING:
 
 
 class LineFormatter(BaseFormatter):
-    def __init__(self, log_style: str | None = None):
-        self._log_style = log_style
+    DEFAULT_LOG_STYLE = "{timestamp} | {level} | {name} | {message}"
+    PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+    def __init__(
+        self,
+        log_style: str | None = None,
+        date_format: Optional[str] = None,
+        msec_format: Optional[str] = None,
+    ):
+        self._log_style = log_style or self.DEFAULT_LOG_STYLE
+        self._template, placeholders = self._compile(self._log_style)
+
+        fields = tuple(field for field in self.FIELDS if field in placeholders)
+        super().__init__(
+            date_format=date_format, msec_format=msec_format, fields=fields
+        )
+
+        # NOTE: The values come in the order of 'fields', so they only need to be
+        # rearranged when the template repeats or reorders them.
+        self._positions = None
+        if placeholders != fields:
+            self._positions = tuple(fields.index(field) for field in placeholders)
 
     @property
     def log_style(self):
-        default = "{timestamp} | {level} | {name} | {message}"
-        if not self._log_style:
-            self._log_style = default
         return self._log_style
 
-    def _parse(self, data: dict[str, Any]):
-        log = self.log_style
-        for key in data:
-            placeholder = "{" + key + "}"
-            log = log.replace(placeholder, str(data[key]))
-        return log
+    def _config(self):
+        return super()._config() + (self._log_style,)
+
+    def _compile(self, log_style: str):
+        # NOTE: The template is split once into its literal and field segments, then
+        # joined back as a '%' format string, so each record is rendered in a single
+        # pass and only the fields it references are turned into strings.
+        segments, placeholders, position = [], [], 0
+
+        for match in self.PLACEHOLDER_PATTERN.finditer(log_style):
+            field = match.group(1)
+            if field not in self.FIELDS:
+                raise ValueError(
+                    f"Unknown placeholder {match.group()!r} in the log style. The "
+                    f"available fields are: {', '.join(self.FIELDS)}"
+                )
+
+            segments.append(log_style[position : match.start()].replace("%", "%%"))
+            segments.append("%s")
+            placeholders.append(field)
+            position = match.end()
+
+        segments.append(log_style[position:].replace("%", "%%"))
+        return "".join(segments), tuple(placeholders)
 
     def format(self, record: "LogRecordProtocol"):
-        data = self.prepare_record(record=record)
-        log = self._parse(data=data)
-        return log.encode() + self.TERMINATOR
+        values = self.record_values(record)
+        if self._positions is not None:
+            values = tuple([values[position] for position in self._positions])
+        return (self._template % values).encode() + self.TERMINATOR
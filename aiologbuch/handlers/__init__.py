@@ -2,8 +2,14 @@ from typing import TYPE_CHECKING as _TypeChecking
 
 from .base import BaseAsyncHandler as _BaseAsync
 from .base import BaseSyncHandler as _BaseSync
+from .collector import AsyncCollectorMixin as _AsyncCollectorMixin
+from .collector import SyncCollectorMixin as _SyncCollectorMixin
 from .file import AsyncFileMixin as _AsyncFileMixin
+from .file import RotationPolicy as _RotationPolicy
 from .file import SyncFileMixin as _SyncFileMixin
+from .ring import DEFAULT_RING_SIZE as _DEFAULT_RING_SIZE
+from .ring import AsyncRingMixin as _AsyncRingMixin
+from .ring import SyncRingMixin as _SyncRingMixin
 from .stderr import AsyncStderrMixin as _AsyncStderrMixin
 from .stderr import SyncStderrMixin as _SyncStderrMixin
 
@@ -24,6 +30,58 @@ class AsyncFileHandler(_BaseAsync, _AsyncFileMixin):
         self._filename = filename
 
 
+class AsyncRotatingFileHandler(AsyncFileHandler):
+    def __init__(
+        self,
+        filename: str,
+        formatter: "FormatterProtocol",
+        max_bytes: int = 0,
+        interval: float = 0.0,
+        backup_count: int = 5,
+        compress: bool = True,
+    ):
+        super().__init__(filename=filename, formatter=formatter)
+        self._rotation = _RotationPolicy(
+            max_bytes=max_bytes,
+            interval=interval,
+            backup_count=backup_count,
+            compress=compress,
+        )
+
+
+class AsyncRingHandler(_BaseAsync, _AsyncRingMixin):
+    def __init__(
+        self,
+        filename: str,
+        formatter: "FormatterProtocol",
+        size: int = _DEFAULT_RING_SIZE,
+    ):
+        if not filename:
+            raise ValueError("'filename' cannot be empty")
+
+        super(_BaseAsync, self).__init__(formatter=formatter)
+        self._filename = filename
+        self._size = size
+
+
+class AsyncCollectorHandler(_BaseAsync, _AsyncCollectorMixin):
+    def __init__(
+        self,
+        path: str,
+        formatter: "FormatterProtocol",
+        buffer_size: int = 10_000,
+    ):
+        if not path:
+            raise ValueError("'path' cannot be empty")
+
+        if buffer_size <= 0:
+            raise ValueError("'buffer_size' must be greater than zero")
+
+        super(_BaseAsync, self).__init__(formatter=formatter)
+        self._path = path
+        self._buffer_size = buffer_size
+
+
 class SyncStderrHandler(_BaseSync, _SyncStderrMixin):
     ...
 
@@ -35,3 +93,55 @@ class SyncFileHandler(_BaseSync, _SyncFileMixin):
 
         super(_BaseSync, self).__init__(formatter=formatter)
         self._filename = filename
+
+
+class SyncRotatingFileHandler(SyncFileHandler):
+    def __init__(
+        self,
+        filename: str,
+        formatter: "FormatterProtocol",
+        max_bytes: int = 0,
+        interval: float = 0.0,
+        backup_count: int = 5,
+        compress: bool = True,
+    ):
+        super().__init__(filename=filename, formatter=formatter)
+        self._rotation = _RotationPolicy(
+            max_bytes=max_bytes,
+            interval=interval,
+            backup_count=backup_count,
+            compress=compress,
+        )
+
+
+class SyncRingHandler(_BaseSync, _SyncRingMixin):
+    def __init__(
+        self,
+        filename: str,
+        formatter: "FormatterProtocol",
+        size: int = _DEFAULT_RING_SIZE,
+    ):
+        if not filename:
+            raise ValueError("'filename' cannot be empty")
+
+        super(_BaseSync, self).__init__(formatter=formatter)
+        self._filename = filename
+        self._size = size
+
+
+class SyncCollectorHandler(_BaseSync, _SyncCollectorMixin):
+    def __init__(
+        self,
+        path: str,
+        formatter: "FormatterProtocol",
+        buffer_size: int = 10_000,
+    ):
+        if not path:
+            raise ValueError("'path' cannot be empty")
+
+        if buffer_size <= 0:
+            raise ValueError("'buffer_size' must be greater than zero")
+
+        super(_BaseSync, self).__init__(formatter=formatter)
+        self._path = path
+        self._buffer_size = buffer_size
@@ -1,10 +1,14 @@
+from asyncio import _get_running_loop
 from logging import Handler
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 from anyio.to_thread import run_sync
 
 from aiologbuch.shared.conf import settings
+from aiologbuch.shared.metrics import HandlerMetrics
 from aiologbuch.shared.utils import sync_lock_context
+from aiologbuch.shared.watchdog import registry as watchdogs
 
 if TYPE_CHECKING:
     from aiologbuch.shared.types import FormatterProtocol, LogRecordProtocol
@@ -13,18 +17,44 @@ if TYPE_CHECKING:
 class BaseHandler:
     def __init__(self, formatter: "FormatterProtocol"):
         self.formatter = formatter
+        self._metrics = HandlerMetrics()
+
+    @property
+    def metrics(self):
+        return self._metrics
 
     def format(self, record: "LogRecordProtocol"):
-        return self.formatter.format(record)
+        # NOTE: Records only carry a cache when their logger has handlers whose
+        # formatters share a configuration, so the first of them formats the record and
+        # the others reuse its output.
+        if (cache := record._formatted) is None:
+            return self.formatter.format(record)
+
+        key = self.formatter.cache_key
+        if (msg := cache.get(key)) is None:
+            msg = cache[key] = self.formatter.format(record)
+        return msg
 
 
 class BaseAsyncHandler(BaseHandler):
     async def handle(self, record: "LogRecordProtocol"):
         try:
+            start = perf_counter()
             msg = self.format(record)
-            await self.write_and_flush(msg)
+            formatted = perf_counter()
+            await self.write_and_flush(msg, record.levelno)
+            end = perf_counter()
+            self._metrics.written(len(msg), end - formatted)
+
+            # NOTE: Formatting always holds the event loop. Handlers that don't block
+            # write without ever yielding to it, so their write holds it too.
+            if (watchdog := watchdogs.active) is not None:
+                blocking = getattr(self, "blocking", True)
+                blocked = formatted - start if blocking else end - start
+                watchdog.observe(self, len(msg), blocked)
         # TODO: Catch custom exceptions
         except:  # noqa
+            self._metrics.errors += 1
             await self.handle_error(record)
 
     async def handle_error(self, record: "LogRecordProtocol"):
@@ -36,10 +66,20 @@ class BaseAsyncHandler(BaseHandler):
 class BaseSyncHandler(BaseHandler):
     def handle(self, record: "LogRecordProtocol"):
         try:
+            start = perf_counter()
             msg = self.format(record)
-            self.write_and_flush(msg)
+            formatted = perf_counter()
+            self.write_and_flush(msg, record.levelno)
+            end = perf_counter()
+            self._metrics.written(len(msg), end - formatted)
+
+            # NOTE: A sync logger called from a coroutine holds the event loop for the
+            # whole call, lock waits included
+            if (watchdog := watchdogs.active) is not None and _get_running_loop():
+                watchdog.observe(self, len(msg), end - start)
         # TODO: Catch custom exceptions
         except:  # noqa
+            self._metrics.errors += 1
             self.handle_error(record)
 
     def handle_error(self, record: "LogRecordProtocol"):
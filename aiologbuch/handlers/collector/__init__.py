@@ -0,0 +1,4 @@
+from .async_ import AsyncCollectorMixin  # noqa
+from .client import CollectorClient  # noqa
+from .server import Collector  # noqa
+from .sync import SyncCollectorMixin  # noqa
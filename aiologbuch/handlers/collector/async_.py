@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING, Optional
+
+from anyio.to_thread import run_sync
+
+from .manager import resource_manager
+
+if TYPE_CHECKING:
+    from .client import CollectorClient
+
+
+class AsyncCollectorMixin:
+    _path: str
+    _buffer_size: int
+    _client: Optional["CollectorClient"] = None
+    # NOTE: Sending only appends to the client's buffer, its own thread does the rest
+    blocking = False
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def buffer_size(self):
+        return self._buffer_size
+
+    @property
+    def manager(self):
+        return resource_manager
+
+    @property
+    def stats(self):
+        return None if self._client is None else self._client.stats
+
+    async def write_and_flush(self, msg: bytes, level: int):
+        if self._client is None:
+            self._client = self.manager.open_client(self.path, self.buffer_size)
+
+        self._client.send(msg, level)
+
+    async def close(self):
+        if self._client is not None:
+            self._client = None
+            # NOTE: The last client waits for its thread to send what's pending
+            await run_sync(self.manager.close_client, self.path)
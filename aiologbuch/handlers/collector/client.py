@@ -0,0 +1,186 @@
+import os
+import socket
+from collections import deque
+from threading import Event, Thread
+from threading import Lock as ThreadLock
+from typing import Optional
+from weakref import WeakSet
+
+from aiologbuch.shared.buffers import BufferStats
+
+from .frames import encode_frame
+
+_MAX_BATCH_BYTES = 256 * 1024
+_MIN_RETRY_DELAY = 0.05
+_MAX_RETRY_DELAY = 2.0
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+class CollectorClient:
+    # NOTE: Ships the records of a worker process to the collector. Logging calls only
+    # append a frame to a bounded deque and return, while a thread of its own connects
+    # to the collector's socket and sends them. Should the collector be unreachable,
+    # frames pile up until the deque is full, from then on the oldest ones are dropped,
+    # and the thread keeps trying to reconnect, backing off a little more every time.
+    _path: str
+    _max_size: int
+    _frames: deque[bytes]
+    _wakeup: Event
+    _stopped: Event
+    _thread: Optional[Thread]
+    _socket: Optional[socket.socket]
+    _stats: BufferStats
+
+    def __init__(self, path: str, max_size: int = 10_000):
+        if max_size <= 0:
+            raise ValueError("'max_size' must be greater than zero")
+
+        self._path = path
+        self._max_size = max_size
+        self._frames = deque()
+        self._wakeup, self._stopped = Event(), Event()
+        self._thread, self._socket = None, None
+        self._lock = ThreadLock()
+        self._stats = BufferStats()
+        _clients.add(self)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def stats(self):
+        return self._stats
+
+    @property
+    def connected(self):
+        return self._socket is not None
+
+    def __len__(self):
+        return len(self._frames)
+
+    def send(self, msg: bytes, level: int):
+        if self._stopped.is_set():
+            raise RuntimeError("The collector client was closed")
+
+        if len(self._frames) >= self._max_size:
+            try:
+                self._frames.popleft()
+                self._stats.dropped += 1
+            except IndexError:
+                ...
+
+        self._frames.append(encode_frame(msg, level))
+        self._wakeup.set()
+
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name=f"aiologbuch-collector:{self._path}"
+                )
+                self._thread.daemon = True
+                self._thread.start()
+
+    def _run(self):
+        delay = _MIN_RETRY_DELAY
+
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._frames:
+                try:
+                    self._send_pending()
+                    delay = _MIN_RETRY_DELAY
+                except OSError:
+                    self._disconnect()
+                    # NOTE: Waits before reconnecting, unless it's being closed
+                    if self._stopped.wait(delay):
+                        return
+                    delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+            if self._stopped.is_set():
+                return
+
+    def _connect(self):
+        if self._socket is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self._path)
+            except OSError:
+                sock.close()
+                raise
+            self._socket = sock
+        return self._socket
+
+    def _disconnect(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _send_pending(self):
+        sock = self._connect()
+
+        frames, size = [], 0
+        while self._frames and len(frames) < _IOV_MAX and size < _MAX_BATCH_BYTES:
+            frame = self._frames.popleft()
+            frames.append(frame)
+            size += len(frame)
+
+        views = [memoryview(frame) for frame in frames]
+        sent = 0
+        try:
+            while sent < len(views):
+                written = sock.sendmsg(views[sent:])
+                # NOTE: Moves past the frames that were fully sent, and keeps sending
+                # whatever was left of a frame that only went partially
+                while sent < len(views) and written >= len(views[sent]):
+                    written -= len(views[sent])
+                    sent += 1
+                if written:
+                    views[sent] = views[sent][written:]
+        except OSError:
+            # NOTE: The frames that didn't make it are sent again once reconnected, as
+            # a whole, since the collector discards the partial frame it was left with
+            self._frames.extendleft(reversed(frames[sent:]))
+            raise
+
+    def close(self, timeout: Optional[float] = 5.0):
+        # NOTE: Gives the thread some time to send what's pending, but doesn't wait
+        # forever on a collector that is gone
+        self._stopped.set()
+        self._wakeup.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+        self._disconnect()
+
+    def _after_fork(self):
+        # NOTE: The thread doesn't exist in the child, and the frames that were waiting
+        # belong to the parent, which still sends them
+        self._frames.clear()
+        self._thread, self._socket = None, None
+        self._wakeup, self._stopped = Event(), Event()
+        self._lock = ThreadLock()
+
+
+_clients: "WeakSet[CollectorClient]" = WeakSet()
+
+
+def _reset_clients():
+    for client in list(_clients):
+        client._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients)
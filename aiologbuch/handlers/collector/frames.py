@@ -0,0 +1,50 @@
+from struct import Struct
+
+# NOTE: Records travel from the workers to the collector as frames:
+#   length (4) | level (4) | payload (length)
+# The payload is the record, already formatted by the worker.
+FRAME_HEADER = Struct("<II")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+def encode_frame(msg: bytes, level: int):
+    return FRAME_HEADER.pack(len(msg), level) + msg
+
+
+class FrameDecoder:
+    # NOTE: Turns the bytes read from a connection back into records. Reads can end in
+    # the middle of a frame, so whatever is left is kept until the next one.
+    _buffer: bytearray
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    @property
+    def pending(self):
+        return len(self._buffer)
+
+    def feed(self, data: bytes):
+        # NOTE: Returns the payloads of the complete frames, joined, along with the
+        # highest level among them
+        buffer = self._buffer
+        buffer.extend(data)
+
+        spans, level, position = [], 0, 0
+        while len(buffer) - position >= FRAME_HEADER.size:
+            length, frame_level = FRAME_HEADER.unpack_from(buffer, position)
+            if length > MAX_FRAME_SIZE:
+                raise ValueError(f"Frame of {length} bytes is over the maximum size")
+
+            start = position + FRAME_HEADER.size
+            if len(buffer) - start < length:
+                break
+
+            spans.append((start, start + length))
+            level = max(level, frame_level)
+            position = start + length
+
+        with memoryview(buffer) as view:
+            data = b"".join([view[start:end] for start, end in spans])
+
+        del buffer[:position]
+        return data, level
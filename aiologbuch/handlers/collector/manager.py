@@ -0,0 +1,46 @@
+from threading import Lock as ThreadLock
+
+from .client import CollectorClient
+
+
+class _ResourceManager:
+    # NOTE: A process keeps a single connection to each collector, shared by all the
+    # handlers pointing to it, so that records from the same process keep their order
+    _lock: ThreadLock
+    _resources: dict[str, CollectorClient]
+    _references: dict[str, int]
+
+    def __init__(self):
+        self._lock = ThreadLock()
+        self._resources = dict()
+        self._references = dict()
+
+    @property
+    def resources(self):
+        return self._resources
+
+    def open_client(self, path: str, buffer_size: int):
+        with self._lock:
+            if (client := self._resources.get(path)) is None:
+                client = CollectorClient(path=path, max_size=buffer_size)
+                self._resources[path] = client
+                self._references[path] = 0
+
+            self._references[path] += 1
+            return client
+
+    def close_client(self, path: str):
+        with self._lock:
+            if (client := self._resources.get(path)) is None:
+                return
+
+            self._references[path] -= 1
+            if self._references[path] > 0:
+                return
+
+            del self._resources[path], self._references[path]
+
+        client.close()
+
+
+resource_manager = _ResourceManager()
@@ -0,0 +1,176 @@
+import asyncio
+import os
+import socket
+import stat
+import sys
+import traceback
+from asyncio import AbstractServer, StreamReader, StreamWriter, Task
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from aiologbuch.shared.buffers import OverflowBuffer
+from aiologbuch.shared.enums import OverflowPolicyEnum
+
+from .frames import FrameDecoder
+
+if TYPE_CHECKING:
+    from aiologbuch.shared.types import AsyncHandlerProtocol
+
+_READ_SIZE = 256 * 1024
+
+
+class Collector:
+    # NOTE: Receives the records of every worker over a Unix socket and writes them to
+    # its handlers. Records arrive already formatted, so all it does is join whatever
+    # came in while the previous batch was being written and write it all at once.
+    # Connections that outpace the handlers wait on the buffer, which in turn stops
+    # reading from their sockets and lets the workers' own buffers absorb the rest.
+    _path: str
+    _handlers: Sequence["AsyncHandlerProtocol"]
+    _buffer: Optional[OverflowBuffer[bytes]]
+    _server: Optional[AbstractServer]
+    _writer: Optional[Task[None]]
+    _connections: dict[Task[None], StreamWriter]
+
+    def __init__(
+        self,
+        path: str,
+        handlers: Sequence["AsyncHandlerProtocol"],
+        buffer_size: int = 10_000,
+    ):
+        if not handlers:
+            raise ValueError("'handlers' cannot be empty")
+
+        if buffer_size <= 0:
+            raise ValueError("'buffer_size' must be greater than zero")
+
+        self._path = path
+        self._handlers = tuple(handlers)
+        self._buffer_size = buffer_size
+        self._buffer, self._server, self._writer = None, None, None
+        self._connections = dict()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def handlers(self):
+        return self._handlers
+
+    @property
+    def running(self):
+        return self._server is not None
+
+    async def start(self):
+        if self._server is not None:
+            return
+
+        # NOTE: A socket left behind by a collector that didn't shut down cleanly would
+        # make binding fail
+        try:
+            if stat.S_ISSOCK(os.stat(self._path).st_mode):
+                os.unlink(self._path)
+        except FileNotFoundError:
+            ...
+
+        self._buffer = OverflowBuffer(
+            max_size=self._buffer_size, policy=OverflowPolicyEnum.BLOCK
+        )
+        self._writer = asyncio.get_running_loop().create_task(self._write_batches())
+        self._server = await asyncio.start_unix_server(
+            self._receive, path=self._path, limit=_READ_SIZE
+        )
+
+    async def serve(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        if self._server is None:
+            return
+
+        server, self._server = self._server, None
+        server.close()
+
+        # NOTE: Shutting down the reading side makes the workers' next sends fail, so
+        # they keep those frames for the next collector, while whatever they already
+        # sent can still be read, up to the end of the stream. Nothing that counted as
+        # sent on their side is lost.
+        for writer in self._connections.values():
+            try:
+                writer.get_extra_info("socket").shutdown(socket.SHUT_RD)
+            except OSError:
+                ...
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+        # NOTE: Writes whatever was received before closing the handlers
+        await self._buffer.join()
+        self._writer.cancel()
+        await asyncio.gather(self._writer, return_exceptions=True)
+        self._writer = None
+
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            ...
+
+        for handler in self._handlers:
+            await handler.close()
+
+    async def _receive(self, reader: StreamReader, writer: StreamWriter):
+        self._connections[task := asyncio.current_task()] = writer
+        decoder = FrameDecoder()
+        try:
+            while data := await reader.read(_READ_SIZE):
+                msg, level = decoder.feed(data)
+                if msg:
+                    await self._buffer.put((msg, level), level)
+        except (ConnectionError, ValueError):
+            # NOTE: A worker that went away, or sent something that isn't a frame
+            ...
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    async def _write_batches(self):
+        buffer = self._buffer
+        while True:
+            batch = [await buffer.get(), *buffer.get_all_nowait()]
+            try:
+                msg = b"".join([msg for msg, _ in batch])
+                level = max([level for _, level in batch])
+                for handler in self._handlers:
+                    try:
+                        await handler.write_and_flush(msg, level)
+                    except Exception:
+                        traceback.print_exc(file=sys.stderr)
+            finally:
+                buffer.task_done(len(batch))
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    # NOTE: Runs a collector that appends everything it receives to a file:
+    #   python -m aiologbuch.handlers.collector.server /run/app.sock /var/log/app.log
+    from aiologbuch.handlers import AsyncFileHandler
+
+    args = sys.argv[1:] if argv is None else list(argv)
+    if len(args) != 2:
+        sys.stderr.write(f"Usage: {sys.argv[0]} <socket path> <log file>\n")
+        return 2
+
+    path, filename = args
+    collector = Collector(
+        path=path, handlers=[AsyncFileHandler(filename=filename, formatter=None)]
+    )
+    try:
+        asyncio.run(collector.serve())
+    except KeyboardInterrupt:
+        ...
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+from threading import Lock as ThreadLock
+from typing import TYPE_CHECKING, Optional
+
+from .manager import resource_manager
+
+if TYPE_CHECKING:
+    from .client import CollectorClient
+
+_open_lock = ThreadLock()
+
+
+class SyncCollectorMixin:
+    _path: str
+    _buffer_size: int
+    _client: Optional["CollectorClient"] = None
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def buffer_size(self):
+        return self._buffer_size
+
+    @property
+    def manager(self):
+        return resource_manager
+
+    @property
+    def stats(self):
+        return None if self._client is None else self._client.stats
+
+    def write_and_flush(self, msg: bytes, level: int):
+        if self._client is None:
+            client = self.manager.open_client(self.path, self.buffer_size)
+            with _open_lock:
+                if self._client is None:
+                    self._client, client = client, None
+            if client is not None:
+                self.manager.close_client(self.path)
+
+        self._client.send(msg, level)
+
+    def close(self):
+        if self._client is not None:
+            self._client = None
+            self.manager.close_client(self.path)
@@ -1,2 +1,3 @@
 from .async_ import AsyncFileMixin  # noqa
+from .rotation import RotationPolicy  # noqa
 from .sync import SyncFileMixin  # noqa
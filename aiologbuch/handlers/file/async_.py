@@ -1,25 +1,48 @@
+from typing import TYPE_CHECKING, Optional
+
 from .manager import resource_manager
 
+if TYPE_CHECKING:
+    from .manager import _StreamResource
+    from .rotation import RotationPolicy
+
 
 class AsyncFileMixin:
     _filename: str
-    should_open_stream = True
+    _resource: Optional["_StreamResource"] = None
+    _rotation: Optional["RotationPolicy"] = None
+    blocking = True
 
     @property
     def filename(self):
         return self._filename
 
+    @property
+    def rotation(self):
+        return self._rotation
+
     @property
     def manager(self):
         return resource_manager
 
-    async def write_and_flush(self, msg: bytes):
-        if self.should_open_stream:
-            await self.manager.aopen_stream(filename=self.filename)
-            self.should_open_stream = False
+    @property
+    def should_open_stream(self):
+        return self._resource is None
+
+    async def write_and_flush(self, msg: bytes, level: int):
+        if self._resource is None:
+            resource = await self.manager.aopen_stream(
+                filename=self.filename, rotation=self.rotation
+            )
+            # NOTE: Concurrent first writes all open the stream, but the handler only
+            # holds one reference to it, otherwise 'close' would never release it
+            if self._resource is None:
+                self._resource = resource
+            else:
+                await self.manager.aclose_stream(filename=self.filename)
 
-        await self.manager.asend_message(filename=self.filename, msg=msg)
+        await self._resource.asend(msg=msg)
 
     async def close(self):
         await self.manager.aclose_stream(filename=self.filename)
-        self.should_open_stream = True
+        self._resource = None
@@ -1,8 +1,15 @@
-from dataclasses import dataclass
-from io import TextIOWrapper
+import os
+from asyncio import Future, get_running_loop
+from collections import deque
+from dataclasses import dataclass, field
+from io import BufferedWriter
+from threading import Event, Thread
 from typing import TYPE_CHECKING, Optional, Union, cast, overload
 
 from anyio.streams.file import FileWriteStream
+from anyio.to_thread import run_sync
+
+from aiologbuch.shared.conf import settings
 
 try:
     from aiofile import async_open as aopen
@@ -33,6 +40,7 @@ def get_stream_backend(name: "StreamBackendType"):
     backends = {
         "thread": _ThreadBackend,
         "aiofile": _AIOFileBackend,
+        "writer": _WriterThreadBackend,
         "sync": _SyncFileBackend,
     }
 
@@ -85,19 +93,149 @@ class _AIOFileBackend:
             self.stream = None
 
 
+@dataclass
+class _WriterThreadBackend:
+    # NOTE: Owns a thread that does nothing but writing to this file. Messages are
+    # handed over through a deque and written with 'os.writev' to an 'O_APPEND' file
+    # descriptor, so sending doesn't go through the shared worker thread pool. The
+    # caller only waits for the write (and an fsync) when 'durable_writes' is set.
+    filename: str
+    fd: Optional[int] = None
+    _thread: Optional[Thread] = None
+    _queue: deque[tuple[bytes, Optional[Future[None]]]] = field(default_factory=deque)
+    _wakeup: Event = field(default_factory=Event)
+    _closing: bool = False
+    _error: Optional[OSError] = None
+
+    async def open(self):
+        if self.fd is None:
+            flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+            self.fd = os.open(self.filename, flags, 0o644)
+            self._closing, self._error = False, None
+            self._thread = Thread(
+                target=self._run, name=f"aiologbuch-writer:{self.filename}", daemon=True
+            )
+            self._thread.start()
+
+    async def send(self, msg: bytes):
+        if self.fd is None:
+            raise RuntimeError(f"{self.filename!r}'s stream was not initialized")
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+        if settings.DURABLE_WRITES:
+            waiter = get_running_loop().create_future()
+            self._queue.append((msg, waiter))
+            self._wakeup.set()
+            await waiter
+        else:
+            self._queue.append((msg, None))
+            self._wakeup.set()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._queue:
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), _IOV_MAX))
+                ]
+                self._write_batch(batch)
+
+            if self._closing and not self._queue:
+                return
+
+    def _write_batch(self, batch: list[tuple[bytes, Optional[Future[None]]]]):
+        error = None
+        try:
+            _write_all(self.fd, [msg for msg, _ in batch])
+            if any(waiter for _, waiter in batch):
+                _datasync(self.fd)
+        except OSError as exc:
+            error = exc
+
+        waiters = [waiter for _, waiter in batch if waiter is not None]
+        if error is not None and not waiters:
+            # NOTE: Nobody is waiting on this write, so the error is raised on the next
+            # send instead
+            self._error = error
+
+        for waiter in waiters:
+            try:
+                waiter.get_loop().call_soon_threadsafe(_resolve, waiter, error)
+            except RuntimeError:
+                # NOTE: The waiter's loop is closed
+                ...
+
+    async def close(self):
+        if self.fd is not None:
+            self._closing = True
+            self._wakeup.set()
+            if self._thread is not None:
+                await run_sync(self._thread.join)
+
+            os.close(self.fd)
+            self.fd, self._thread = None, None
+
+
+def _resolve(waiter: Future[None], error: Optional[OSError]):
+    if waiter.done():
+        return
+    if error is not None:
+        waiter.set_exception(error)
+    else:
+        waiter.set_result(None)
+
+
+def _write_all(fd: int, buffers: list[bytes]):
+    if not hasattr(os, "writev"):
+        data = memoryview(b"".join(buffers))
+        while data:
+            data = data[os.write(fd, data) :]
+        return
+
+    views = [memoryview(buffer) for buffer in buffers]
+    while views:
+        written = os.writev(fd, views)
+        # NOTE: Drops what was fully written and retries the rest, should the kernel
+        # accept only part of it
+        index = 0
+        while index < len(views) and written >= len(views[index]):
+            written -= len(views[index])
+            index += 1
+        views = views[index:]
+        if written:
+            views[0] = views[0][written:]
+
+
+def _datasync(fd: int):
+    getattr(os, "fdatasync", os.fsync)(fd)
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
 @dataclass
 class _SyncFileBackend:
     filename: str
-    stream: Optional[TextIOWrapper] = None
+    stream: Optional[BufferedWriter] = None
 
     def open(self):
         if not self.stream:
-            self.stream = open(file=self.filename, mode="ab", encoding="utf-8")
+            self.stream = open(file=self.filename, mode="ab")
 
     def send(self, msg: bytes):
         if not self.stream:
             raise RuntimeError(f"{self.filename!r}'s stream was not initialized")
         self.stream.write(msg)
+        self.stream.flush()
 
     def close(self):
         if self.stream:
@@ -1,12 +1,25 @@
-from asyncio import Lock
+from asyncio import Event, Lock, Task, get_running_loop, shield, sleep
+from collections import deque
 from threading import Lock as ThreadLock
-from typing import TYPE_CHECKING, Union, cast
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional, Union, cast
+
+from anyio.to_thread import run_sync
 
 from aiologbuch.shared.conf import settings
 from aiologbuch.shared.enums import IOModeEnum
+from aiologbuch.shared.locks import HybridLock
+from aiologbuch.shared.metrics import LockMetrics, get_lock_metrics
 from aiologbuch.shared.utils import sync_lock_context
 
 from .backends import get_stream_backend
+from .rotation import (
+    RotationPolicy,
+    _Segment,
+    detach_segment,
+    pending_segments,
+    rotation_worker,
+)
 
 if TYPE_CHECKING:
     from aiologbuch.shared.types import (
@@ -18,11 +31,11 @@ if TYPE_CHECKING:
 
 
 class _ResourceManager:
-    _lock: Lock
+    _lock: HybridLock
     _resources: dict[str, "_StreamResource"]
 
     def __init__(self):
-        self._lock = Lock()
+        self._lock = HybridLock()
         self._resources = dict()
 
     @property
@@ -37,46 +50,64 @@ class _ResourceManager:
         if resource.mode != mode:
             raise
 
-    async def aopen_stream(self, filename: str):
+    def ensure_same_rotation(
+        self, resource: "_StreamResource", rotation: Optional[RotationPolicy]
+    ):
+        if resource.rotation != rotation:
+            raise ValueError(
+                f"{resource.filename!r} is already open with a different rotation"
+            )
+
+    async def aopen_stream(
+        self, filename: str, rotation: Optional[RotationPolicy] = None
+    ):
         async with self.lock:
             if (resource := self.resources.get(filename)) is None:
-                resource = _StreamResource(filename=filename, mode=IOModeEnum.ASYNC)
+                resource = _StreamResource(
+                    filename=filename, mode=IOModeEnum.ASYNC, rotation=rotation
+                )
                 self.resources[filename] = resource
 
             self.ensure_correct_mode(resource=resource, mode=IOModeEnum.ASYNC)
+            self.ensure_same_rotation(resource=resource, rotation=rotation)
 
             resource.reference_count += 1
 
         await resource.aopen()
+        return resource
 
-    def open_stream(self, filename: str):
+    def open_stream(self, filename: str, rotation: Optional[RotationPolicy] = None):
         with sync_lock_context(lock=self.lock):
             if (resource := self.resources.get(filename)) is None:
-                resource = _StreamResource(filename=filename, mode=IOModeEnum.SYNC)
+                resource = _StreamResource(
+                    filename=filename, mode=IOModeEnum.SYNC, rotation=rotation
+                )
                 self.resources[filename] = resource
 
             self.ensure_correct_mode(resource=resource, mode=IOModeEnum.SYNC)
+            self.ensure_same_rotation(resource=resource, rotation=rotation)
 
             resource.reference_count += 1
 
         resource.open()
+        return resource
 
+    # NOTE: The lock is only needed to open and close streams. Reading the registry is
+    # safe without it, since a single dict lookup can't observe a half made change.
+    # The handlers don't even go through these, they keep a reference to the resource
+    # returned by 'aopen_stream'/'open_stream' instead.
     async def asend_message(self, filename: str, msg: bytes):
-        async with self.lock:
-            if (resource := self.resources.get(filename)) is None:
-                raise RuntimeError(f"{filename!r}'s stream was not initialized")
-
-            self.ensure_correct_mode(resource=resource, mode=IOModeEnum.ASYNC)
+        if (resource := self.resources.get(filename)) is None:
+            raise RuntimeError(f"{filename!r}'s stream was not initialized")
 
+        self.ensure_correct_mode(resource=resource, mode=IOModeEnum.ASYNC)
         await resource.asend(msg=msg)
 
     def send_message(self, filename: str, msg: bytes):
-        with sync_lock_context(lock=self.lock):
-            if (resource := self.resources.get(filename)) is None:
-                raise RuntimeError(f"{filename!r}'s stream was not initialized")
-
-            self.ensure_correct_mode(resource=resource, mode=IOModeEnum.SYNC)
+        if (resource := self.resources.get(filename)) is None:
+            raise RuntimeError(f"{filename!r}'s stream was not initialized")
 
+        self.ensure_correct_mode(resource=resource, mode=IOModeEnum.SYNC)
         resource.send(msg=msg)
 
     async def aclose_stream(self, filename: str):
@@ -112,11 +143,34 @@ class _ResourceManager:
             stream.close()
 
 
+class _WriteBatch:
+    __slots__ = ("messages", "size", "done", "error")
+
+    def __init__(self):
+        self.messages: list[bytes] = []
+        self.size = 0
+        self.done = Event()
+        self.error: Optional[BaseException] = None
+
+    def add(self, msg: bytes):
+        self.messages.append(msg)
+        self.size += len(msg)
+
+
 class _StreamResource:
     _filename: str
     _lock: Union[Lock, ThreadLock]
     _stream: Union["AsyncStreamProtocol", "SyncStreamProtocol"]
 
+    _batches: deque[_WriteBatch]
+    _flushing: bool
+    _flush_task: Optional[Task[None]]
+    _pending: list[bytes]
+    _pending_lock: ThreadLock
+    _rotation: Optional[RotationPolicy]
+    _segment: Optional[_Segment]
+    _lock_metrics: LockMetrics
+
     reference_count: int
     mode: "IOMode"
 
@@ -128,15 +182,21 @@ class _StreamResource:
         backend = get_stream_backend(cast("SyncStreamBackendType", IOModeEnum.SYNC))
         return backend(filename=self.filename)
 
-    def __init__(self, filename: str, mode: "IOMode"):
+    def __init__(
+        self, filename: str, mode: "IOMode", rotation: Optional[RotationPolicy] = None
+    ):
         self._filename = filename
+        self._rotation, self._segment = rotation, None
+        self._lock_metrics = get_lock_metrics(f"file:{filename}")
 
         if mode == IOModeEnum.ASYNC:
             self._lock = Lock()
             self._stream = self._async_stream()
+            self._batches, self._flushing, self._flush_task = deque(), False, None
         else:
             self._lock = ThreadLock()
             self._stream = self._sync_stream()
+            self._pending, self._pending_lock = [], ThreadLock()
 
         self.reference_count = 0
         self.mode = mode
@@ -153,12 +213,18 @@ class _StreamResource:
     def stream(self):
         return self._stream
 
+    @property
+    def rotation(self):
+        return self._rotation
+
     async def aopen(self):
         if self.mode != IOModeEnum.ASYNC:
             raise
 
         async with self.lock:
             await self.stream.open()
+            # NOTE: Looking for leftover segments lists the whole directory
+            await run_sync(self._start_segment)
 
     def open(self):
         if self.mode != IOModeEnum.SYNC:
@@ -166,27 +232,155 @@ class _StreamResource:
 
         with self.lock:
             self.stream.open()
+            self._start_segment()
+
+    def _start_segment(self):
+        if self._rotation is None or self._segment is not None:
+            return
+
+        self._segment = _Segment(filename=self.filename, policy=self._rotation)
+        for segment in pending_segments(self.filename):
+            rotation_worker.submit(segment, self.filename, self._rotation)
+
+    def _should_rotate(self, size: int):
+        return self._segment is not None and self._segment.should_rotate(size)
+
+    def _detach_segment(self):
+        # NOTE: Called with the stream closed, so everything sent so far is already in
+        # the detached segment. The segment is archived by the rotation worker.
+        segment = detach_segment(self.filename)
+        self._segment = _Segment(filename=self.filename, policy=self._rotation)
+        if segment is not None:
+            rotation_worker.submit(segment, self.filename, self._rotation)
+
+    async def _arotate(self):
+        # NOTE: Runs with the lock held. The messages that arrive meanwhile keep piling
+        # up in the batches and are written to the new file right after.
+        await self.stream.close()
+        try:
+            self._detach_segment()
+        finally:
+            await self.stream.open()
+
+    def _rotate(self):
+        self.stream.close()
+        try:
+            self._detach_segment()
+        finally:
+            self.stream.open()
+
+    def _add_to_batch(self, msg: bytes):
+        # NOTE: Messages are appended to the newest batch that is still waiting to be
+        # written, unless doing so would make it go over the configured size.
+        if (not self._batches) or (
+            self._batches[-1].size + len(msg) > settings.BATCH_MAX_BYTES
+            and self._batches[-1].messages
+        ):
+            self._batches.append(_WriteBatch())
+
+        batch = self._batches[-1]
+        batch.add(msg)
+        return batch
 
     async def asend(self, msg: bytes):
         if self.mode != IOModeEnum.ASYNC:
             raise
 
-        async with self.lock:
-            await self.stream.send(msg)
+        batch = self._add_to_batch(msg)
+
+        if self._flushing:
+            await batch.done.wait()
+        else:
+            # NOTE: The flush writes the messages of every coroutine that queued one
+            # meanwhile, so it runs in a task of its own. A writer that gets cancelled
+            # (e.g. by a timeout) only stops waiting for it.
+            self._flushing = True
+            self._flush_task = get_running_loop().create_task(self._flush(until=batch))
+            await shield(self._flush_task)
+
+        if batch.error is not None:
+            raise batch.error
+
+    async def _flush(self, until: Optional[_WriteBatch] = None):
+        # NOTE: The first coroutine that finds no write in flight becomes the writer.
+        # Every message that arrives in the meantime is coalesced into the following
+        # batches, which are sent with a single backend call each. Once the writer's
+        # own batch is out, the remaining ones are handed over to a new task, so a
+        # single caller doesn't end up paying for everybody else's writes.
+        current = None
+        try:
+            if settings.BATCH_LINGER > 0:
+                await sleep(settings.BATCH_LINGER)
+
+            waits, start = self.lock.locked(), perf_counter()
+            async with self.lock:
+                if waits:
+                    self._lock_metrics.waited(perf_counter() - start)
+
+                while self._batches:
+                    current = self._batches.popleft()
+                    try:
+                        if self._should_rotate(current.size):
+                            await self._arotate()
+                        await self.stream.send(b"".join(current.messages))
+                        if self._segment is not None:
+                            self._segment.written(current.size)
+                    except Exception as exc:
+                        current.error = exc
+                    current.done.set()
+
+                    if (current is until) and self._batches:
+                        self._flush_task = get_running_loop().create_task(self._flush())
+                        return
+
+            self._flushing, self._flush_task = False, None
+        except BaseException:
+            interrupted = [current] if current and not current.done.is_set() else []
+            interrupted.extend(self._batches)
+            self._batches.clear()
+
+            for batch in interrupted:
+                batch.error = RuntimeError(f"{self.filename!r}'s write was interrupted")
+                batch.done.set()
+
+            self._flushing, self._flush_task = False, None
+            raise
 
     def send(self, msg: bytes):
         if self.mode != IOModeEnum.SYNC:
             raise
 
+        with self._pending_lock:
+            self._pending.append(msg)
+
+        # NOTE: Whichever thread gets the lock first writes everything that is pending
+        # at that point, including the messages of the threads waiting for the lock.
+        waits, start = self.lock.locked(), perf_counter()
         with self.lock:
-            self.stream.send(msg)
+            if waits:
+                self._lock_metrics.waited(perf_counter() - start)
+
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+
+            for chunk in _split_in_chunks(pending, settings.BATCH_MAX_BYTES):
+                data = b"".join(chunk)
+                if self._should_rotate(len(data)):
+                    self._rotate()
+                self.stream.send(data)
+                if self._segment is not None:
+                    self._segment.written(len(data))
 
     async def aclose(self):
         if self.mode != IOModeEnum.ASYNC:
             raise
 
+        while (task := self._flush_task) is not None:
+            await task
+
         async with self.lock:
             await self.stream.close()
+            self._segment = None
 
     def close(self):
         if self.mode != IOModeEnum.SYNC:
@@ -194,6 +388,22 @@ class _StreamResource:
 
         with self.lock:
             self.stream.close()
+            self._segment = None
+
+
+def _split_in_chunks(messages: list[bytes], max_bytes: int):
+    chunk: list[bytes] = []
+    size = 0
+
+    for msg in messages:
+        if chunk and size + len(msg) > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(msg)
+        size += len(msg)
+
+    if chunk:
+        yield chunk
 
 
 resource_manager = _ResourceManager()
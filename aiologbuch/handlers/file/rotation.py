@@ -0,0 +1,204 @@
+import atexit
+import gzip
+import os
+import shutil
+import traceback
+from dataclasses import dataclass
+from itertools import count
+from queue import Queue
+from threading import Lock as ThreadLock
+from threading import Thread
+from time import time
+from typing import Optional
+
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.utils import sync_lock_context
+
+_SEGMENT_SUFFIX = ".rotating"
+_segment_ids = count()
+
+
+@dataclass(frozen=True)
+class RotationPolicy:
+    max_bytes: int = 0
+    interval: float = 0.0
+    backup_count: int = 5
+    compress: bool = True
+
+    def __post_init__(self):
+        if self.max_bytes < 0 or self.interval < 0:
+            raise ValueError("'max_bytes' and 'interval' can not be negative")
+
+        if not (self.max_bytes or self.interval):
+            raise ValueError("Either 'max_bytes' or 'interval' must be set")
+
+        if self.backup_count < 0:
+            raise ValueError("'backup_count' can not be negative")
+
+    def backup_name(self, filename: str, index: int):
+        return f"{filename}.{index}.gz" if self.compress else f"{filename}.{index}"
+
+
+class _Segment:
+    # NOTE: Keeps track of the file that is currently being written, to tell when it
+    # has to be rotated. Sizes are counted as the messages are sent, so the file is
+    # only stat'ed when it's opened.
+    __slots__ = ("policy", "size", "rollover_at")
+
+    def __init__(self, filename: str, policy: RotationPolicy):
+        self.policy = policy
+
+        try:
+            stat = os.stat(filename)
+            self.size, started_at = stat.st_size, stat.st_mtime
+        except FileNotFoundError:
+            self.size, started_at = 0, time()
+
+        self.rollover_at = started_at + policy.interval
+
+    def should_rotate(self, size: int):
+        policy = self.policy
+        if policy.max_bytes and self.size and (self.size + size > policy.max_bytes):
+            return True
+        return bool(policy.interval) and time() >= self.rollover_at
+
+    def written(self, size: int):
+        self.size += size
+
+
+def detach_segment(filename: str):
+    # NOTE: Moves the live file out of the way, so it can be reopened straight away.
+    # Its new name is unique, so it doesn't clash with the segments that are still
+    # waiting to be archived.
+    name = f"{filename}.{os.getpid()}-{next(_segment_ids)}{_SEGMENT_SUFFIX}"
+    segment = os.path.abspath(name)
+    try:
+        os.replace(filename, segment)
+    except FileNotFoundError:
+        return None
+    return segment
+
+
+def pending_segments(filename: str):
+    # NOTE: Segments left behind by a process that stopped before archiving them. The
+    # ones of a process that is still running are on their way to its own worker.
+    directory, prefix = os.path.split(os.path.abspath(filename))
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+
+    return sorted(
+        (
+            os.path.join(directory, name)
+            for name in names
+            if name.startswith(prefix + ".")
+            and name.endswith(_SEGMENT_SUFFIX)
+            and _is_orphaned(name[len(prefix) + 1 : -len(_SEGMENT_SUFFIX)])
+        ),
+        key=_modified_at,
+    )
+
+
+def _is_orphaned(segment_id: str):
+    # NOTE: Segments are named '<filename>.<pid>-<n>.rotating' by 'detach_segment'
+    pid, _, _ = segment_id.partition("-")
+    if not pid.isdigit() or int(pid) == os.getpid():
+        return False
+
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        # NOTE: The process is still running, as another user
+        pass
+    return False
+
+
+def _modified_at(path: str):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def archive_segment(segment: str, filename: str, policy: RotationPolicy):
+    if not os.path.exists(segment):
+        return
+
+    if policy.backup_count == 0:
+        os.remove(segment)
+        return
+
+    # NOTE: The oldest backup is overwritten by the one before it
+    for index in range(policy.backup_count - 1, 0, -1):
+        source = policy.backup_name(filename, index)
+        if os.path.exists(source):
+            os.replace(source, policy.backup_name(filename, index + 1))
+
+    target = policy.backup_name(filename, 1)
+    if not policy.compress:
+        os.replace(segment, target)
+        return
+
+    # NOTE: The backup only shows up under its name once it was fully written
+    partial = target + ".partial"
+    with open(segment, "rb") as source, gzip.open(partial, "wb") as destination:
+        shutil.copyfileobj(source, destination, length=1024 * 1024)
+    os.replace(partial, target)
+    os.remove(segment)
+
+
+class _RotationWorker:
+    # NOTE: A single thread archives the detached segments, one after the other, so
+    # shifting the backups around and compressing them never happens on the writers'
+    # side, and two rotations of the same file never race each other.
+    _jobs: Queue[tuple[str, str, RotationPolicy]]
+    _queued: set[str]
+    _thread: Optional[Thread]
+
+    def __init__(self):
+        self._jobs = Queue()
+        self._queued = set()
+        self._thread = None
+        self._lock = ThreadLock()
+
+    def submit(self, segment: str, filename: str, policy: RotationPolicy):
+        with self._lock:
+            # NOTE: Leftover segments are picked up whenever a file is opened, which
+            # could find the ones that are already on their way
+            if segment in self._queued:
+                return
+            self._queued.add(segment)
+            self._jobs.put((segment, filename, policy))
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(
+                    target=self._run, name="aiologbuch-rotation", daemon=True
+                )
+                self._thread.start()
+
+    def join(self):
+        self._jobs.join()
+
+    def _run(self):
+        while True:
+            segment, filename, policy = self._jobs.get()
+            try:
+                archive_segment(segment=segment, filename=filename, policy=policy)
+            except OSError:
+                if settings.RAISE_EXCEPTIONS:
+                    with sync_lock_context(lock=settings.GLOBAL_STDERR_LOCK):
+                        traceback.print_exc()
+            finally:
+                with self._lock:
+                    self._queued.discard(segment)
+                self._jobs.task_done()
+
+
+rotation_worker = _RotationWorker()
+
+# NOTE: The worker is a daemon thread, so the segments that are still pending when the
+# interpreter exits are archived before it goes away
+atexit.register(rotation_worker.join)
@@ -1,25 +1,51 @@
+from threading import Lock as ThreadLock
+from typing import TYPE_CHECKING, Optional
+
 from .manager import resource_manager
 
+if TYPE_CHECKING:
+    from .manager import _StreamResource
+    from .rotation import RotationPolicy
+
+_open_lock = ThreadLock()
+
 
 class SyncFileMixin:
     _filename: str
-    should_open_stream = True
+    _resource: Optional["_StreamResource"] = None
+    _rotation: Optional["RotationPolicy"] = None
 
     @property
     def filename(self):
         return self._filename
 
+    @property
+    def rotation(self):
+        return self._rotation
+
     @property
     def manager(self):
         return resource_manager
 
-    def write_and_flush(self, msg: bytes):
-        if self.should_open_stream:
-            self.manager.open_stream(filename=self.filename)
-            self.should_open_stream = False
+    @property
+    def should_open_stream(self):
+        return self._resource is None
+
+    def write_and_flush(self, msg: bytes, level: int):
+        if self._resource is None:
+            resource = self.manager.open_stream(
+                filename=self.filename, rotation=self.rotation
+            )
+            # NOTE: Concurrent first writes all open the stream, but the handler only
+            # holds one reference to it, otherwise 'close' would never release it
+            with _open_lock:
+                if self._resource is None:
+                    self._resource, resource = resource, None
+            if resource is not None:
+                self.manager.close_stream(filename=self.filename)
 
-        self.manager.send_message(filename=self.filename, msg=msg)
+        self._resource.send(msg=msg)
 
     def close(self):
         self.manager.close_stream(filename=self.filename)
-        self.should_open_stream = True
+        self._resource = None
@@ -0,0 +1,4 @@
+from .async_ import AsyncRingMixin  # noqa
+from .buffer import DEFAULT_RING_SIZE, RingBuffer  # noqa
+from .reader import read_records  # noqa
+from .sync import SyncRingMixin  # noqa
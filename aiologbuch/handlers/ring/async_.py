@@ -0,0 +1,69 @@
+from asyncio import Task, get_running_loop, shield
+from typing import TYPE_CHECKING, Optional
+
+from anyio.to_thread import run_sync
+
+from .manager import resource_manager
+
+if TYPE_CHECKING:
+    from .buffer import RingBuffer
+
+
+class AsyncRingMixin:
+    _filename: str
+    _size: int
+    _ring: Optional["RingBuffer"] = None
+    _opening: Optional[Task["RingBuffer"]] = None
+    # NOTE: Writing is a copy into memory, so there's nothing worth running concurrently
+    blocking = False
+
+    @property
+    def filename(self):
+        return self._filename
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def manager(self):
+        return resource_manager
+
+    async def write_and_flush(self, msg: bytes, level: int):
+        if self._ring is None:
+            await self._open()
+
+        self._ring.write(msg)
+
+    async def _open(self):
+        # NOTE: Opening an existing ring scans it to resume writing after its newest
+        # record, so it's done off the event loop. The first writes share the same
+        # task, which wakes them up in the order they came in.
+        if self._opening is None:
+            self._opening = get_running_loop().create_task(
+                run_sync(self.manager.open_ring, self.filename, self.size)
+            )
+
+        opening = self._opening
+        try:
+            ring = await shield(opening)
+        except Exception:
+            if self._opening is opening:
+                self._opening = None
+            raise
+
+        if self._ring is None:
+            self._ring = ring
+
+    async def close(self):
+        opening, self._opening = self._opening, None
+        if opening is not None and self._ring is None:
+            # NOTE: The ring might have been opened without any write getting to it
+            try:
+                self._ring = await shield(opening)
+            except Exception:
+                ...
+
+        if self._ring is not None:
+            self._ring = None
+            await run_sync(self.manager.close_ring, self.filename)
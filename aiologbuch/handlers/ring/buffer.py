@@ -0,0 +1,189 @@
+import mmap
+import os
+from struct import Struct
+from threading import Lock as ThreadLock
+from typing import Iterator, Optional, Union
+from zlib import crc32
+
+# NOTE: The file starts with a header that identifies it and tells the size of the
+# data area that follows. Records are stored in the data area as frames:
+#   magic (4) | length (4) | sequence (8) | crc (4) | payload (length)
+# The crc covers the length, the sequence and the payload, so a frame that was torn
+# by a crash or partially overwritten by a newer one is always told apart.
+FILE_MAGIC = b"ALBRING\x01"
+FRAME_MAGIC = 0x4C425246
+HEADER_SIZE = 64
+DEFAULT_RING_SIZE = 16 * 1024 * 1024
+
+_FILE_HEADER = Struct("<8sQ")
+_FRAME_HEADER = Struct("<IIQI")
+_FRAME_PREFIX = Struct("<IQ")
+_FRAME_MAGIC = Struct("<I")
+_FRAME_MAGIC_BYTES = _FRAME_MAGIC.pack(FRAME_MAGIC)
+
+type _Buffer = Union[mmap.mmap, bytes]
+
+
+def _checksum(length: int, sequence: int, payload: Union[bytes, memoryview]):
+    return crc32(payload, crc32(_FRAME_PREFIX.pack(length, sequence)))
+
+
+def scan_frames(data: _Buffer, capacity: int) -> Iterator[tuple[int, int, int]]:
+    # NOTE: Yields the (sequence, offset, length) of every valid frame in the data
+    # area, in the order they are laid out. Candidates are found by looking for the
+    # frame magic, and anything that doesn't check out is skipped.
+    view = memoryview(data)
+    find = data.find
+    position = HEADER_SIZE
+    end = HEADER_SIZE + capacity
+
+    while (position := find(_FRAME_MAGIC_BYTES, position, end)) != -1:
+        start = position + _FRAME_HEADER.size
+        if start > end:
+            return
+
+        _, length, sequence, checksum = _FRAME_HEADER.unpack_from(data, position)
+        if start + length <= end:
+            payload = view[start : start + length]
+            if _checksum(length, sequence, payload) == checksum:
+                yield sequence, start, length
+                position = start + length
+                continue
+
+        position += 1
+
+
+def read_header(data: _Buffer):
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Not a ring buffer file: it's too short")
+
+    magic, capacity = _FILE_HEADER.unpack_from(data, 0)
+    if magic != FILE_MAGIC:
+        raise ValueError("Not a ring buffer file: bad magic")
+
+    if HEADER_SIZE + capacity > len(data):
+        raise ValueError("The ring buffer file is truncated")
+
+    return capacity
+
+
+class RingBuffer:
+    # NOTE: A fixed size file, memory mapped and used as a circular buffer. Writing a
+    # record is just copying it into the mapping, so there's no system call involved.
+    # The kernel writes the pages back on its own, which means that the records survive
+    # the process crashing, but not the machine going down, unless 'flush' is called.
+    _filename: str
+    _capacity: int
+    _mmap: Optional[mmap.mmap]
+    _position: int
+    _sequence: int
+    _lock: ThreadLock
+
+    def __init__(self, filename: str, size: int = DEFAULT_RING_SIZE):
+        if size <= _FRAME_HEADER.size:
+            raise ValueError(f"'size' must be greater than {_FRAME_HEADER.size}")
+
+        self._filename = filename
+        self._capacity = size
+        self._mmap = None
+        self._position, self._sequence = HEADER_SIZE, 0
+        self._lock = ThreadLock()
+
+    @property
+    def filename(self):
+        return self._filename
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def is_open(self):
+        return self._mmap is not None
+
+    def open(self):
+        with self._lock:
+            if self._mmap is not None:
+                return
+
+            fd = os.open(self._filename, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                length = HEADER_SIZE + self._capacity
+                existing = os.fstat(fd).st_size
+                if existing == 0:
+                    os.ftruncate(fd, length)
+                self._mmap = mmap.mmap(fd, 0)
+            finally:
+                os.close(fd)
+
+            if existing == 0:
+                _FILE_HEADER.pack_into(self._mmap, 0, FILE_MAGIC, self._capacity)
+            else:
+                self._resume()
+
+    def _resume(self):
+        # NOTE: Writing carries on right after the newest record, with the following
+        # sequence number, so the reader keeps them in order across restarts
+        try:
+            capacity = read_header(self._mmap)
+        except ValueError:
+            self._mmap.close()
+            self._mmap = None
+            raise
+
+        if capacity != self._capacity:
+            self._mmap.close()
+            self._mmap = None
+            raise ValueError(
+                f"{self._filename!r} is a ring of {capacity} bytes, not "
+                f"{self._capacity}. Use the same size or another file"
+            )
+
+        newest = max(scan_frames(self._mmap, capacity), default=None)
+        if newest is not None:
+            sequence, offset, length = newest
+            self._position, self._sequence = offset + length, sequence + 1
+
+    def write(self, msg: bytes):
+        size = _FRAME_HEADER.size + len(msg)
+        if size > self._capacity:
+            raise ValueError(
+                f"The message takes {size} bytes, which doesn't fit in the ring "
+                f"buffer of {self._capacity} bytes"
+            )
+
+        with self._lock:
+            if (buffer := self._mmap) is None:
+                raise RuntimeError(f"{self._filename!r}'s ring was not opened")
+
+            position, end = self._position, HEADER_SIZE + self._capacity
+            if position + size > end:
+                # NOTE: The frames left after the last one of this lap are older than
+                # the ones it overwrote, so they are wiped before wrapping around.
+                # Otherwise the reader would find them and skip the records in between.
+                buffer[position:end] = bytes(end - position)
+                position = HEADER_SIZE
+
+            sequence = self._sequence
+            checksum = _checksum(len(msg), sequence, msg)
+
+            # NOTE: The magic is written last, so a frame that was interrupted halfway
+            # is never taken for a complete one
+            _FRAME_HEADER.pack_into(buffer, position, 0, len(msg), sequence, checksum)
+            start = position + _FRAME_HEADER.size
+            buffer[start : start + len(msg)] = msg
+            _FRAME_MAGIC.pack_into(buffer, position, FRAME_MAGIC)
+
+            self._position, self._sequence = start + len(msg), sequence + 1
+
+    def flush(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+                self._mmap.close()
+                self._mmap = None
@@ -0,0 +1,49 @@
+from threading import Lock as ThreadLock
+
+from .buffer import RingBuffer
+
+
+class _ResourceManager:
+    # NOTE: Rings are shared by the handlers that point to the same file, async and
+    # sync alike, since writing to one never waits on anything but a thread lock
+    _lock: ThreadLock
+    _resources: dict[str, RingBuffer]
+    _references: dict[str, int]
+
+    def __init__(self):
+        self._lock = ThreadLock()
+        self._resources = dict()
+        self._references = dict()
+
+    @property
+    def resources(self):
+        return self._resources
+
+    def open_ring(self, filename: str, size: int):
+        with self._lock:
+            if (ring := self._resources.get(filename)) is None:
+                ring = RingBuffer(filename=filename, size=size)
+                ring.open()
+                self._resources[filename] = ring
+                self._references[filename] = 0
+
+            if ring.capacity != size:
+                raise ValueError(f"{filename!r} is already open with another size")
+
+            self._references[filename] += 1
+            return ring
+
+    def close_ring(self, filename: str):
+        with self._lock:
+            if (ring := self._resources.get(filename)) is None:
+                return
+
+            self._references[filename] -= 1
+            if self._references[filename] > 0:
+                return
+
+            del self._resources[filename], self._references[filename]
+            ring.close()
+
+
+resource_manager = _ResourceManager()
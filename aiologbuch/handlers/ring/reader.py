@@ -0,0 +1,32 @@
+import sys
+from typing import Optional
+
+from .buffer import read_header, scan_frames
+
+
+def read_records(filename: str) -> list[bytes]:
+    # NOTE: Returns every record that is still intact in the ring, oldest first. It
+    # works on a file that is being written or that was left behind by a crash, since
+    # the frames are validated one by one and ordered by their sequence numbers.
+    with open(filename, "rb") as file:
+        data = file.read()
+
+    capacity = read_header(data)
+    frames = sorted(scan_frames(data, capacity))
+    return [data[start : start + length] for _, start, length in frames]
+
+
+def main(argv: Optional[list[str]] = None):
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        sys.stderr.write("usage: python -m aiologbuch.handlers.ring.reader <file>\n")
+        return 2
+
+    for record in read_records(args[0]):
+        sys.stdout.buffer.write(record)
+    sys.stdout.buffer.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
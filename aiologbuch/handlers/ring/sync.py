@@ -0,0 +1,43 @@
+from threading import Lock as ThreadLock
+from typing import TYPE_CHECKING, Optional
+
+from .manager import resource_manager
+
+if TYPE_CHECKING:
+    from .buffer import RingBuffer
+
+_open_lock = ThreadLock()
+
+
+class SyncRingMixin:
+    _filename: str
+    _size: int
+    _ring: Optional["RingBuffer"] = None
+
+    @property
+    def filename(self):
+        return self._filename
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def manager(self):
+        return resource_manager
+
+    def write_and_flush(self, msg: bytes, level: int):
+        if self._ring is None:
+            ring = self.manager.open_ring(filename=self.filename, size=self.size)
+            with _open_lock:
+                if self._ring is None:
+                    self._ring, ring = ring, None
+            if ring is not None:
+                self.manager.close_ring(filename=self.filename)
+
+        self._ring.write(msg)
+
+    def close(self):
+        if self._ring is not None:
+            self._ring = None
+            self.manager.close_ring(filename=self.filename)
@@ -6,12 +6,14 @@ from .manager import resource_manager
 
 
 class AsyncStderrMixin:
+    blocking = False
+
     @property
     def manager(self):
         return resource_manager
 
-    async def write_and_flush(self, msg: bytes):
-        await self.manager.asend_message(msg)
+    async def write_and_flush(self, msg: bytes, level: int):
+        await self.manager.asend_message(msg, level)
 
     async def close(self):
         atexit.register(syncify(self.manager.aclose))
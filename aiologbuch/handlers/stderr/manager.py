@@ -1,15 +1,49 @@
 import sys
-from asyncio import StreamWriter, get_running_loop, sleep
+from asyncio import Future, StreamWriter, get_running_loop, sleep
 from asyncio.protocols import Protocol
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from threading import Lock as ThreadLock
 from typing import Optional, TextIO
 
+from aiologbuch.shared.buffers import OverflowBuffer
 from aiologbuch.shared.conf import settings
+from aiologbuch.shared.locks import HybridLock
 from aiologbuch.shared.utils import sync_lock_context
 
 
 class _AIOProto(Protocol):
-    async def _drain_helper(self): ...
+    # NOTE: The pipe transport calls 'pause_writing' once its buffer goes over the
+    # high-water mark, and 'resume_writing' once it's back under the low-water mark.
+    _paused = False
+    _resumed: Optional[Future[None]] = None
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        self._wake_up()
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._paused = False
+        self._wake_up()
+
+    def _wake_up(self):
+        if (self._resumed is not None) and (not self._resumed.done()):
+            self._resumed.set_result(None)
+        self._resumed = None
+
+    async def _drain_helper(self):
+        if not self._paused:
+            return
+
+        if self._resumed is None:
+            self._resumed = get_running_loop().create_future()
+        await self._resumed
 
     async def _get_close_waiter(self, transport: StreamWriter):
         while transport.transport._pipe is not None:
@@ -20,39 +54,130 @@ class _AIOProto(Protocol):
 class _ResourceManager:
     stream: TextIO
     _writer: Optional[StreamWriter] = None
+    _protocol: Optional[_AIOProto] = None
+    _buffer: Optional[OverflowBuffer[bytes]] = None
+    _pending: list[bytes] = field(default_factory=list)
+    _pending_lock: ThreadLock = field(default_factory=ThreadLock)
+    _connect_lock: HybridLock = field(default_factory=HybridLock)
+    _flushing = False
     _closed = False
 
     @property
     def closed(self):
         return self._closed
 
-    async def asend_message(self, msg: bytes):
-        async with settings.GLOBAL_STDERR_LOCK:
+    @property
+    def buffer(self):
+        if self._buffer is None:
+            self._buffer = OverflowBuffer(
+                max_size=settings.STDERR_BUFFER_SIZE,
+                policy=settings.OVERFLOW_POLICY,
+                drop_level=settings.DROP_BELOW_LEVEL,
+            )
+        return self._buffer
+
+    @property
+    def stats(self):
+        return self.buffer.stats
+
+    @property
+    def binary_stream(self):
+        return getattr(self.stream, "buffer", None)
+
+    async def _get_writer(self):
+        if not self._writer:
+            loop = get_running_loop()
+            transport, protocol = await loop.connect_write_pipe(_AIOProto, self.stream)
+            transport.set_write_buffer_limits(
+                high=settings.STDERR_HIGH_WATER, low=settings.STDERR_LOW_WATER
+            )
+            self._writer = StreamWriter(
+                transport=transport, protocol=protocol, reader=None, loop=loop
+            )
+            self._protocol = protocol
+        return self._writer
+
+    async def asend_message(self, msg: bytes, level: int):
+        if self.closed:
+            raise RuntimeError("Writer was closed")
+
+        if (writer := self._writer) is None:
+            async with self._connect_lock:
+                writer = await self._get_writer()
+
+        # NOTE: While the pipe transport is under its high-water mark, the message is
+        # just handed to it, which never suspends the caller. The transport writes what
+        # it can right away and keeps the rest in its own buffer.
+        if (
+            (not self._flushing)
+            and (not self._protocol.paused)
+            and settings.GLOBAL_STDERR_LOCK.try_acquire()
+        ):
+            try:
+                writer.write(msg)
+            finally:
+                settings.GLOBAL_STDERR_LOCK.release()
+            return
+
+        # NOTE: Past the high-water mark, messages go to the overflow buffer instead.
+        # Only the coroutine that finds no flush in progress waits for the transport to
+        # go back under the low-water mark; the others return as soon as their message
+        # is buffered, or is dropped, depending on the overflow policy.
+        await self.buffer.put(msg, level)
+        if self._flushing:
+            return
+
+        self._flushing = True
+        try:
+            async with settings.GLOBAL_STDERR_LOCK:
+                await self._flush()
+        finally:
+            self._flushing = False
+
+    async def _flush(self):
+        while self.buffer.qsize():
             if self.closed:
                 raise RuntimeError("Writer was closed")
 
-            if not self._writer:
-                loop = get_running_loop()
-                transport, protocol = await loop.connect_write_pipe(
-                    _AIOProto, self.stream
-                )
-                self._writer = StreamWriter(
-                    transport=transport, protocol=protocol, reader=None, loop=loop
-                )
-
-            self._writer.write(msg)
-            await self._writer.drain()
+            writer = await self._get_writer()
+            await writer.drain()
+
+            messages = self.buffer.get_all_nowait()
+            try:
+                writer.write(b"".join(messages))
+            finally:
+                self.buffer.task_done(len(messages))
 
     def send_message(self, msg: bytes):
+        with self._pending_lock:
+            self._pending.append(msg)
+
+        # NOTE: Whichever thread gets the lock first writes everything that is pending
+        # at that point, straight to the binary buffer of the stream.
         with sync_lock_context(lock=settings.GLOBAL_STDERR_LOCK):
             if self.closed:
                 raise RuntimeError("Writer was closed")
-            self.stream.write(msg.decode())
-            self.stream.flush()
+
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+
+            if not pending:
+                return
+
+            if (stream := self.binary_stream) is not None:
+                stream.write(b"".join(pending))
+                stream.flush()
+            else:
+                self.stream.write(b"".join(pending).decode())
+                self.stream.flush()
 
     async def aclose(self):
         async with settings.GLOBAL_STDERR_LOCK:
-            if (self.closed) or (not self._writer):
+            if self.closed:
+                return
+
+            await self._flush()
+            if not self._writer:
                 return
 
             self._writer.write(b"Closing stderr...")
@@ -60,7 +185,7 @@ class _ResourceManager:
 
             self._writer.close()
             await self._writer.wait_closed()
-            self._writer, self._closed = None, True
+            self._writer, self._protocol, self._closed = None, None, True
 
     def close(self):
         with sync_lock_context(lock=settings.GLOBAL_STDERR_LOCK):
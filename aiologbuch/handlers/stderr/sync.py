@@ -8,7 +8,7 @@ class SyncStderrMixin:
     def manager(self):
         return resource_manager
 
-    def write_and_flush(self, msg: bytes):
+    def write_and_flush(self, msg: bytes, level: int):
         self.manager.send_message(msg)
 
     def close(self):
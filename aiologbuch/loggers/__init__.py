@@ -1,2 +1,3 @@
 from .async_ import AsyncLogger  # noqa
 from .sync import SyncLogger  # noqa
+from .bound import BoundAsyncLogger, BoundSyncLogger  # noqa
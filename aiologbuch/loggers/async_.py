@@ -1,17 +1,39 @@
 from typing import TYPE_CHECKING, Optional
 
 from anyio import create_task_group
+from anyio.to_thread import run_sync
 
+from aiologbuch.shared.conf import settings
 from aiologbuch.shared.levels import LogLevel
+from aiologbuch.shared.tracebacks import cached_traceback, render_traceback
 from aiologbuch.shared.types import AsyncHandlerProtocol
 
 from .base import BaseLogger
+from .bound import BoundAsyncLogger
 
 if TYPE_CHECKING:
+    from aiologbuch.shared.context import Context
+    from aiologbuch.managers.async_ import AsyncLoggerManager
     from aiologbuch.shared.types import LogRecordProtocol, MessageType
 
 
+async def _noop(_arg=None, msg=None, exc=None):
+    # NOTE: Awaiting an empty coroutine is cheaper than an awaitable whose '__await__'
+    # is written in Python, and it can still be given to 'create_task'
+    return None
+
+
 class AsyncLogger(BaseLogger[AsyncHandlerProtocol]):
+    _queue_manager: Optional["AsyncLoggerManager"] = None
+    _inline_handlers: tuple[AsyncHandlerProtocol, ...] = ()
+    _concurrent_handlers: tuple[AsyncHandlerProtocol, ...] = ()
+    _disabled_method = staticmethod(_noop)
+    _bound_class = BoundAsyncLogger
+
+    @property
+    def queued(self):
+        return self._queue_manager is not None
+
     async def debug(self, msg: "MessageType"):
         if self._filter(level=LogLevel.DEBUG) and self._enabled:
             await self._log(LogLevel.DEBUG, msg)
@@ -37,32 +59,88 @@ class AsyncLogger(BaseLogger[AsyncHandlerProtocol]):
         if self._filter(level=LogLevel.CRITICAL) and self._enabled:
             await self._log(LogLevel.CRITICAL, msg)
 
+    def _enabled_method(self, name: str, level: int):
+        # NOTE: Same frame depth as the methods above, which '_find_caller' relies on
+        log = self._log
+        if name == "exception":
+
+            async def method(exc: BaseException, msg: Optional["MessageType"] = None):
+                await log(level, msg if msg else str(exc), exc_info=exc)
+
+        else:
+
+            async def method(msg: "MessageType"):
+                await log(level, msg)
+
+        return method
+
     async def _log(
         self,
         level: int,
         msg: "MessageType",
         exc_info: Optional[BaseException] = None,
+        context: Optional["Context"] = None,
     ):
-        caller = self._find_caller()
+        filename, function_name, line_number = self._find_caller()
 
         record = self._make_record(
             name=self.name,
             level=level,
             msg=msg,
-            filename=caller.filename,
-            function_name=caller.function_name,
-            line_number=caller.line_number,
+            filename=filename,
+            function_name=function_name,
+            line_number=line_number,
             exc_info=exc_info,
+            context=context,
         )
 
-        await self._handle(record)
+        # NOTE: Tracebacks that weren't rendered before can be rendered in a thread,
+        # instead of by the first formatter that reads 'exc_text', on the event loop
+        if exc_info and self._needs_traceback and settings.TRACEBACK_OFF_LOOP:
+            if (text := cached_traceback(exc_info)) is None:
+                text = await run_sync(render_traceback, exc_info)
+            record.exc_text = text
+
+        if self._queue_manager is not None:
+            await self._queue_manager.enqueue(self, record)
+        else:
+            await self._handle(record)
 
     async def _handle(self, record: "LogRecordProtocol"):
-        async with create_task_group() as tg:
-            [tg.start_soon(handler.handle, record) for handler in self._handlers]
+        # NOTE: Handlers that don't block (e.g. the stderr ones, which only hand the
+        # bytes to the pipe transport) are awaited one after the other, since spawning
+        # a task for them costs more than the write itself. A task group is only
+        # created when more than one handler actually waits on I/O.
+        for handler in self._inline_handlers:
+            await handler.handle(record)
+
+        if self._concurrent_handlers:
+            async with create_task_group() as tg:
+                for handler in self._concurrent_handlers:
+                    tg.start_soon(handler.handle, record)
+
+    def _add_handler(self, handler: AsyncHandlerProtocol):
+        super()._add_handler(handler)
+        self._plan_fanout()
+
+    def _plan_fanout(self):
+        blocking = tuple(h for h in self._handlers if getattr(h, "blocking", True))
+        if len(blocking) > 1:
+            self._concurrent_handlers = blocking
+            self._inline_handlers = tuple(
+                h for h in self._handlers if h not in blocking
+            )
+        else:
+            self._concurrent_handlers = ()
+            self._inline_handlers = tuple(self._handlers)
+
+    def _use_queue(self, manager: "AsyncLoggerManager"):
+        self._queue_manager = manager
 
     async def _disable(self):
         if self._enabled:
             [await handler.close() for handler in self._handlers]
             self._handlers = set()
+            self._plan_fanout()
             self._enabled = False
+            self._specialize()
@@ -1,50 +1,130 @@
-from dataclasses import dataclass
-from inspect import currentframe
-from logging import LogRecord
-from traceback import format_exception
-from typing import TYPE_CHECKING, Optional
+import sys
+from typing import TYPE_CHECKING, Any, Optional
+
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.context import new_context, record_context
+from aiologbuch.shared.levels import LogLevel
+from aiologbuch.shared.metrics import LoggerMetrics
+from aiologbuch.shared.records import LogRecord
 
 if TYPE_CHECKING:
+    from aiologbuch.shared.context import Context
     from aiologbuch.shared.types import FilterProtocol, MessageType
 
 
-@dataclass
-class _StackFrame:
-    filename: str
-    function_name: str
-    line_number: int
+_UNKNOWN_CALLER = ("(unknown file)", "(unknown function)", 0)
+
+_LEVEL_METHODS = (
+    ("debug", LogLevel.DEBUG),
+    ("info", LogLevel.INFO),
+    ("warning", LogLevel.WARNING),
+    ("error", LogLevel.ERROR),
+    ("exception", LogLevel.ERROR),
+    ("critical", LogLevel.CRITICAL),
+)
 
 
 class BaseLogger[HandlerProtocol]:
     _enabled = True
+    _caller_info = True
+    _capture_caller = False
+    _capture_thread = True
+    _needs_traceback = True
+    _share_formatting = False
     _handlers: set[HandlerProtocol]
+    _bound_class: type
     name: str
 
     def __init__(self, name: str, filter_: "FilterProtocol"):
         self.name = name
         self._handlers = set()
         self._filter_object = filter_
+        self._metrics = LoggerMetrics()
+        self._specialize()
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @property
+    def handlers(self):
+        return tuple(self._handlers)
+
+    def bind(self, **fields: Any):
+        # NOTE: The fields are checked and encoded here, once for every record the
+        # bound logger will log
+        return self._bound_class(self, new_context(fields))
 
     def _filter(self, level: int):
-        return self._filter_object.filter(level=level)
+        # NOTE: Levels bound to the no-op never get here, so they aren't counted
+        if self._filter_object.filter(level=level):
+            return True
+
+        self._metrics.filtered += 1
+        return False
+
+    def _specialize(self):
+        # NOTE: Level methods are replaced on the instance, so that calling one that
+        # can't log doesn't even reach the filter. Disabled levels share a no-op, and
+        # enabled ones skip the filter if it only looks at the level. Filters that
+        # decide on every call (e.g. rate limits) keep the methods of the class.
+        filter_ = self._filter_object
+        enabled_for = getattr(filter_, "enabled_for", None)
+        is_static = enabled_for is not None and getattr(filter_, "is_static", False)
+
+        for name, level in _LEVEL_METHODS:
+            enabled = self._enabled and (enabled_for is None or enabled_for(level))
+            if not enabled:
+                setattr(self, name, self._disabled_method)
+            elif is_static:
+                setattr(self, name, self._enabled_method(name, level))
+            else:
+                self.__dict__.pop(name, None)
+
+    def _disabled_method(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def _enabled_method(self, name: str, level: int):
+        raise NotImplementedError
 
     def _find_caller(self):
+        # NOTE: Finding the caller is skipped altogether when none of the formatters
+        # prints it, or when it was switched off for this logger or globally.
+        if not (self._capture_caller and settings.CALLER_INFO):
+            return _UNKNOWN_CALLER
+
         # NOTE: The caller frame is located 3 frames up from the current one, which is
         # the one that calls 'debug', 'info', 'warning' and so on.
-        caller_frame, CALLER_FRAME_LEVEL = currentframe(), 3
         try:
-            for _ in range(CALLER_FRAME_LEVEL):
-                caller_frame = caller_frame.f_back
-            if caller_frame is None:
-                raise ValueError()
-        except (AttributeError, ValueError) as exc:
+            caller_frame = sys._getframe(3)
+        except ValueError as exc:
             raise RuntimeError("Could not find the caller's frame") from exc
 
-        return _StackFrame(
-            filename=caller_frame.f_code.co_filename,
-            function_name=caller_frame.f_code.co_name,
-            line_number=caller_frame.f_lineno,
+        code = caller_frame.f_code
+        return code.co_filename, code.co_name, caller_frame.f_lineno
+
+    def _set_caller_info(self, enabled: bool):
+        self._caller_info = enabled
+        self._update_record_capture()
+
+    def _update_record_capture(self):
+        # NOTE: Whatever none of the formatters prints is not collected for the records
+        formatters = [handler.formatter for handler in self._handlers]
+        self._capture_caller = self._caller_info and any(
+            getattr(formatter, "needs_caller", True) for formatter in formatters
+        )
+        self._capture_thread = any(
+            getattr(formatter, "needs_thread", True) for formatter in formatters
         )
+        self._needs_traceback = any(
+            getattr(formatter, "needs_traceback", True) for formatter in formatters
+        )
+
+        # NOTE: Records are only given a formatting cache if some of the formatters are
+        # configured alike, otherwise nothing would ever be reused
+        keys = [getattr(formatter, "cache_key", None) for formatter in formatters]
+        keys = [key for key in keys if key is not None]
+        self._share_formatting = len(set(keys)) < len(keys)
 
     def _make_record(
         self,
@@ -55,12 +135,10 @@ class BaseLogger[HandlerProtocol]:
         function_name: str,
         line_number: int,
         exc_info: Optional[BaseException] = None,
+        context: Optional["Context"] = None,
     ):
-        if exc_info:
-            info = (type(exc_info), exc_info, exc_info.__traceback__)
-            text = "".join(format_exception(exc_info, limit=None, chain=True))
-        else:
-            info, text = None, None
+        # NOTE: The traceback is only rendered if a formatter reads 'exc_text'
+        info = (type(exc_info), exc_info, exc_info.__traceback__) if exc_info else None
 
         record = LogRecord(
             name=name,
@@ -68,15 +146,16 @@ class BaseLogger[HandlerProtocol]:
             pathname=filename,
             lineno=line_number,
             msg=msg,
-            args=None,
             exc_info=info,
             func=function_name,
+            thread_info=self._capture_thread,
+            context=record_context(context),
         )
-
-        if text:
-            record.exc_text = text
-
+        if self._share_formatting:
+            record._formatted = {}
+        self._metrics.emitted += 1
         return record
 
     def _add_handler(self, handler: HandlerProtocol):
         self._handlers.add(handler)
+        self._update_record_capture()
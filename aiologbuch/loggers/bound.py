@@ -0,0 +1,195 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from aiologbuch.shared.context import new_context
+from aiologbuch.shared.levels import LogLevel
+
+if TYPE_CHECKING:
+    from aiologbuch.shared.context import Context
+    from aiologbuch.shared.types import MessageType
+
+    from .async_ import AsyncLogger
+    from .sync import SyncLogger
+
+
+class BoundLogger:
+    # NOTE: A view of a logger that adds its context to every record. Everything else
+    # (level decisions, handlers, metrics, being disabled) is read from the logger on
+    # each call, so it never gets out of date, and binding costs no more than encoding
+    # the fields.
+    # The level methods call the logger's '_filter' and '_log' directly, so the caller
+    # is found at the same frame depth, by the logger as well as by the filters.
+    #
+    # The logger's own level methods tell what it decided for each level. The disabled
+    # ones are the no-op, and the ones bound on the instance otherwise only had a
+    # filter that looks at the level. Only the methods of the class still need the
+    # filter to be asked.
+    __slots__ = ("_logger", "_context")
+    _logger: Any
+
+    def __init__(self, logger: Any, context: Optional["Context"]):
+        self._logger = logger
+        self._context = context
+
+    @property
+    def logger(self):
+        return self._logger
+
+    @property
+    def name(self) -> str:
+        return self._logger.name
+
+    @property
+    def context(self):
+        return {} if self._context is None else dict(self._context.fields)
+
+    @property
+    def metrics(self):
+        return self._logger.metrics
+
+    @property
+    def handlers(self):
+        return self._logger.handlers
+
+    def bind(self, **fields: Any):
+        if self._context is None:
+            context = new_context(fields)
+        else:
+            context = self._context.extend(fields)
+        return type(self)(self._logger, context)
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.name}, {self.context!r}>"
+
+
+class BoundSyncLogger(BoundLogger):
+    __slots__ = ()
+    _logger: "SyncLogger"
+
+    def debug(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("debug")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.DEBUG) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            logger._log(LogLevel.DEBUG, msg, context=self._context)
+
+    def info(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("info")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.INFO) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            logger._log(LogLevel.INFO, msg, context=self._context)
+
+    def warning(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("warning")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.WARNING) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            logger._log(LogLevel.WARNING, msg, context=self._context)
+
+    def error(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("error")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.ERROR) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            logger._log(LogLevel.ERROR, msg, context=self._context)
+
+    def exception(self, exc: BaseException, msg: Optional["MessageType"] = None):
+        logger = self._logger
+        method = logger.__dict__.get("exception")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.ERROR) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            message = msg if msg else str(exc)
+            logger._log(LogLevel.ERROR, message, exc_info=exc, context=self._context)
+
+    def critical(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("critical")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.CRITICAL) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            logger._log(LogLevel.CRITICAL, msg, context=self._context)
+
+
+class BoundAsyncLogger(BoundLogger):
+    __slots__ = ()
+    _logger: "AsyncLogger"
+
+    async def debug(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("debug")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.DEBUG) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            await logger._log(LogLevel.DEBUG, msg, context=self._context)
+
+    async def info(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("info")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.INFO) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            await logger._log(LogLevel.INFO, msg, context=self._context)
+
+    async def warning(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("warning")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.WARNING) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            await logger._log(LogLevel.WARNING, msg, context=self._context)
+
+    async def error(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("error")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.ERROR) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            await logger._log(LogLevel.ERROR, msg, context=self._context)
+
+    async def exception(self, exc: BaseException, msg: Optional["MessageType"] = None):
+        logger = self._logger
+        method = logger.__dict__.get("exception")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.ERROR) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            message = msg if msg else str(exc)
+            await logger._log(
+                LogLevel.ERROR, message, exc_info=exc, context=self._context
+            )
+
+    async def critical(self, msg: "MessageType"):
+        logger = self._logger
+        method = logger.__dict__.get("critical")
+        if method is None:
+            enabled = logger._filter(level=LogLevel.CRITICAL) and logger._enabled
+        else:
+            enabled = method is not logger._disabled_method
+        if enabled:
+            await logger._log(LogLevel.CRITICAL, msg, context=self._context)
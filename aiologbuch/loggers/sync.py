@@ -4,12 +4,23 @@ from aiologbuch.shared.levels import LogLevel
 from aiologbuch.shared.types import SyncHandlerProtocol
 
 from .base import BaseLogger
+from .bound import BoundSyncLogger
 
 if TYPE_CHECKING:
+    from aiologbuch.shared.context import Context
     from aiologbuch.shared.types import LogRecordProtocol, MessageType
 
 
+def _noop(_arg=None, msg=None, exc=None):
+    # NOTE: Takes the arguments of every level method, including 'exception', without
+    # packing them into a tuple and a dict on every call
+    return None
+
+
 class SyncLogger(BaseLogger[SyncHandlerProtocol]):
+    _disabled_method = staticmethod(_noop)
+    _bound_class = BoundSyncLogger
+
     def debug(self, msg: "MessageType"):
         if self._filter(level=LogLevel.DEBUG) and self._enabled:
             self._log(LogLevel.DEBUG, msg)
@@ -35,22 +46,39 @@ class SyncLogger(BaseLogger[SyncHandlerProtocol]):
         if self._filter(level=LogLevel.CRITICAL) and self._enabled:
             self._log(LogLevel.CRITICAL, msg)
 
+    def _enabled_method(self, name: str, level: int):
+        # NOTE: Same frame depth as the methods above, which '_find_caller' relies on
+        log = self._log
+        if name == "exception":
+
+            def method(exc: BaseException, msg: Optional["MessageType"] = None):
+                log(level, msg if msg else str(exc), exc_info=exc)
+
+        else:
+
+            def method(msg: "MessageType"):
+                log(level, msg)
+
+        return method
+
     def _log(
         self,
         level: int,
         msg: "MessageType",
         exc_info: Optional[BaseException] = None,
+        context: Optional["Context"] = None,
     ):
-        caller = self._find_caller()
+        filename, function_name, line_number = self._find_caller()
 
         record = self._make_record(
             name=self.name,
             level=level,
             msg=msg,
-            filename=caller.filename,
-            function_name=caller.function_name,
-            line_number=caller.line_number,
+            filename=filename,
+            function_name=function_name,
+            line_number=line_number,
             exc_info=exc_info,
+            context=context,
         )
 
         self._handle(record)
@@ -63,3 +91,4 @@ class SyncLogger(BaseLogger[SyncHandlerProtocol]):
             [handler.close() for handler in self._handlers]
             self._handlers = set()
             self._enabled = False
+            self._specialize()
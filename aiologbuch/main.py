@@ -1,5 +1,5 @@
 from inspect import currentframe, getmodule
-from typing import TYPE_CHECKING, Literal, cast, overload
+from typing import TYPE_CHECKING, Literal, Optional, cast, overload
 
 from .formatters import JsonFormatter, LineFormatter
 from .handlers import (  # noqa
@@ -17,7 +17,7 @@ from .shared.levels import check_level
 from .shared.types import BaseLoggerProtocol
 
 if TYPE_CHECKING:
-    from .shared.types import LevelType
+    from .shared.types import FilterProtocol, LevelType
 
 
 # TODO: Make sure that users can globally configure:
@@ -40,6 +40,9 @@ def get_logger(
     filename: str = "",
     exclusive: bool = False,
     kind: Literal["async"] = "async",
+    queued: bool = False,
+    caller_info: bool = True,
+    filter_: Optional["FilterProtocol"] = None,
 ) -> AsyncLogger: ...
 
 
@@ -50,6 +53,9 @@ def get_logger(
     filename: str = "",
     exclusive: bool = False,
     kind: Literal["sync"] = "sync",
+    queued: Literal[False] = False,
+    caller_info: bool = True,
+    filter_: Optional["FilterProtocol"] = None,
 ) -> SyncLogger: ...
 
 
@@ -59,6 +65,9 @@ def get_logger(
     filename: str = "",
     exclusive: bool = False,
     kind: Literal["async", "sync"] = "async",
+    queued: bool = False,
+    caller_info: bool = True,
+    filter_: Optional["FilterProtocol"] = None,
 ):
     if not name:
         try:
@@ -72,15 +81,18 @@ def get_logger(
 
         name = module.__name__
 
-    filter_ = Filter(level=check_level(level=level))
+    # NOTE: A filter of its own (e.g. a rate limit) replaces the level one
+    if filter_ is None:
+        filter_ = Filter(level=check_level(level=level))
     manager = async_manager if kind == "async" else sync_manager
     logger, created = manager.get_logger(name=name, filter_=filter_)
 
     if created:
         if kind == "async":
-            _setup_async_logger(logger=logger)
+            _setup_async_logger(logger=logger, queued=queued)
         else:
             _setup_sync_logger(logger=logger)
+        logger._set_caller_info(caller_info)
 
     if not settings.is_configured:
         settings.configure()
@@ -88,7 +100,10 @@ def get_logger(
     return logger
 
 
-def _setup_async_logger(logger: BaseLoggerProtocol):
+def _setup_async_logger(logger: BaseLoggerProtocol, queued: bool = False):
+    if queued:
+        cast(AsyncLogger, logger)._use_queue(async_manager)
+
     stderr_handler1 = AsyncStderrHandler(formatter=JsonFormatter())
     stderr_handler2 = AsyncStderrHandler(formatter=LineFormatter())
     logger._add_handler(stderr_handler1)
@@ -1,12 +1,108 @@
+from asyncio import CancelledError, Task, get_running_loop
+from typing import TYPE_CHECKING, Optional
+
+from aiologbuch.shared.buffers import BufferStats, OverflowBuffer
+from aiologbuch.shared.conf import settings
 from aiologbuch.shared.types import AsyncLoggerProtocol
 
 from .base import BaseLoggerManager
 
+if TYPE_CHECKING:
+    from aiologbuch.shared.types import LogRecordProtocol
+
+    type _QueueItem = tuple[AsyncLoggerProtocol, LogRecordProtocol]
+
 
 class AsyncLoggerManager(BaseLoggerManager[AsyncLoggerProtocol]):
+    _queue: Optional[OverflowBuffer["_QueueItem"]] = None
+    _drain_task: Optional[Task[None]] = None
+    _stats: BufferStats
+
+    def __init__(self, logger_class: AsyncLoggerProtocol):
+        super().__init__(logger_class=logger_class)
+        self._stats = BufferStats()
+
+    @property
+    def queue(self):
+        return self._queue
+
+    @property
+    def stats(self):
+        # NOTE: Kept by the manager, since the queue is only created along with the
+        # first queued record, and again whenever the event loop changes
+        return self._stats
+
+    def _ensure_drain_task(self):
+        loop = get_running_loop()
+
+        # NOTE: The queue and its drain task are bound to the event loop that created
+        # them, so they have to be recreated if the loop changes (e.g. after a new
+        # 'asyncio.run' call).
+        if (self._queue is None) or (self._drain_task.get_loop() is not loop):
+            self._queue = OverflowBuffer(
+                max_size=settings.QUEUE_MAX_SIZE,
+                policy=settings.OVERFLOW_POLICY,
+                drop_level=settings.DROP_BELOW_LEVEL,
+                stats=self._stats,
+            )
+            self._drain_task = None
+
+        if (self._drain_task is None) or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain(self._queue))
+
+        return self._queue
+
+    def _owns_running_loop(self):
+        if self._drain_task is None:
+            return False
+        return self._drain_task.get_loop() is get_running_loop()
+
+    async def _drain(self, queue: OverflowBuffer["_QueueItem"]):
+        while True:
+            logger, record = await queue.get()
+            try:
+                await logger._handle(record)
+            except CancelledError:
+                raise
+            except:  # noqa
+                # NOTE: Handlers already deal with their own errors, this only keeps
+                # the drain task alive should anything else go wrong.
+                ...
+            finally:
+                queue.task_done()
+
+    def metrics(self):
+        queue = self._queue
+        return super().metrics() | {
+            "queue": {
+                "depth": 0 if queue is None else queue.qsize(),
+                "dropped": self._stats.dropped,
+                "delayed": self._stats.delayed,
+            }
+        }
+
+    async def enqueue(self, logger: AsyncLoggerProtocol, record: "LogRecordProtocol"):
+        await self._ensure_drain_task().put((logger, record), record.levelno)
+
+    async def flush(self):
+        if self._owns_running_loop():
+            await self._queue.join()
+
+    async def _stop_drain_task(self):
+        if self._owns_running_loop():
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except CancelledError:
+                ...
+        self._queue, self._drain_task = None, None
+
     async def disable(self):
+        await self.flush()
         [await self.loggers[name]._disable() for name in self.loggers]
+        await self._stop_drain_task()
 
     async def disable_logger(self, name: str):
+        await self.flush()
         if logger := self.loggers.pop(name, None):
             await logger._disable()
@@ -1,3 +1,4 @@
+from aiologbuch.shared.metrics import handler_target, locks_snapshot, to_prometheus
 from aiologbuch.shared.types import BaseLoggerProtocol, FilterProtocol
 
 
@@ -23,3 +24,24 @@ class BaseLoggerManager[T: BaseLoggerProtocol]:
             self.loggers[name], created = self.logger_class(name, filter_), True
 
         return self.loggers[name], created
+
+    def metrics(self):
+        # NOTE: A snapshot of the metrics of every logger and its handlers, along with
+        # the wait time of the locks they share
+        loggers = {}
+        for name, logger in list(self.loggers.items()):
+            handlers = [
+                {
+                    "handler": type(handler).__name__,
+                    "target": handler_target(handler),
+                    **handler.metrics.snapshot(),
+                }
+                for handler in logger.handlers
+                if hasattr(handler, "metrics")
+            ]
+            loggers[name] = {**logger.metrics.snapshot(), "handlers": handlers}
+
+        return {"loggers": loggers, "locks": locks_snapshot()}
+
+    def metrics_text(self):
+        return to_prometheus(self.metrics())
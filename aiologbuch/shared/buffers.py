@@ -0,0 +1,168 @@
+from asyncio import Future, _get_running_loop, get_running_loop
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .enums import OverflowPolicyEnum
+
+if TYPE_CHECKING:
+    from .types import OverflowPolicy
+
+
+@dataclass
+class BufferStats:
+    dropped: int = 0
+    delayed: int = 0
+
+
+class OverflowBuffer[T]:
+    # NOTE: A bounded buffer that decides what happens once it's full, according to its
+    # policy:
+    # - block: the caller waits until there's room for its item
+    # - drop_newest: the incoming item is discarded
+    # - drop_oldest: the oldest buffered item is discarded to make room
+    # - drop_below_level: items below 'drop_level' are discarded, the others wait
+    _items: deque[tuple[int, T]]
+    _putters: deque[Future[None]]
+    _getters: deque[Future[None]]
+    _joiners: deque[Future[None]]
+    _unfinished: int
+    _stats: BufferStats
+
+    def __init__(
+        self,
+        max_size: int,
+        policy: "OverflowPolicy",
+        drop_level: int = 0,
+        stats: Optional[BufferStats] = None,
+    ):
+        if max_size <= 0:
+            raise ValueError("'max_size' must be greater than zero")
+
+        if policy not in OverflowPolicyEnum.ALL:
+            raise ValueError(f"Unknown overflow policy: {policy!r}")
+
+        self._max_size = max_size
+        self._policy = policy
+        self._drop_level = drop_level
+
+        self._items = deque()
+        self._putters, self._getters, self._joiners = deque(), deque(), deque()
+        self._unfinished = 0
+        # NOTE: Owners that replace their buffer (e.g. when the event loop changes) can
+        # keep counting into the same stats
+        self._stats = BufferStats() if stats is None else stats
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def stats(self):
+        return self._stats
+
+    def qsize(self):
+        return len(self._items)
+
+    def full(self):
+        return len(self._items) >= self._max_size
+
+    def __len__(self):
+        return len(self._items)
+
+    async def put(self, item: T, level: int):
+        if self.full():
+            if (self._policy == OverflowPolicyEnum.DROP_NEWEST) or (
+                self._policy == OverflowPolicyEnum.DROP_BELOW_LEVEL
+                and level < self._drop_level
+            ):
+                self._stats.dropped += 1
+                return False
+
+            if self._policy == OverflowPolicyEnum.DROP_OLDEST:
+                self._items.popleft()
+                self._stats.dropped += 1
+                self.task_done()
+            else:
+                self._stats.delayed += 1
+                while self.full():
+                    await self._wait(self._putters)
+
+        self._items.append((level, item))
+        self._unfinished += 1
+        _wake_one(self._getters)
+        return True
+
+    async def get(self):
+        while not self._items:
+            await self._wait(self._getters)
+
+        _, item = self._items.popleft()
+        _wake_one(self._putters)
+        return item
+
+    def get_all_nowait(self):
+        items = [item for _, item in self._items]
+        self._items.clear()
+        _wake_all(self._putters)
+        return items
+
+    def task_done(self, count: int = 1):
+        self._unfinished -= count
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            _wake_all(self._joiners)
+
+    async def join(self):
+        while self._unfinished:
+            await self._wait(self._joiners)
+
+    async def _wait(self, waiters: deque[Future[None]]):
+        waiter = get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                ...
+
+
+def _resolve(waiter: Future[None], waiters: deque[Future[None]]):
+    # NOTE: Runs in the waiter's loop. A waiter cancelled in the meantime passes the
+    # wake up on, so that it isn't lost.
+    if waiter.done():
+        _wake_one(waiters)
+    else:
+        waiter.set_result(None)
+
+
+def _wake_one(waiters: deque[Future[None]]):
+    # NOTE: Futures aren't thread-safe, so waiters of another thread's event loop are
+    # resolved through that loop
+    while waiters:
+        waiter = waiters.popleft()
+        if waiter.done():
+            continue
+
+        loop = waiter.get_loop()
+        if loop is _get_running_loop():
+            waiter.set_result(None)
+            return
+
+        try:
+            loop.call_soon_threadsafe(_resolve, waiter, waiters)
+        except RuntimeError:
+            # NOTE: The waiter's loop is closed
+            continue
+        return
+
+
+def _wake_all(waiters: deque[Future[None]]):
+    while waiters:
+        _wake_one(waiters)
@@ -1,8 +1,11 @@
-from asyncio import Lock
 from os import getenv
 from threading import Lock as ThreadLock
+from typing import Optional
 
-from .types import AsyncStreamBackendType
+from .levels import check_level
+from .locks import HybridLock
+from .metrics import get_lock_metrics
+from .types import AsyncStreamBackendType, LevelType, OverflowPolicy
 from .utils import parse_bool
 
 _settings_lock = ThreadLock()
@@ -11,16 +14,47 @@ _configured = False
 
 class _Settings:
     RAISE_EXCEPTIONS = parse_bool(getenv("AIOLOGBUCH_RAISE_EXCEPTIONS", "0"))
+    CALLER_INFO = parse_bool(getenv("AIOLOGBUCH_CALLER_INFO", "1"))
+    # NOTE: Records can render their traceback before the settings are configured
+    TRACEBACK_LIMIT: Optional[int] = None
+    TRACEBACK_MAX_SIZE = 64 * 1024
+    TRACEBACK_CACHE_SIZE = 256
+    TRACEBACK_OFF_LOOP = False
 
-    GLOBAL_STDERR_LOCK: Lock
+    GLOBAL_STDERR_LOCK: HybridLock
     STREAM_BACKEND: AsyncStreamBackendType
+    QUEUE_MAX_SIZE: int
+    BATCH_MAX_BYTES: int
+    BATCH_LINGER: float
+    DURABLE_WRITES: bool
+    OVERFLOW_POLICY: OverflowPolicy
+    DROP_BELOW_LEVEL: int
+    STDERR_BUFFER_SIZE: int
+    STDERR_HIGH_WATER: int
+    STDERR_LOW_WATER: int
 
     @property
     def is_configured(self):
         with _settings_lock:
             return _configured
 
-    def configure(self, stream_backend: AsyncStreamBackendType = "thread"):
+    def configure(
+        self,
+        stream_backend: AsyncStreamBackendType = "thread",
+        queue_max_size: int = 10_000,
+        batch_max_bytes: int = 64 * 1024,
+        batch_linger: float = 0.0,
+        durable_writes: bool = False,
+        overflow_policy: OverflowPolicy = "block",
+        drop_below_level: LevelType = "WARNING",
+        stderr_buffer_size: int = 10_000,
+        stderr_high_water: int = 64 * 1024,
+        stderr_low_water: int = 16 * 1024,
+        traceback_limit: Optional[int] = None,
+        traceback_max_size: int = 64 * 1024,
+        traceback_cache_size: int = 256,
+        traceback_off_loop: bool = False,
+    ):
         global _configured
 
         with _settings_lock:
@@ -28,8 +62,21 @@ class _Settings:
                 # NOTE: Once called, the settings can not be changed
                 return
 
-            self.GLOBAL_STDERR_LOCK = Lock()
+            self.GLOBAL_STDERR_LOCK = HybridLock(metrics=get_lock_metrics("stderr"))
             self.STREAM_BACKEND = stream_backend
+            self.QUEUE_MAX_SIZE = queue_max_size
+            self.BATCH_MAX_BYTES = batch_max_bytes
+            self.BATCH_LINGER = batch_linger
+            self.DURABLE_WRITES = durable_writes
+            self.OVERFLOW_POLICY = overflow_policy
+            self.DROP_BELOW_LEVEL = check_level(level=drop_below_level)
+            self.STDERR_BUFFER_SIZE = stderr_buffer_size
+            self.STDERR_HIGH_WATER = stderr_high_water
+            self.STDERR_LOW_WATER = stderr_low_water
+            self.TRACEBACK_LIMIT = traceback_limit
+            self.TRACEBACK_MAX_SIZE = traceback_max_size
+            self.TRACEBACK_CACHE_SIZE = traceback_cache_size
+            self.TRACEBACK_OFF_LOOP = traceback_off_loop
 
             _configured = True
 
@@ -0,0 +1,120 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from json import dumps
+from json.encoder import encode_basestring_ascii
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from aiologbuch.formatters.base import BaseFormatter
+
+# NOTE: Merges are cached on the scoped context, which usually lives for a single
+# request, but can also be set once for a whole application
+_MAX_MERGES = 64
+
+
+class Context:
+    # NOTE: Fields attached to every record of a bound logger or of a scope. They are
+    # encoded once, into the members of a json object laid out like the encoders lay
+    # out theirs, and 'JsonFormatter' splices them into its output as they are. The
+    # encoders double every backslash of what they encode, and the fragment is spliced
+    # in afterwards, so its backslashes are doubled here instead.
+    __slots__ = ("_fields", "_fragment", "_encoded", "_merges")
+
+    def __init__(self, fields: Mapping[str, Any], fragment: Optional[str] = None):
+        self._fields = MappingProxyType(dict(fields))
+        if fragment is None:
+            fragment = ", ".join(
+                [
+                    f"{encode_basestring_ascii(key)}: {dumps(value)}"
+                    for key, value in self._fields.items()
+                ]
+            ).replace("\\", "\\\\")
+        self._fragment = fragment
+        self._encoded = fragment.encode("ascii")
+        self._merges: dict["Context", "Context"] = dict()
+
+    @property
+    def fields(self):
+        return self._fields
+
+    @property
+    def fragment(self):
+        return self._fragment
+
+    @property
+    def encoded(self):
+        return self._encoded
+
+    def extend(self, fields: Mapping[str, Any]):
+        if not fields:
+            return self
+
+        check_fields(fields)
+        if self._fields.keys().isdisjoint(fields):
+            # NOTE: Only the new fields are encoded
+            addition = Context(fields)
+            fragment = f"{self._fragment}, {addition.fragment}"
+            return Context({**self._fields, **fields}, fragment)
+        return Context({**self._fields, **fields})
+
+    def merge(self, bound: "Context"):
+        # NOTE: Combines a scoped context with the context of a bound logger, whose
+        # fields win, once per pair
+        if (merged := self._merges.get(bound)) is None:
+            if len(self._merges) >= _MAX_MERGES:
+                self._merges.clear()
+            merged = self._merges[bound] = self.extend(bound.fields)
+        return merged
+
+    def __repr__(self):
+        return f"<Context: {dict(self._fields)!r}>"
+
+
+def check_fields(fields: Mapping[str, Any]):
+    if reserved := [key for key in fields if key in BaseFormatter.FIELDS]:
+        raise ValueError(
+            f"Reserved fields: {', '.join(map(repr, reserved))}. Context fields can "
+            f"not be named after: {', '.join(BaseFormatter.FIELDS)}"
+        )
+
+
+def new_context(fields: Mapping[str, Any]):
+    if not fields:
+        return None
+
+    check_fields(fields)
+    return Context(fields)
+
+
+_scoped: ContextVar[Optional[Context]] = ContextVar("aiologbuch_context", default=None)
+
+
+def get_context():
+    # NOTE: The fields of the current scope, which every task inherits from the one
+    # that created it
+    if (context := _scoped.get()) is None:
+        return MappingProxyType({})
+    return context.fields
+
+
+@contextmanager
+def scoped_context(**fields: Any):
+    current = _scoped.get()
+    if current is None:
+        context = new_context(fields)
+    else:
+        context = current.extend(fields)
+
+    token = _scoped.set(context)
+    try:
+        yield context
+    finally:
+        _scoped.reset(token)
+
+
+def record_context(bound: Optional[Context]):
+    if (scoped := _scoped.get()) is None:
+        return bound
+    if bound is None:
+        return scoped
+    return scoped.merge(bound)
@@ -1,3 +1,12 @@
 class IOModeEnum:
     ASYNC = "async"
     SYNC = "sync"
+
+
+class OverflowPolicyEnum:
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    DROP_BELOW_LEVEL = "drop_below_level"
+
+    ALL = (BLOCK, DROP_NEWEST, DROP_OLDEST, DROP_BELOW_LEVEL)
@@ -1,3 +1,14 @@
+import sys
+from random import Random
+from threading import Lock as ThreadLock
+from time import monotonic
+from typing import Mapping, Optional
+
+# NOTE: Filters are called by the logger's '_filter', itself called by 'debug', 'info'
+# and so on, so the frame of the code that logs is 3 frames up from 'filter'
+_CALLER_DEPTH = 3
+
+
 class Filter:
     def __init__(self, level: int):
         self._level = level
@@ -6,10 +17,217 @@ class Filter:
     def level(self):
         return self._level
 
+    @property
+    def is_static(self):
+        # NOTE: A static filter decides on the level alone, so loggers only ask it once
+        # per level, when they're created, instead of on every call. Only the filters
+        # below are known to be, a subclass that overrides 'filter' may look at
+        # anything else, and is asked on every call.
+        return type(self).filter in _STATIC_FILTERS
+
     def filter(self, level: int):
         return level >= self.level
 
+    def enabled_for(self, level: int):
+        # NOTE: Levels a dynamic filter might let through can't be switched off
+        return self.filter(level=level) if self.is_static else True
+
 
 class ExclusiveFilter(Filter):
     def filter(self, level: int):
         return level == self.level
+
+
+_STATIC_FILTERS = (Filter.filter, ExclusiveFilter.filter)
+
+
+class _TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+    def take(self, rate: float, burst: float, now: float):
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class _SuppressingFilter(Filter):
+    # NOTE: Filters that let only some of the records through count the ones they
+    # suppress. They run before the record is even created, so suppressing one costs
+    # little more than taking the lock.
+    _suppressed: int
+    _lock: ThreadLock
+    is_static = False
+
+    def __init__(self, level: int):
+        super().__init__(level=level)
+        self._suppressed = 0
+        self._lock = ThreadLock()
+
+    @property
+    def suppressed(self):
+        return self._suppressed
+
+    def enabled_for(self, level: int):
+        return level >= self._level
+
+    def reset(self):
+        with self._lock:
+            self._suppressed = 0
+
+
+class RateLimitFilter(_SuppressingFilter):
+    # NOTE: Lets through up to 'rate' records per second, with bursts of up to 'burst'
+    # records, for the whole logger
+    def __init__(self, level: int, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("'rate' must be greater than zero")
+
+        if burst is None:
+            burst = max(rate, 1.0)
+        elif burst < 1:
+            raise ValueError("'burst' must be at least one")
+
+        super().__init__(level=level)
+        self._rate = rate
+        self._burst = burst
+        self._bucket = _TokenBucket(tokens=burst, updated=monotonic())
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @property
+    def burst(self):
+        return self._burst
+
+    def filter(self, level: int):
+        if level < self._level:
+            return False
+
+        with self._lock:
+            if self._bucket.take(self._rate, self._burst, monotonic()):
+                return True
+
+            self._suppressed += 1
+            return False
+
+
+class CallSiteRateLimitFilter(RateLimitFilter):
+    # NOTE: Same as 'RateLimitFilter', but every line that logs gets a bucket of its
+    # own, so a hot loop repeating the same warning doesn't silence the rest. Only the
+    # 'max_sites' most recently seen lines are tracked.
+    _buckets: dict[tuple[str, int], _TokenBucket]
+
+    def __init__(
+        self,
+        level: int,
+        rate: float,
+        burst: Optional[float] = None,
+        max_sites: int = 10_000,
+    ):
+        if max_sites <= 0:
+            raise ValueError("'max_sites' must be greater than zero")
+
+        super().__init__(level=level, rate=rate, burst=burst)
+        self._max_sites = max_sites
+        self._buckets = dict()
+
+    @property
+    def max_sites(self):
+        return self._max_sites
+
+    def filter(self, level: int):
+        if level < self._level:
+            return False
+
+        try:
+            frame = sys._getframe(_CALLER_DEPTH)
+            site = (frame.f_code.co_filename, frame.f_lineno)
+        except ValueError:
+            site = ("(unknown file)", 0)
+
+        with self._lock:
+            now = monotonic()
+            if (bucket := self._buckets.pop(site, None)) is None:
+                bucket = _TokenBucket(tokens=self._burst, updated=now)
+                if len(self._buckets) >= self._max_sites:
+                    del self._buckets[next(iter(self._buckets))]
+            # NOTE: Reinserting the bucket keeps the least recently seen lines first
+            self._buckets[site] = bucket
+
+            if bucket.take(self._rate, self._burst, now):
+                return True
+
+            self._suppressed += 1
+            return False
+
+
+class SamplingFilter(_SuppressingFilter):
+    # NOTE: Keeps 1 out of every 'every' records, starting with the first one
+    def __init__(self, level: int, every: int):
+        if every <= 0:
+            raise ValueError("'every' must be greater than zero")
+
+        super().__init__(level=level)
+        self._every = every
+        self._seen = 0
+
+    @property
+    def every(self):
+        return self._every
+
+    def filter(self, level: int):
+        if level < self._level:
+            return False
+
+        with self._lock:
+            keep = self._seen % self._every == 0
+            self._seen += 1
+            if not keep:
+                self._suppressed += 1
+            return keep
+
+
+class LevelSamplingFilter(_SuppressingFilter):
+    # NOTE: Keeps every record with the probability given for its level, levels that
+    # aren't given are always kept
+    _rates: dict[int, float]
+
+    def __init__(
+        self, level: int, rates: Mapping[int, float], seed: Optional[int] = None
+    ):
+        if any(not 0 <= rate <= 1 for rate in rates.values()):
+            raise ValueError("Rates must be between 0 and 1")
+
+        super().__init__(level=level)
+        self._rates = dict(rates)
+        self._random = Random(seed)
+
+    @property
+    def rates(self):
+        return self._rates
+
+    def enabled_for(self, level: int):
+        return level >= self._level and self._rates.get(level, 1.0) > 0
+
+    def filter(self, level: int):
+        if level < self._level:
+            return False
+
+        if (rate := self._rates.get(level)) is None:
+            return True
+
+        with self._lock:
+            if self._random.random() < rate:
+                return True
+
+            self._suppressed += 1
+            return False
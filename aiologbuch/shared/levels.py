@@ -28,6 +28,10 @@ def check_level(level: "LevelType"):
         raise TypeError(f"Level not an union of int and str: {level}")
 
 
+def get_level_name(level: int):
+    return _LEVEL_TO_NAME.get(level) or f"Level {level}"
+
+
 _NAME_TO_LEVEL = {level: LogLevel[level].value for level in LogLevel.__members__}
 
 _LEVEL_TO_NAME = {level.value: level.name for level in LogLevel}
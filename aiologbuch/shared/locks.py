@@ -0,0 +1,145 @@
+from asyncio import Future, _get_running_loop, get_running_loop
+from collections import deque
+from threading import Lock as ThreadLock
+from threading import get_ident
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
+
+from .exceptions import WouldDeadlock
+
+if TYPE_CHECKING:
+    from .metrics import LockMetrics
+
+
+class HybridLock:
+    # NOTE: A lock that can be shared between sync threads and coroutines, running in
+    # any event loop. It's backed by a thread lock, so the sync side just acquires it,
+    # while the async side parks a future that is resolved by whoever releases it.
+    _lock: ThreadLock
+    _waiters: deque[Future[None]]
+    _owner: Optional[int]
+    _metrics: Optional["LockMetrics"]
+
+    def __init__(self, metrics: Optional["LockMetrics"] = None):
+        self._lock = ThreadLock()
+        self._waiters = deque()
+        self._owner = None
+        self._metrics = metrics
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    def locked(self):
+        return self._lock.locked()
+
+    def acquire(self):
+        if not self._lock.acquire(blocking=False):
+            # NOTE: If the current thread already holds it, it must be through a
+            # coroutine that is suspended while holding the lock. Blocking here would
+            # block its event loop too, so it would never be released.
+            if self._owner == get_ident():
+                raise WouldDeadlock()
+
+            start = perf_counter()
+            self._lock.acquire()
+            if self._metrics is not None:
+                self._metrics.waited(perf_counter() - start)
+
+        self._owner = get_ident()
+
+    def try_acquire(self):
+        if self._lock.acquire(blocking=False):
+            self._owner = get_ident()
+            return True
+        return False
+
+    async def aacquire(self):
+        if not self._lock.acquire(blocking=False):
+            start = perf_counter()
+            await self._wait()
+            if self._metrics is not None:
+                self._metrics.waited(perf_counter() - start)
+
+        self._owner = get_ident()
+
+    async def _wait(self):
+        loop = get_running_loop()
+
+        while True:
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+
+            # NOTE: The lock might have been released between the first attempt and the
+            # waiter registration, so it's tried once more to not miss that wake up.
+            if self._lock.acquire(blocking=False):
+                self._discard(waiter)
+                return
+
+            try:
+                await waiter
+            except BaseException:
+                # NOTE: Woken up, but cancelled before running. The wake up is passed on
+                # so the other waiters don't sleep while the lock is free.
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_next()
+                raise
+            finally:
+                self._discard(waiter)
+
+            if self._lock.acquire(blocking=False):
+                return
+
+    def _discard(self, waiter: Future[None]):
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            ...
+
+    def _wake_next(self):
+        while self._waiters:
+            try:
+                waiter = self._waiters.popleft()
+            except IndexError:
+                return
+
+            if waiter.done():
+                continue
+
+            loop = waiter.get_loop()
+            if loop is _get_running_loop():
+                waiter.set_result(None)
+                return
+
+            try:
+                loop.call_soon_threadsafe(self._wake_up, waiter)
+            except RuntimeError:
+                # NOTE: The waiter's loop is closed
+                continue
+            return
+
+    def _wake_up(self, waiter: Future[None]):
+        if waiter.done():
+            # NOTE: It was cancelled while the wake up was on its way
+            self._wake_next()
+        else:
+            waiter.set_result(None)
+
+    def release(self):
+        self._owner = None
+        self._lock.release()
+        self._wake_next()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    async def __aenter__(self):
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, *args):
+        self.release()
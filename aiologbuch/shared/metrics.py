@@ -0,0 +1,274 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from threading import Lock as ThreadLock
+from typing import Any, Iterable, Optional
+
+# NOTE: Metrics are plain counters, updated without any lock so that they can be left
+# on in production. Under free threading an increment could rarely be lost, which is
+# fine for what they're meant to show.
+
+# NOTE: In seconds, from 10us to 1s
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class Histogram:
+    __slots__ = ("_buckets", "_counts", "sum", "count")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    @property
+    def buckets(self):
+        return self._buckets
+
+    def observe(self, value: float):
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        # NOTE: Cumulative, as Prometheus expects them, the last one being '+Inf'
+        cumulative, total = [], 0
+        for count in self._counts:
+            total += count
+            cumulative.append(total)
+        return {
+            "buckets": dict(zip([*self._buckets, float("inf")], cumulative)),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+@dataclass
+class LoggerMetrics:
+    emitted: int = 0
+    filtered: int = 0
+
+    def snapshot(self):
+        return {"emitted": self.emitted, "filtered": self.filtered}
+
+
+@dataclass
+class HandlerMetrics:
+    records: int = 0
+    bytes: int = 0
+    errors: int = 0
+    write_latency: Histogram = field(default_factory=Histogram)
+
+    def written(self, size: int, elapsed: float):
+        self.records += 1
+        self.bytes += size
+        self.write_latency.observe(elapsed)
+
+    def snapshot(self):
+        return {
+            "records": self.records,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "write_latency": self.write_latency.snapshot(),
+        }
+
+
+@dataclass
+class LockMetrics:
+    # NOTE: Only acquisitions that had to wait are counted, the others cost nothing
+    contended: int = 0
+    wait_time: Histogram = field(default_factory=Histogram)
+
+    def waited(self, elapsed: float):
+        self.contended += 1
+        self.wait_time.observe(elapsed)
+
+    def snapshot(self):
+        return {"contended": self.contended, "wait_time": self.wait_time.snapshot()}
+
+
+_locks: dict[str, LockMetrics] = dict()
+_locks_lock = ThreadLock()
+
+
+def get_lock_metrics(name: str):
+    # NOTE: Locks are named after what they protect, so a file that is closed and
+    # opened again keeps adding to the same metrics
+    with _locks_lock:
+        if (metrics := _locks.get(name)) is None:
+            metrics = _locks[name] = LockMetrics()
+        return metrics
+
+
+def locks_snapshot():
+    with _locks_lock:
+        return {name: metrics.snapshot() for name, metrics in _locks.items()}
+
+
+def handler_target(handler: object):
+    return getattr(handler, "filename", None) or getattr(handler, "path", None) or ""
+
+
+def _escape(value: Any):
+    text = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"')
+
+
+def _labels(labels: dict[str, Any], extra: Optional[str] = None):
+    pairs = [f'{key}="{_escape(value)}"' for key, value in labels.items()]
+    if extra is not None:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Exposition:
+    # NOTE: Writes metrics in the Prometheus text format, grouping the samples of each
+    # metric under a single HELP and TYPE header
+    _families: dict[str, tuple[str, str, list[str]]]
+
+    def __init__(self):
+        self._families = dict()
+
+    def _family(self, name: str, kind: str, help_: str):
+        if name not in self._families:
+            self._families[name] = (kind, help_, [])
+        return self._families[name][2]
+
+    def sample(self, name: str, kind: str, help_: str, labels: dict, value: float):
+        self._family(name, kind, help_).append(
+            f"{name}{_labels(labels)} {_number(value)}"
+        )
+
+    def histogram(self, name: str, help_: str, labels: dict, snapshot: dict):
+        samples = self._family(name, "histogram", help_)
+        for bound, count in snapshot["buckets"].items():
+            bucket = _labels(labels, f'le="{_number(float(bound))}"')
+            samples.append(f"{name}_bucket{bucket} {count}")
+        samples.append(f"{name}_sum{_labels(labels)} {_number(snapshot['sum'])}")
+        samples.append(f"{name}_count{_labels(labels)} {snapshot['count']}")
+
+    def render(self):
+        lines = []
+        for name, (kind, help_, samples) in self._families.items():
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def to_prometheus(snapshot: dict, prefix: str = "aiologbuch"):
+    exposition = _Exposition()
+
+    for logger_name, logger in snapshot["loggers"].items():
+        labels = {"logger": logger_name}
+        exposition.sample(
+            f"{prefix}_records_emitted_total",
+            "counter",
+            "Records created by the logger.",
+            labels,
+            logger["emitted"],
+        )
+        exposition.sample(
+            f"{prefix}_records_filtered_total",
+            "counter",
+            "Records suppressed by the logger's filter.",
+            labels,
+            logger["filtered"],
+        )
+
+        for handler in logger["handlers"]:
+            labels = {
+                "logger": logger_name,
+                "handler": handler["handler"],
+                "target": handler["target"],
+            }
+            exposition.sample(
+                f"{prefix}_handler_records_total",
+                "counter",
+                "Records written by the handler.",
+                labels,
+                handler["records"],
+            )
+            exposition.sample(
+                f"{prefix}_handler_bytes_total",
+                "counter",
+                "Bytes written by the handler.",
+                labels,
+                handler["bytes"],
+            )
+            exposition.sample(
+                f"{prefix}_handler_errors_total",
+                "counter",
+                "Records the handler failed to write.",
+                labels,
+                handler["errors"],
+            )
+            exposition.histogram(
+                f"{prefix}_handler_write_seconds",
+                "Time spent writing a record, in seconds.",
+                labels,
+                handler["write_latency"],
+            )
+
+    for lock_name, lock in snapshot["locks"].items():
+        labels = {"lock": lock_name}
+        exposition.sample(
+            f"{prefix}_lock_contended_total",
+            "counter",
+            "Acquisitions that had to wait for the lock.",
+            labels,
+            lock["contended"],
+        )
+        exposition.histogram(
+            f"{prefix}_lock_wait_seconds",
+            "Time spent waiting for the lock, in seconds.",
+            labels,
+            lock["wait_time"],
+        )
+
+    if (queue := snapshot.get("queue")) is not None:
+        exposition.sample(
+            f"{prefix}_queue_depth",
+            "gauge",
+            "Records waiting in the queue.",
+            {},
+            queue["depth"],
+        )
+        exposition.sample(
+            f"{prefix}_queue_dropped_total",
+            "counter",
+            "Records dropped because the queue was full.",
+            {},
+            queue["dropped"],
+        )
+        exposition.sample(
+            f"{prefix}_queue_delayed_total",
+            "counter",
+            "Records that waited for room in the queue.",
+            {},
+            queue["delayed"],
+        )
+
+    return exposition.render()
@@ -0,0 +1,142 @@
+import os
+import sys
+from threading import current_thread
+from time import time_ns
+from typing import TYPE_CHECKING, Optional
+
+from .levels import get_level_name
+from .tracebacks import render_traceback
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from .context import Context
+
+    from .types import MessageType
+
+    type ExcInfo = tuple[type[BaseException], BaseException, Optional[TracebackType]]
+
+
+_UNSET = object()
+
+
+def _refresh_pid():
+    global _PID
+    _PID = os.getpid()
+
+
+_PID = os.getpid()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+class LogRecord:
+    # NOTE: A lighter take on 'logging.LogRecord'. Only what is cheap to get is
+    # collected when the record is created, while 'msecs', 'processName', 'threadName'
+    # and 'exc_text' are computed the first time a formatter asks for them. The thread
+    # is only looked up if some formatter prints it, see 'thread_info'.
+    __slots__ = (
+        "name",
+        "levelno",
+        "levelname",
+        "msg",
+        "args",
+        "pathname",
+        "funcName",
+        "lineno",
+        "exc_info",
+        "created",
+        "process",
+        "thread",
+        "context",
+        "_created_ns",
+        "_current_thread",
+        "_msecs",
+        "_process_name",
+        "_thread_name",
+        "_exc_text",
+        "_formatted",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        level: int,
+        msg: "MessageType",
+        pathname: str,
+        lineno: int,
+        func: str,
+        exc_info: Optional["ExcInfo"] = None,
+        thread_info: bool = True,
+        context: Optional["Context"] = None,
+    ):
+        created_ns = time_ns()
+        thread = current_thread() if thread_info else None
+
+        self.name = name
+        self.levelno = level
+        self.levelname = get_level_name(level)
+        self.msg = msg
+        self.args = None
+        self.pathname = pathname
+        self.funcName = func
+        self.lineno = lineno
+        self.exc_info = exc_info
+        self.created = created_ns / 1e9
+        self.process = _PID
+        self.thread = thread.ident if thread_info else None
+        self.context = context
+
+        self._created_ns = created_ns
+        self._current_thread = thread
+        self._msecs = _UNSET
+        self._process_name = _UNSET
+        self._thread_name = _UNSET
+        self._exc_text = _UNSET
+        self._formatted = None
+
+    @property
+    def msecs(self) -> float:
+        if self._msecs is _UNSET:
+            self._msecs = (self._created_ns % 1_000_000_000) // 1_000_000 + 0.0
+        return self._msecs
+
+    @property
+    def processName(self) -> Optional[str]:
+        if self._process_name is _UNSET:
+            self._process_name = "MainProcess"
+            if (mp := sys.modules.get("multiprocessing")) is not None:
+                try:
+                    self._process_name = mp.current_process().name
+                except Exception:  # noqa
+                    ...
+        return self._process_name
+
+    @property
+    def threadName(self) -> Optional[str]:
+        if self._thread_name is _UNSET:
+            thread = self._current_thread
+            self._thread_name = None if thread is None else thread.name
+        return self._thread_name
+
+    @property
+    def exc_text(self) -> Optional[str]:
+        if self._exc_text is _UNSET:
+            if self.exc_info is None:
+                self._exc_text = None
+            else:
+                self._exc_text = render_traceback(self.exc_info[1])
+        return self._exc_text
+
+    @exc_text.setter
+    def exc_text(self, value: Optional[str]):
+        self._exc_text = value
+
+    def getMessage(self):
+        return str(self.msg)
+
+    def __repr__(self):
+        return (
+            f"<LogRecord: {self.name}, {self.levelno}, {self.pathname}, "
+            f"{self.lineno}, {self.msg!r}>"
+        )
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from threading import Lock as ThreadLock
+from traceback import format_exception
+from typing import Hashable, Optional
+
+from .conf import settings
+
+_TRUNCATED = "[... truncated]\n"
+
+
+@dataclass
+class TracebackStats:
+    hits: int = 0
+    misses: int = 0
+
+
+# NOTE: Rendered tracebacks by signature, the least recently used ones first
+_cache: dict[Hashable, str] = dict()
+_cache_lock = ThreadLock()
+stats = TracebackStats()
+
+
+def _safe_str(exc: BaseException):
+    try:
+        return str(exc)
+    except Exception:  # noqa
+        return "<exception str() failed>"
+
+
+def traceback_signature(exc: BaseException):
+    # NOTE: Two exceptions render to the same text when every exception in their chains
+    # has the same type and message, and was raised through the same lines of the same
+    # code. That's what the signature is made of, without rendering anything.
+    signature, seen = [], set()
+    pending: list[Optional[BaseException]] = [exc]
+
+    while pending:
+        if (current := pending.pop()) is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        frames, tb = [], current.__traceback__
+        while tb is not None:
+            frames.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+
+        signature.append((type(current), _safe_str(current), tuple(frames)))
+        pending.append(current.__cause__)
+        if not current.__suppress_context__:
+            pending.append(current.__context__)
+        if isinstance(current, BaseExceptionGroup):
+            pending.extend(current.exceptions)
+
+    return tuple(signature)
+
+
+def _render(exc: BaseException, limit: Optional[int], max_size: int):
+    text = "".join(format_exception(exc, limit=limit, chain=True))
+    if len(text) <= max_size:
+        return text
+
+    # NOTE: The end of a traceback is what tells where it was raised, so that's what
+    # is kept, starting at a whole line
+    tail = text[len(text) - max_size :]
+    if (newline := tail.find("\n")) != -1:
+        tail = tail[newline + 1 :]
+    return _TRUNCATED + tail
+
+
+def _key(exc: BaseException):
+    limits = (settings.TRACEBACK_LIMIT, settings.TRACEBACK_MAX_SIZE)
+    return limits, traceback_signature(exc)
+
+
+def _lookup(key: Hashable):
+    with _cache_lock:
+        if (text := _cache.pop(key, None)) is not None:
+            _cache[key] = text
+            stats.hits += 1
+        return text
+
+
+def cached_traceback(exc: BaseException):
+    # NOTE: Returns the text of an exception rendered before, or None
+    return _lookup(_key(exc))
+
+
+def render_traceback(exc: BaseException):
+    if (text := _lookup(key := _key(exc))) is not None:
+        return text
+
+    # NOTE: Rendering happens outside of the lock, at worst the same traceback is
+    # rendered twice at once
+    text = _render(exc, settings.TRACEBACK_LIMIT, settings.TRACEBACK_MAX_SIZE)
+    with _cache_lock:
+        stats.misses += 1
+        if settings.TRACEBACK_CACHE_SIZE > 0:
+            _cache[key] = text
+            while len(_cache) > settings.TRACEBACK_CACHE_SIZE:
+                del _cache[next(iter(_cache))]
+    return text
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+        stats.hits = stats.misses = 0
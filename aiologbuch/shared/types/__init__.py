@@ -8,6 +8,8 @@ from .general import (  # noqa
     StreamBackendType,
     SyncStreamBackendType,
     AsyncStreamBackendType,
+    OverflowPolicy,
+    JsonEncoderType,
 )
 from .filters import FilterProtocol  # noqa
 from .records import LogRecordProtocol  # noqa
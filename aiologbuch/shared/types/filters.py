@@ -8,6 +8,13 @@ class FilterProtocol(Protocol):
     def filter(self, level: int) -> bool:
         ...
 
+    def enabled_for(self, level: int) -> bool:
+        ...
+
+    @property
+    def is_static(self) -> bool:
+        ...
+
     @property
     def level(self) -> int:
         ...
@@ -1,9 +1,29 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Hashable, Protocol
 
 if TYPE_CHECKING:
     from .records import LogRecordProtocol
 
 
 class FormatterProtocol(Protocol):
+    @property
+    def fields(self) -> tuple[str, ...]:
+        ...
+
+    @property
+    def needs_caller(self) -> bool:
+        ...
+
+    @property
+    def needs_thread(self) -> bool:
+        ...
+
+    @property
+    def needs_traceback(self) -> bool:
+        ...
+
+    @property
+    def cache_key(self) -> Hashable:
+        ...
+
     def format(self, record: "LogRecordProtocol") -> bytes:
         ...
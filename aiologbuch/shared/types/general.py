@@ -9,6 +9,12 @@ type SyncMode = Literal["sync"]
 type IOMode = AsyncMode | SyncMode
 
 
-type StreamBackendType = Literal["thread", "aiofile", "sync"]
-type AsyncStreamBackendType = Literal["thread", "aiofile"]
+type StreamBackendType = Literal["thread", "aiofile", "writer", "sync"]
+type AsyncStreamBackendType = Literal["thread", "aiofile", "writer"]
 type SyncStreamBackendType = Literal["sync"]
+
+
+type OverflowPolicy = Literal["block", "drop_newest", "drop_oldest", "drop_below_level"]
+
+
+type JsonEncoderType = Literal["stdlib"]
@@ -1,10 +1,14 @@
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from .formatters import FormatterProtocol
     from .records import LogRecordProtocol
 
 
 class AsyncHandlerProtocol(Protocol):
+    formatter: "FormatterProtocol"
+    blocking: bool
+
     async def handle(self, record: "LogRecordProtocol") -> None:
         ...
 
@@ -13,6 +17,8 @@ class AsyncHandlerProtocol(Protocol):
 
 
 class SyncHandlerProtocol(Protocol):
+    formatter: "FormatterProtocol"
+
     def handle(self, record: "LogRecordProtocol") -> None:
         ...
 
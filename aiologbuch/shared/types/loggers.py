@@ -1,7 +1,10 @@
-from typing import TYPE_CHECKING, Protocol, Self
+from typing import TYPE_CHECKING, Any, Protocol, Self
 
 if TYPE_CHECKING:
+    from aiologbuch.shared.metrics import LoggerMetrics
+
     from .filters import FilterProtocol
+    from .records import LogRecordProtocol
 
 
 class BaseLoggerProtocol(Protocol):
@@ -9,8 +12,18 @@ class BaseLoggerProtocol(Protocol):
 
     def _add_handler[T](self, handler: T) -> None: ...
 
+    def _set_caller_info(self, enabled: bool) -> None: ...
+
+    @property
+    def metrics(self) -> "LoggerMetrics": ...
+
+    @property
+    def handlers(self) -> tuple[Any, ...]: ...
+
 
 class AsyncLoggerProtocol(BaseLoggerProtocol):
+    async def _handle(self, record: "LogRecordProtocol") -> None: ...
+
     async def _disable(self) -> None: ...
 
 
@@ -1,6 +1,8 @@
-from typing import TYPE_CHECKING, Optional, Protocol
+from typing import TYPE_CHECKING, Hashable, Optional, Protocol
 
 if TYPE_CHECKING:
+    from aiologbuch.shared.context import Context
+
     from .general import MessageType
 
 
@@ -19,3 +21,5 @@ class LogRecordProtocol(Protocol):
     lineno: int
     exc_text: Optional[str]
     msg: "MessageType"
+    context: Optional["Context"]
+    _formatted: Optional[dict[Hashable, bytes]]
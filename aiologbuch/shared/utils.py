@@ -1,11 +1,13 @@
-from asyncio import Lock, get_running_loop
+from asyncio import get_running_loop
 from contextlib import contextmanager
 from functools import partial, wraps
-from typing import Awaitable, Callable
+from typing import TYPE_CHECKING, Awaitable, Callable
 
+from anyio import run
 from anyio.from_thread import start_blocking_portal
 
-from .exceptions import WouldDeadlock
+if TYPE_CHECKING:
+    from .locks import HybridLock
 
 
 def _thread_has_event_loop():
@@ -17,24 +19,11 @@ def _thread_has_event_loop():
 
 
 @contextmanager
-def sync_lock_context(lock: Lock):
-    # NOTE: This if check is to prevent the deadlock that would happen in high
-    # concurrent scenarios with many coroutines acquiring and releasing the lock
-    # alongside sync logger calls, should the user mix sync logging with async logging.
-    if _thread_has_event_loop() and lock.locked():
-        raise WouldDeadlock()
-
-    # TODO: Check the following case:
-    # No event loop and lock is locked. Use a generator to yield control but with the
-    # lock being held by it. The other case would be multi threading environment, but
-    # that'd be safe because the GIL would be released by the waiting thread, leaving
-    # room for the thread that is holding the lock to release it.
-    if (not _thread_has_event_loop()) and (lock.locked()):
-        ...
-
-    with start_blocking_portal() as portal:
-        portal.call(lock.acquire)
-
+def sync_lock_context(lock: "HybridLock"):
+    # NOTE: Should the lock be held by a coroutine running in this same thread, this
+    # raises 'WouldDeadlock' instead of blocking its event loop forever. That can only
+    # happen if the user mixes sync logging with async logging.
+    lock.acquire()
     try:
         yield
     finally:
@@ -45,6 +34,13 @@ def syncify[R, **Spec](function: Callable[Spec, Awaitable[R]]):
     @wraps(function)
     def _actual_decorator(*args: Spec.args, **kwargs: Spec.kwargs) -> R:
         func = partial(function, *args, **kwargs)
+
+        # NOTE: Without an event loop in this thread (e.g. in the 'atexit' hooks) the
+        # coroutine can simply be run here. A portal, which spins up a new thread, is
+        # only needed when blocking this thread would block its running event loop.
+        if not _thread_has_event_loop():
+            return run(func)
+
         with start_blocking_portal() as portal:
             return portal.call(func)
 
@@ -0,0 +1,196 @@
+import sys
+from asyncio import CancelledError, Task, get_running_loop, sleep
+from dataclasses import dataclass
+from threading import Lock as ThreadLock
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from anyio.to_thread import run_sync
+
+from .conf import settings
+from .metrics import Histogram, handler_target
+
+
+@dataclass
+class Offender:
+    handler: str
+    target: str
+    formatter: str
+    calls: int = 0
+    blocked: float = 0.0
+    worst: float = 0.0
+    max_size: int = 0
+
+    def snapshot(self):
+        return {
+            "handler": self.handler,
+            "target": self.target,
+            "formatter": self.formatter,
+            "calls": self.calls,
+            "blocked": self.blocked,
+            "worst": self.worst,
+            "max_size": self.max_size,
+        }
+
+
+class _Registry:
+    # NOTE: Handlers check this on every record, so when no watchdog runs, watching
+    # them costs a single attribute lookup
+    active: Optional["LoopWatchdog"] = None
+
+
+registry = _Registry()
+
+
+class LoopWatchdog:
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.005,
+        report_interval: Optional[float] = 60.0,
+        top: int = 5,
+        report: Optional[Callable[[dict[str, Any]], Any]] = None,
+    ):
+        if interval <= 0 or threshold <= 0:
+            raise ValueError("interval and threshold must be positive")
+
+        self._interval = interval
+        self._threshold = threshold
+        self._report_interval = report_interval
+        self._top = top
+        self._report = report
+        self._task: Optional[Task] = None
+        self._lock = ThreadLock()
+        self.reset()
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @property
+    def running(self):
+        return self._task is not None
+
+    def reset(self):
+        with self._lock:
+            self._lag = Histogram()
+            self._max_lag = 0.0
+            self._stalls = 0
+            self._stalled = 0.0
+            self._logging_in_stalls = 0.0
+            self._logging = 0.0
+            self._offenders: dict[tuple[str, str, str], Offender] = dict()
+
+    def observe(self, handler: object, size: int, blocked: float):
+        # NOTE: Called by handlers with the time they kept the event loop from running
+        # anything else while handling a record
+        self._logging += blocked
+        if blocked < self._threshold:
+            return
+
+        formatter = type(getattr(handler, "formatter", None)).__name__
+        key = (type(handler).__name__, handler_target(handler), formatter)
+        with self._lock:
+            if (offender := self._offenders.get(key)) is None:
+                offender = self._offenders[key] = Offender(*key)
+            offender.calls += 1
+            offender.blocked += blocked
+            offender.worst = max(offender.worst, blocked)
+            offender.max_size = max(offender.max_size, size)
+
+    def snapshot(self):
+        with self._lock:
+            offenders = sorted(
+                self._offenders.values(), key=lambda o: o.blocked, reverse=True
+            )
+            return {
+                "lag": self._lag.snapshot(),
+                "max_lag": self._max_lag,
+                "stalls": self._stalls,
+                "stalled": self._stalled,
+                "logging_in_stalls": self._logging_in_stalls,
+                "offenders": [o.snapshot() for o in offenders[: self._top]],
+            }
+
+    async def start(self):
+        if registry.active is not None:
+            raise RuntimeError("A watchdog is already running")
+
+        registry.active = self
+        self._task = get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if (task := self._task) is None:
+            return
+
+        self._task = None
+        if registry.active is self:
+            registry.active = None
+        task.cancel()
+        try:
+            await task
+        except CancelledError:
+            pass
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def _run(self):
+        last_report = perf_counter()
+        while True:
+            start, logged = perf_counter(), self._logging
+            await sleep(self._interval)
+            now = perf_counter()
+
+            # NOTE: How late the loop woke this task up is how long something else held
+            # it. The logging time of the same interval tells how much of it was spent
+            # by handlers, either as part of that stall or around it.
+            lag = max(0.0, now - start - self._interval)
+            with self._lock:
+                self._lag.observe(lag)
+                self._max_lag = max(self._max_lag, lag)
+                if lag >= self._threshold:
+                    self._stalls += 1
+                    self._stalled += lag
+                    self._logging_in_stalls += min(lag, self._logging - logged)
+
+            if self._report_interval and now - last_report >= self._report_interval:
+                last_report = now
+                if self._report is None:
+                    await _write_report(self.snapshot())
+                else:
+                    self._report(self.snapshot())
+
+
+def format_report(snapshot: dict[str, Any]):
+    lines = [
+        f"aiologbuch watchdog: {snapshot['stalls']} stalls, "
+        f"{snapshot['stalled'] * 1_000:.1f}ms stalled, "
+        f"{snapshot['logging_in_stalls'] * 1_000:.1f}ms of it logging, "
+        f"worst lag {snapshot['max_lag'] * 1_000:.1f}ms"
+    ]
+    for offender in snapshot["offenders"]:
+        target = f" ({offender['target']})" if offender["target"] else ""
+        lines.append(
+            f"  {offender['handler']}{target} with {offender['formatter']}: "
+            f"{offender['calls']} slow calls, {offender['blocked'] * 1_000:.1f}ms "
+            f"blocked, worst {offender['worst'] * 1_000:.1f}ms, "
+            f"largest record {offender['max_size']} bytes"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _write(report: str):
+    sys.stderr.write(report)
+    sys.stderr.flush()
+
+
+async def _write_report(snapshot: dict[str, Any]):
+    # NOTE: Same as the handler errors, the report goes to stderr under the global lock,
+    # so it never lands in the middle of a record written by a stderr handler
+    async with settings.GLOBAL_STDERR_LOCK:
+        await run_sync(_write, format_report(snapshot))
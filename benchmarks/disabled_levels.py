@@ -0,0 +1,66 @@
+import asyncio
+import sys
+from functools import partial
+from time import perf_counter
+
+from aiologbuch.loggers import AsyncLogger, SyncLogger
+from aiologbuch.shared.filters import Filter
+from aiologbuch.shared.levels import LogLevel
+
+CALLS = 1_000_000
+
+
+def _empty(msg):
+    return None
+
+
+async def _empty_coroutine(msg):
+    return None
+
+
+def _measure(call):
+    for _ in range(10_000):  # NOTE: Warm up
+        call("hello world")
+
+    start = perf_counter()
+    for _ in range(CALLS):
+        call("hello world")
+    return perf_counter() - start
+
+
+async def _ameasure(call):
+    for _ in range(10_000):  # NOTE: Warm up
+        await call("hello world")
+
+    start = perf_counter()
+    for _ in range(CALLS):
+        await call("hello world")
+    return perf_counter() - start
+
+
+def main():
+    sync_logger = SyncLogger(name="benchmarks", filter_=Filter(level=LogLevel.INFO))
+    async_logger = AsyncLogger(name="benchmarks", filter_=Filter(level=LogLevel.INFO))
+
+    # NOTE: The methods of the classes still check the filter on every call, as every
+    # level did before being bound to a no-op
+    results = {
+        "empty function": _measure(_empty),
+        "sync debug": _measure(sync_logger.debug),
+        "sync debug, unspecialized": _measure(partial(SyncLogger.debug, sync_logger)),
+        "empty coroutine": asyncio.run(_ameasure(_empty_coroutine)),
+        "async debug": asyncio.run(_ameasure(async_logger.debug)),
+        "async debug, unspecialized": asyncio.run(
+            _ameasure(partial(AsyncLogger.debug, async_logger))
+        ),
+    }
+
+    for name, elapsed in results.items():
+        sys.stdout.write(
+            f"{name}: {CALLS} calls in {elapsed:.3f}s -> "
+            f"{elapsed / CALLS * 1e9:.1f}ns/call\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+from aiologbuch import get_logger
+
+RECORDS = 20_000
+
+
+async def _run():
+    logger = get_logger(name="benchmarks.fanout")
+
+    for _ in range(1_000):  # NOTE: Warm up
+        await logger.info("hello world")
+
+    start = perf_counter()
+    for _ in range(RECORDS):
+        await logger.info("hello world")
+    return perf_counter() - start
+
+
+def main():
+    # NOTE: The stderr handlers write straight to fd 2, so it is pointed to /dev/null
+    # while measuring and restored before printing the results.
+    saved = os.dup(2)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 2)
+    try:
+        elapsed = asyncio.run(_run())
+    finally:
+        os.dup2(saved, 2)
+
+    sys.stdout.write(
+        f"{RECORDS} records in {elapsed:.3f}s -> "
+        f"{elapsed / RECORDS * 1e6:.2f}us/record, {RECORDS / elapsed:.0f} records/s\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
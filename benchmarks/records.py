@@ -0,0 +1,78 @@
+import logging
+import sys
+import tracemalloc
+from time import perf_counter
+
+from aiologbuch.shared.records import LogRecord
+
+RECORDS = 100_000
+
+
+def _stdlib_record():
+    return logging.LogRecord(
+        name="benchmarks",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        msg="hello world",
+        args=None,
+        exc_info=None,
+        func="_stdlib_record",
+    )
+
+
+def _aiologbuch_record():
+    return LogRecord(
+        name="benchmarks",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        msg="hello world",
+        func="_aiologbuch_record",
+    )
+
+
+def _time_per_record(factory):
+    for _ in range(1_000):  # NOTE: Warm up
+        factory()
+
+    start = perf_counter()
+    for _ in range(RECORDS):
+        factory()
+    return (perf_counter() - start) / RECORDS
+
+
+def _memory_per_record(factory):
+    # NOTE: Records are kept alive so the blocks and bytes they hold can be counted
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    size_before, _ = tracemalloc.get_traced_memory()
+
+    records = [factory() for _ in range(RECORDS)]
+
+    size_after, _ = tracemalloc.get_traced_memory()
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+
+    del records
+    return (
+        (blocks_after - blocks_before) / RECORDS,
+        (size_after - size_before) / RECORDS,
+    )
+
+
+def main():
+    for name, factory in [
+        ("logging.LogRecord", _stdlib_record),
+        ("aiologbuch LogRecord", _aiologbuch_record),
+    ]:
+        elapsed = _time_per_record(factory)
+        blocks, size = _memory_per_record(factory)
+        sys.stdout.write(
+            f"{name}: {elapsed * 1e6:.2f}us/record, {blocks:.1f} blocks/record, "
+            f"{size:.0f} bytes/record\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import asyncio
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from aiologbuch.handlers import AsyncFileHandler, AsyncRingHandler
+from aiologbuch.handlers.file.backends import aopen
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.levels import LogLevel
+
+RECORDS = 20_000
+MESSAGE = b'{"timestamp": "2024-01-01T00:00:00.000Z", "message": "hello world"}\n'
+CASES = ("ring", "thread", "aiofile", "writer")
+
+
+async def _measure(handler):
+    for _ in range(1_000):  # NOTE: Warm up
+        await handler.write_and_flush(MESSAGE, LogLevel.INFO)
+
+    # NOTE: The latency of a single call is what matters here, so they're awaited one
+    # after the other, as a logger with a single handler would do
+    start = perf_counter()
+    for _ in range(RECORDS):
+        await handler.write_and_flush(MESSAGE, LogLevel.INFO)
+    elapsed = perf_counter() - start
+
+    await handler.close()
+    return elapsed
+
+
+def _run_case(case: str):
+    with TemporaryDirectory() as directory:
+        if case == "ring":
+            settings.configure()
+            handler = AsyncRingHandler(filename=f"{directory}/app.ring", formatter=None)
+        else:
+            settings.configure(stream_backend=case)
+            handler = AsyncFileHandler(filename=f"{directory}/app.log", formatter=None)
+
+        elapsed = asyncio.run(_measure(handler))
+
+    sys.stdout.write(
+        f"{case}: {RECORDS} records in {elapsed:.3f}s -> "
+        f"{elapsed / RECORDS * 1e6:.2f}us/record\n"
+    )
+
+
+def main():
+    if len(sys.argv) > 1:
+        return _run_case(sys.argv[1])
+
+    # NOTE: Settings can only be configured once, so every backend runs in a process
+    # of its own
+    for case in CASES:
+        if case == "aiofile" and aopen is None:
+            sys.stdout.write("aiofile: skipped, it's not installed\n")
+            continue
+
+        sys.stdout.flush()
+        subprocess.run([sys.executable, "-m", "benchmarks.ring", case], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from tempfile import TemporaryDirectory
+from time import perf_counter, perf_counter_ns
+from typing import Optional
+
+from aiologbuch.formatters import JsonFormatter, LineFormatter
+from aiologbuch.handlers import (
+    AsyncFileHandler,
+    AsyncStderrHandler,
+    SyncFileHandler,
+    SyncStderrHandler,
+)
+from aiologbuch.handlers.file.backends import aopen
+from aiologbuch.loggers import AsyncLogger, SyncLogger
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.filters import Filter
+from aiologbuch.shared.levels import LogLevel
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+RECORDS = 20_000
+CONCURRENCY = 100
+MESSAGE = "hello world"
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+@dataclass(frozen=True)
+class Case:
+    logger: str  # NOTE: 'sync', 'async' or 'stdlib'
+    formatter: str
+    handler: str
+    backend: Optional[str] = None
+    loop: Optional[str] = None
+    concurrency: int = 1
+
+    @property
+    def name(self):
+        parts = [self.logger, self.formatter, self.handler, self.backend, self.loop]
+        if self.logger == "async":
+            parts.append(f"x{self.concurrency}")
+        return "/".join(part for part in parts if part)
+
+
+def all_cases(concurrency: int = CONCURRENCY):
+    cases = []
+    for formatter in ("json", "line"):
+        cases.append(Case(logger="stdlib", formatter=formatter, handler="stderr"))
+        cases.append(Case(logger="stdlib", formatter=formatter, handler="file"))
+        cases.append(Case(logger="sync", formatter=formatter, handler="stderr"))
+        cases.append(
+            Case(logger="sync", formatter=formatter, handler="file", backend="sync")
+        )
+
+        for loop in ("asyncio", "uvloop"):
+            for tasks in (1, concurrency):
+                options = dict(formatter=formatter, loop=loop, concurrency=tasks)
+                cases.append(Case(logger="async", handler="stderr", **options))
+                for backend in ("thread", "aiofile", "writer"):
+                    cases.append(
+                        Case(logger="async", handler="file", backend=backend, **options)
+                    )
+    return cases
+
+
+def _skip_reason(case: Case):
+    if case.loop == "uvloop" and uvloop is None:
+        return "uvloop is not installed"
+    if case.backend == "aiofile" and aopen is None:
+        return "aiofile is not installed"
+    return None
+
+
+class _StdlibJsonFormatter(logging.Formatter):
+    # NOTE: The closest stdlib equivalent of 'JsonFormatter', for a fair comparison
+    def format(self, record: logging.LogRecord):
+        return json.dumps(
+            {
+                "timestamp": self.formatTime(record),
+                "level": record.levelname,
+                "process_id": record.process,
+                "process_name": record.processName,
+                "thread_id": record.thread,
+                "thread_name": record.threadName,
+                "name": record.name,
+                "filename": record.pathname,
+                "function_name": record.funcName,
+                "line_number": record.lineno,
+                "traceback": record.exc_text,
+                "message": record.getMessage(),
+            }
+        )
+
+
+def _formatter(case: Case):
+    if case.logger == "stdlib":
+        if case.formatter == "json":
+            return _StdlibJsonFormatter()
+        return logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+    return JsonFormatter() if case.formatter == "json" else LineFormatter()
+
+
+def _stdlib_logger(case: Case, filename: str):
+    logger = logging.getLogger("benchmarks.suite")
+    if case.handler == "file":
+        handler = logging.FileHandler(filename)
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(_formatter(case))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger, handler.close
+
+
+def _sync_logger(case: Case, filename: str):
+    logger = SyncLogger(name="benchmarks.suite", filter_=Filter(level=LogLevel.INFO))
+    if case.handler == "file":
+        handler = SyncFileHandler(filename=filename, formatter=_formatter(case))
+    else:
+        handler = SyncStderrHandler(formatter=_formatter(case))
+    logger._add_handler(handler)
+    return logger, handler.close
+
+
+def _async_logger(case: Case, filename: str):
+    logger = AsyncLogger(name="benchmarks.suite", filter_=Filter(level=LogLevel.INFO))
+    if case.handler == "file":
+        handler = AsyncFileHandler(filename=filename, formatter=_formatter(case))
+    else:
+        handler = AsyncStderrHandler(formatter=_formatter(case))
+    logger._add_handler(handler)
+    return logger, handler.close
+
+
+def _measure_sync(log, records: int):
+    for _ in range(min(records // 10, 1_000)):  # NOTE: Warm up
+        log(MESSAGE)
+
+    latencies = [0] * records
+    start = perf_counter()
+    for i in range(records):
+        call_start = perf_counter_ns()
+        log(MESSAGE)
+        latencies[i] = perf_counter_ns() - call_start
+    return perf_counter() - start, latencies
+
+
+async def _measure_async(log, records: int, concurrency: int):
+    for _ in range(min(records // 10, 1_000)):  # NOTE: Warm up
+        await log(MESSAGE)
+
+    async def _worker(count: int):
+        latencies = [0] * count
+        for i in range(count):
+            call_start = perf_counter_ns()
+            await log(MESSAGE)
+            latencies[i] = perf_counter_ns() - call_start
+        return latencies
+
+    # NOTE: The records are split between the coroutines, which log all at once
+    counts = [records // concurrency] * concurrency
+    counts[0] += records - sum(counts)
+
+    start = perf_counter()
+    results = await asyncio.gather(*[_worker(count) for count in counts])
+    return perf_counter() - start, [
+        value for latencies in results for value in latencies
+    ]
+
+
+def _percentile(values: list[int], percentile: float):
+    index = min(len(values) - 1, int(len(values) * percentile / 100))
+    return values[index]
+
+
+def run_case(case: Case, records: int):
+    if case.backend and case.logger == "async":
+        settings.configure(stream_backend=case.backend)
+    else:
+        settings.configure()
+
+    with TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "app.log")
+
+        if case.logger == "stdlib":
+            logger, close = _stdlib_logger(case, filename)
+            elapsed, latencies = _measure_sync(logger.info, records)
+            close()
+        elif case.logger == "sync":
+            logger, close = _sync_logger(case, filename)
+            elapsed, latencies = _measure_sync(logger.info, records)
+            close()
+        else:
+            logger, close = _async_logger(case, filename)
+
+            async def _run():
+                result = await _measure_async(logger.info, records, case.concurrency)
+                await close()
+                return result
+
+            loop_factory = uvloop.new_event_loop if case.loop == "uvloop" else None
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                elapsed, latencies = runner.run(_run())
+
+    latencies.sort()
+    return {
+        "name": case.name,
+        "case": asdict(case),
+        "records": records,
+        "elapsed": elapsed,
+        "records_per_second": records / elapsed,
+        "latency_us": {
+            f"p{percentile:g}": _percentile(latencies, percentile) / 1_000
+            for percentile in PERCENTILES
+        }
+        | {"max": latencies[-1] / 1_000},
+    }
+
+
+def _run_in_process(case: Case, records: int):
+    # NOTE: Settings can only be configured once, and every case should start from a
+    # clean process anyway, so each of them runs in a process of its own. Its stderr is
+    # a pipe read by this process, as it would be under a supervisor or a container
+    # runtime (uvloop can't open a pipe transport on /dev/null either). The result
+    # comes back through stdout.
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.suite",
+            "--case",
+            json.dumps(asdict(case)),
+            "--records",
+            str(records),
+        ],
+        capture_output=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"{case.name} failed with exit code {process.returncode}:\n"
+            f"{process.stderr[-2_000:].decode(errors='replace')}"
+        )
+    return json.loads(process.stdout)
+
+
+def _environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+        "uvloop": getattr(uvloop, "__version__", None),
+    }
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measures every logger, formatter, handler and backend combination",
+    )
+    parser.add_argument("--records", type=int, default=RECORDS)
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument(
+        "--only", action="append", default=[], help="Runs the cases containing this"
+    )
+    parser.add_argument("--output", help="Writes the JSON results to this file")
+    parser.add_argument(
+        "--baseline", help="Compares the throughput with the results in this file"
+    )
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        result = run_case(Case(**json.loads(args.case)), args.records)
+        sys.stdout.write(json.dumps(result))
+        return 0
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = {item["name"]: item for item in json.load(file)["results"]}
+
+    results, skipped = [], []
+    for case in all_cases(concurrency=args.concurrency):
+        if args.only and not any(only in case.name for only in args.only):
+            continue
+
+        if reason := _skip_reason(case):
+            skipped.append({"name": case.name, "reason": reason})
+            continue
+
+        result = _run_in_process(case, args.records)
+        results.append(result)
+        line = (
+            f"{result['name']}: {result['records_per_second']:,.0f} records/s, "
+            f"p50 {result['latency_us']['p50']:.2f}us, "
+            f"p99 {result['latency_us']['p99']:.2f}us"
+        )
+        if (previous := baseline.get(result["name"])) is not None:
+            change = result["records_per_second"] / previous["records_per_second"] - 1
+            line += f" ({change:+.1%} records/s)"
+        sys.stderr.write(line + "\n")
+
+    report = json.dumps(
+        {"environment": _environment(), "results": results, "skipped": skipped},
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import logging
+import os
+import sys
+from time import perf_counter
+
+from aiologbuch import get_logger
+
+RECORDS = 20_000
+
+
+def _measure(log: "logging.Logger"):
+    for _ in range(1_000):  # NOTE: Warm up
+        log.info("hello world")
+
+    start = perf_counter()
+    for _ in range(RECORDS):
+        log.info("hello world")
+    return perf_counter() - start
+
+
+def _stdlib_logger():
+    logger = logging.getLogger("benchmarks.sync_logger.stdlib")
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def main():
+    # NOTE: The stderr handlers write straight to fd 2, so it is pointed to /dev/null
+    # while measuring and restored before printing the results.
+    saved = os.dup(2)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 2)
+    try:
+        results = {
+            "aiologbuch": _measure(get_logger(name="benchmarks.sync", kind="sync")),
+            "logging": _measure(_stdlib_logger()),
+        }
+    finally:
+        os.dup2(saved, 2)
+
+    for name, elapsed in results.items():
+        sys.stdout.write(
+            f"{name}: {RECORDS} records in {elapsed:.3f}s -> "
+            f"{elapsed / RECORDS * 1e6:.2f}us/record\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
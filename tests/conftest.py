@@ -0,0 +1,63 @@
+import asyncio
+import json
+from time import sleep
+
+from pytest import fixture
+
+from aiologbuch.formatters import LineFormatter
+from aiologbuch.handlers.base import BaseAsyncHandler, BaseSyncHandler
+
+
+class StubSyncHandler(BaseSyncHandler):
+    def __init__(self, formatter=None, fail: bool = False, write_time: float = 0):
+        super().__init__(formatter=formatter or LineFormatter("{message}"))
+        self.fail = fail
+        self.write_time = write_time
+        self.messages = []
+
+    @property
+    def lines(self):
+        # NOTE: The JSON encoders double every backslash
+        return [json.loads(msg.replace(b"\\\\", b"\\")) for msg in self.messages]
+
+    def write_and_flush(self, msg: bytes, level: int):
+        if self.fail:
+            raise OSError("disk full")
+        if self.write_time:
+            sleep(self.write_time)
+        self.messages.append(msg)
+
+    def close(self): ...
+
+
+class StubAsyncHandler(BaseAsyncHandler):
+    filename = "app.log"
+
+    def __init__(self, formatter=None, blocking: bool = True, write_time: float = 0):
+        super().__init__(formatter=formatter or LineFormatter("{message}"))
+        self.blocking = blocking
+        self.write_time = write_time
+        self.messages = []
+
+    @property
+    def lines(self):
+        return [json.loads(msg.replace(b"\\\\", b"\\")) for msg in self.messages]
+
+    async def write_and_flush(self, msg: bytes, level: int):
+        if self.blocking:
+            await asyncio.sleep(self.write_time)
+        else:
+            sleep(self.write_time)
+        self.messages.append(msg)
+
+    async def close(self): ...
+
+
+@fixture
+def sync_handler():
+    return StubSyncHandler
+
+
+@fixture
+def async_handler():
+    return StubAsyncHandler
@@ -0,0 +1,55 @@
+from asyncio import gather
+
+from pytest import MonkeyPatch, mark, raises
+
+from aiologbuch.handlers.file.backends import get_stream_backend
+from aiologbuch.shared.conf import settings
+
+
+@mark.unit
+def test_get_stream_backend_rejects_unknown_backends():
+    with raises(ValueError) as exc_info:
+        get_stream_backend("unknown")  # type: ignore
+
+    assert str(exc_info.value) == "Unsupported stream backend: 'unknown'"
+
+
+@mark.unit
+async def test_writer_backend_writes_everything_before_closing(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    backend = get_stream_backend("writer")(filename=filename)
+
+    await backend.open()
+    messages = [f"line {i}\n".encode() for i in range(1_000)]
+    await gather(*[backend.send(msg) for msg in messages])
+    await backend.close()
+
+    with open(filename, "rb") as file:
+        assert file.read() == b"".join(messages)
+
+
+@mark.unit
+async def test_writer_backend_waits_for_durable_writes(
+    tmp_path, monkeypatch: MonkeyPatch
+):
+    settings.configure()
+    monkeypatch.setattr(settings, "DURABLE_WRITES", True)
+    filename = str(tmp_path / "app.log")
+    backend = get_stream_backend("writer")(filename=filename)
+
+    await backend.open()
+    await backend.send(b"durable\n")
+
+    with open(filename, "rb") as file:
+        assert file.read() == b"durable\n"
+
+    await backend.close()
+
+
+@mark.unit
+async def test_writer_backend_requires_open(tmp_path):
+    backend = get_stream_backend("writer")(filename=str(tmp_path / "app.log"))
+
+    with raises(RuntimeError):
+        await backend.send(b"nope\n")
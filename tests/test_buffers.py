@@ -0,0 +1,122 @@
+import asyncio
+from asyncio import create_task, sleep
+from threading import Thread
+
+from pytest import mark, raises
+
+from aiologbuch.shared.buffers import BufferStats, OverflowBuffer
+from aiologbuch.shared.levels import LogLevel
+
+
+async def _fill(buffer: OverflowBuffer[str], count: int, level: int = LogLevel.INFO):
+    return [await buffer.put(f"item-{i}", level) for i in range(count)]
+
+
+@mark.unit
+async def test_drop_newest_discards_the_incoming_items():
+    buffer = OverflowBuffer[str](max_size=2, policy="drop_newest")
+
+    assert await _fill(buffer, 4) == [True, True, False, False]
+    assert buffer.get_all_nowait() == ["item-0", "item-1"]
+    assert buffer.stats.dropped == 2
+    assert buffer.stats.delayed == 0
+
+
+@mark.unit
+async def test_drop_oldest_discards_the_buffered_items():
+    buffer = OverflowBuffer[str](max_size=2, policy="drop_oldest")
+
+    assert await _fill(buffer, 4) == [True, True, True, True]
+    assert buffer.get_all_nowait() == ["item-2", "item-3"]
+    assert buffer.stats.dropped == 2
+
+
+@mark.unit
+async def test_block_waits_for_room():
+    buffer = OverflowBuffer[str](max_size=1, policy="block")
+    await buffer.put("first", LogLevel.INFO)
+
+    putter = create_task(buffer.put("second", LogLevel.INFO))
+    await sleep(0)
+    assert not putter.done()
+
+    assert await buffer.get() == "first"
+    assert await putter
+    assert buffer.get_all_nowait() == ["second"]
+    assert buffer.stats.delayed == 1
+    assert buffer.stats.dropped == 0
+
+
+@mark.unit
+async def test_drop_below_level_only_keeps_waiting_on_important_records():
+    buffer = OverflowBuffer[str](
+        max_size=1, policy="drop_below_level", drop_level=LogLevel.WARNING
+    )
+    await buffer.put("first", LogLevel.INFO)
+
+    assert not await buffer.put("dropped", LogLevel.INFO)
+
+    putter = create_task(buffer.put("kept", LogLevel.ERROR))
+    await sleep(0)
+    assert not putter.done()
+
+    assert buffer.get_all_nowait() == ["first"]
+    assert await putter
+    assert buffer.get_all_nowait() == ["kept"]
+    assert buffer.stats.dropped == 1
+    assert buffer.stats.delayed == 1
+
+
+@mark.unit
+async def test_join_waits_for_every_item_to_be_done():
+    buffer = OverflowBuffer[str](max_size=2, policy="block")
+    await _fill(buffer, 2)
+
+    joiner = create_task(buffer.join())
+    await sleep(0)
+    assert not joiner.done()
+
+    buffer.get_all_nowait()
+    buffer.task_done(2)
+    await joiner
+
+
+@mark.unit
+def test_unknown_policies_are_rejected():
+    with raises(ValueError):
+        OverflowBuffer(max_size=1, policy="unknown")  # type: ignore
+
+    with raises(ValueError):
+        OverflowBuffer(max_size=0, policy="block")
+
+
+@mark.unit
+async def test_waiters_of_another_loop_are_woken_through_it():
+    buffer = OverflowBuffer[str](max_size=2, policy="block")
+    results, waiting = [], asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    async def _get():
+        loop.call_soon_threadsafe(waiting.set)
+        results.append(await buffer.get())
+
+    thread = Thread(target=asyncio.run, args=(_get(),))
+    thread.start()
+    await waiting.wait()
+    await sleep(0.01)
+
+    await buffer.put("item", LogLevel.INFO)
+    await asyncio.to_thread(thread.join, 5)
+
+    assert results == ["item"]
+
+
+@mark.unit
+async def test_buffers_can_share_their_stats():
+    stats = BufferStats()
+    for _ in range(2):
+        buffer = OverflowBuffer[str](max_size=1, policy="drop_newest", stats=stats)
+        await _fill(buffer, 2)
+
+    assert buffer.stats is stats
+    assert stats.dropped == 2
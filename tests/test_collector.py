@@ -0,0 +1,231 @@
+import asyncio
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+from pytest import fixture, mark, raises
+
+from aiologbuch.handlers import AsyncCollectorHandler, SyncCollectorHandler
+from aiologbuch.handlers.collector import Collector, CollectorClient
+from aiologbuch.handlers.collector.frames import FrameDecoder, encode_frame
+from aiologbuch.shared.levels import LogLevel
+
+
+class _Sink:
+    blocking = False
+
+    def __init__(self):
+        self.batches, self.levels, self.closed = [], [], False
+
+    @property
+    def data(self):
+        return b"".join(self.batches)
+
+    async def write_and_flush(self, msg: bytes, level: int):
+        self.batches.append(msg)
+        self.levels.append(level)
+
+    async def close(self):
+        self.closed = True
+
+
+@fixture
+def socket_path():
+    # NOTE: Unix socket paths are limited to about a hundred characters, which the
+    # per-test temporary directories can go over
+    with TemporaryDirectory(prefix="alb-") as directory:
+        yield os.path.join(directory, "collector.sock")
+
+
+def _messages(count: int, start: int = 0):
+    return [f"record {i:05}\n".encode() for i in range(start, start + count)]
+
+
+async def _wait_for(predicate, timeout: float = 5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise TimeoutError
+        await asyncio.sleep(0.01)
+
+
+@mark.unit
+def test_frames_are_decoded_across_reads():
+    messages = _messages(50)
+    data = b"".join(encode_frame(msg, LogLevel.INFO) for msg in messages)
+    data += encode_frame(b"boom\n", LogLevel.ERROR)
+
+    decoder, received, levels = FrameDecoder(), [], []
+    for i in range(0, len(data), 7):
+        msg, level = decoder.feed(data[i : i + 7])
+        received.append(msg)
+        levels.append(level)
+
+    assert b"".join(received) == b"".join(messages) + b"boom\n"
+    assert max(levels) == LogLevel.ERROR
+    assert decoder.pending == 0
+
+
+@mark.unit
+def test_oversized_frames_are_rejected():
+    with raises(ValueError):
+        FrameDecoder().feed(b"\xff\xff\xff\xff\x00\x00\x00\x00")
+
+
+@mark.unit
+async def test_records_reach_the_collector_handlers(socket_path):
+    sink = _Sink()
+    collector = Collector(path=socket_path, handlers=[sink])
+    await collector.start()
+
+    handler = AsyncCollectorHandler(path=socket_path, formatter=None)
+    messages = _messages(1_000)
+    for msg in messages:
+        await handler.write_and_flush(msg, LogLevel.INFO)
+    await handler.write_and_flush(b"boom\n", LogLevel.ERROR)
+
+    await handler.close()
+    await _wait_for(lambda: sink.data.endswith(b"boom\n"))
+    await collector.stop()
+
+    assert sink.data == b"".join(messages) + b"boom\n"
+    assert max(sink.levels) == LogLevel.ERROR
+    assert sink.closed
+    assert not os.path.exists(socket_path)
+
+
+@mark.unit
+async def test_records_are_buffered_until_the_collector_restarts(socket_path):
+    handler = AsyncCollectorHandler(path=socket_path, formatter=None)
+    first, second = _messages(100), _messages(100, start=100)
+
+    # NOTE: Nothing is listening yet, so records wait in the client's buffer
+    for msg in first:
+        await handler.write_and_flush(msg, LogLevel.INFO)
+    await asyncio.sleep(0.1)
+    assert len(handler._client) == len(first)
+
+    sink = _Sink()
+    collector = Collector(path=socket_path, handlers=[sink])
+    await collector.start()
+    await _wait_for(lambda: sink.data == b"".join(first))
+    await collector.stop()
+
+    # NOTE: The collector went away with the connection still open
+    for msg in second:
+        await handler.write_and_flush(msg, LogLevel.INFO)
+    await asyncio.sleep(0.1)
+
+    restarted = Collector(path=socket_path, handlers=[sink := _Sink()])
+    await restarted.start()
+    await _wait_for(lambda: sink.data.endswith(second[-1]))
+
+    await handler.close()
+    await restarted.stop()
+
+    assert sink.data == b"".join(second)
+
+
+class _SlowSink(_Sink):
+    async def write_and_flush(self, msg: bytes, level: int):
+        await asyncio.sleep(0.01)
+        await super().write_and_flush(msg, level)
+
+
+@mark.unit
+async def test_records_in_flight_are_not_lost_when_the_collector_stops(socket_path):
+    messages = _messages(50_000)
+    handler = AsyncCollectorHandler(
+        path=socket_path, formatter=None, buffer_size=len(messages)
+    )
+
+    # NOTE: The slow handler keeps the collector from reading, so records are left in
+    # the socket when it stops
+    collector = Collector(
+        path=socket_path, handlers=[sink := _SlowSink()], buffer_size=1
+    )
+    await collector.start()
+    for msg in messages:
+        await handler.write_and_flush(msg, LogLevel.INFO)
+    await _wait_for(lambda: sink.batches)
+    await collector.stop()
+
+    restarted = Collector(path=socket_path, handlers=[other := _Sink()])
+    await restarted.start()
+    await _wait_for(lambda: (sink.data + other.data).endswith(messages[-1]))
+
+    await handler.close()
+    await restarted.stop()
+
+    assert sink.data + other.data == b"".join(messages)
+
+
+@mark.unit
+def test_oldest_records_are_dropped_when_the_buffer_is_full(socket_path):
+    client = CollectorClient(path=socket_path, max_size=10)
+    for msg in _messages(25):
+        client.send(msg, LogLevel.INFO)
+
+    assert len(client) <= 10
+    assert client.stats.dropped >= 15
+
+    client.close(timeout=0.5)
+    with raises(RuntimeError):
+        client.send(b"late\n", LogLevel.INFO)
+
+
+@mark.unit
+async def test_handlers_share_the_client_of_their_process(socket_path):
+    first = SyncCollectorHandler(path=socket_path, formatter=None)
+    second = AsyncCollectorHandler(path=socket_path, formatter=None)
+
+    first.write_and_flush(b"first\n", LogLevel.INFO)
+    await second.write_and_flush(b"second\n", LogLevel.INFO)
+    assert first._client is second._client
+
+    first.close()
+    assert socket_path in first.manager.resources
+
+    await second.close()
+    assert socket_path not in first.manager.resources
+
+    with raises(ValueError):
+        SyncCollectorHandler(path="", formatter=None)
+
+
+@mark.unit
+async def test_records_from_several_processes_are_not_interleaved(socket_path):
+    sink = _Sink()
+    collector = Collector(path=socket_path, handlers=[sink])
+    await collector.start()
+
+    workers, records = 4, 500
+    script = (
+        "import sys\n"
+        "from aiologbuch.handlers import SyncCollectorHandler\n"
+        f"handler = SyncCollectorHandler(path={socket_path!r}, formatter=None)\n"
+        "worker = sys.argv[1]\n"
+        f"for i in range({records}):\n"
+        "    line = f'{worker}:{i:05}:' + 'x' * 200 + '\\n'\n"
+        "    handler.write_and_flush(line.encode(), 20)\n"
+        "handler.close()\n"
+    )
+    env = os.environ | {"PYTHONPATH": os.getcwd()}
+    processes = [
+        await asyncio.create_subprocess_exec(
+            sys.executable, "-c", script, str(worker), env=env
+        )
+        for worker in range(workers)
+    ]
+    assert [await process.wait() for process in processes] == [0] * workers
+
+    await _wait_for(lambda: sink.data.count(b"\n") == workers * records)
+    await collector.stop()
+
+    lines = sink.data.splitlines()
+    for worker in range(workers):
+        own = [line for line in lines if line.startswith(f"{worker}:".encode())]
+        assert own == [
+            f"{worker}:{i:05}:".encode() + b"x" * 200 for i in range(records)
+        ]
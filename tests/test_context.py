@@ -0,0 +1,162 @@
+import asyncio
+import sys
+
+from pytest import mark, raises
+
+from aiologbuch.formatters import JsonFormatter
+from aiologbuch.loggers import AsyncLogger, BoundSyncLogger, SyncLogger
+from aiologbuch.managers import AsyncManager
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.context import get_context, new_context, scoped_context
+from aiologbuch.shared.filters import Filter, SamplingFilter
+from aiologbuch.shared.levels import LogLevel
+
+
+def _sync_logger(handler_class: type):
+    logger = SyncLogger(name="context", filter_=Filter(level=LogLevel.INFO))
+    logger._add_handler(handler := handler_class(formatter=JsonFormatter()))
+    return logger, handler
+
+
+def _async_logger(handler_class: type):
+    logger = AsyncLogger(name="context", filter_=Filter(level=LogLevel.INFO))
+    logger._add_handler(handler := handler_class(formatter=JsonFormatter()))
+    return logger, handler
+
+
+@mark.unit
+def test_bound_loggers_add_their_fields(sync_handler):
+    logger, handler = _sync_logger(sync_handler)
+    bound = logger.bind(request_id="abc", tenant="acme")
+    child = bound.bind(user=7, tenant="other")
+
+    assert isinstance(bound, BoundSyncLogger)
+    assert child.context == {"request_id": "abc", "tenant": "other", "user": 7}
+
+    logger.info("plain")
+    bound.info("bound")
+    child.debug("filtered")
+    try:
+        raise ValueError("boom")
+    except ValueError as exc:
+        child.exception(exc)
+    line_number = sys._getframe().f_lineno - 1
+
+    plain, first, second = handler.lines
+    assert "request_id" not in plain
+    assert (first["message"], first["request_id"], first["tenant"]) == (
+        "bound",
+        "abc",
+        "acme",
+    )
+    assert (second["tenant"], second["user"]) == ("other", 7)
+    assert second["traceback"].endswith("ValueError: boom\n")
+    assert second["function_name"] == "test_bound_loggers_add_their_fields"
+    assert second["line_number"] == line_number
+    assert logger.metrics.emitted == 3
+
+
+@mark.unit
+@mark.parametrize("fields", [{"message": "x"}, {"user": 1, "level": "x"}])
+def test_fields_can_not_shadow_record_fields(fields: dict, sync_handler):
+    logger, _ = _sync_logger(sync_handler)
+
+    with raises(ValueError, match="Reserved fields"):
+        logger.bind(**fields)
+    with raises(ValueError, match="Reserved fields"):
+        logger.bind(user=1).bind(**fields)
+    with raises(ValueError, match="Reserved fields"):
+        with scoped_context(**fields):
+            ...
+
+
+@mark.unit
+def test_fields_are_encoded_when_bound(sync_handler):
+    logger, _ = _sync_logger(sync_handler)
+
+    with raises(TypeError):
+        logger.bind(request=object())
+    assert new_context({}) is None
+    assert new_context({"a": "é"}).encoded == b'"a": "\\\\u00e9"'
+
+
+@mark.unit
+async def test_scoped_context_follows_tasks(async_handler):
+    logger, handler = _async_logger(async_handler)
+
+    async def _request(request_id: str):
+        with scoped_context(request_id=request_id):
+            await asyncio.sleep(0)
+            with scoped_context(step="inner"):
+                await logger.info("inner")
+            await logger.bind(step="bound").info("outer")
+
+    await asyncio.gather(_request("a"), _request("b"))
+    await logger.info("outside")
+
+    lines = {(line.get("request_id"), line.get("step")) for line in handler.lines}
+    assert lines == {
+        ("a", "inner"),
+        ("b", "inner"),
+        ("a", "bound"),
+        ("b", "bound"),
+        (None, None),
+    }
+    assert get_context() == {}
+
+
+@mark.unit
+def test_bound_fields_win_over_the_scope(sync_handler):
+    logger, handler = _sync_logger(sync_handler)
+    bound = logger.bind(tenant="bound")
+
+    with scoped_context(tenant="scoped", user=1) as context:
+        bound.info("first")
+        bound.info("second")
+        assert get_context() == {"tenant": "scoped", "user": 1}
+        assert len(context._merges) == 1
+
+    assert [(line["tenant"], line["user"]) for line in handler.lines] == [
+        ("bound", 1),
+        ("bound", 1),
+    ]
+
+
+@mark.unit
+async def test_bound_loggers_follow_their_logger(async_handler):
+    settings.configure()
+    manager = AsyncManager(AsyncLogger)
+    logger, _ = manager.get_logger(name="bound", filter_=Filter(LogLevel.INFO))
+    logger._add_handler(handler := async_handler(formatter=JsonFormatter()))
+    bound = logger.bind(request_id="abc")
+    logger._use_queue(manager)
+
+    await bound.info("queued")
+    await manager.flush()
+    assert handler.lines[0]["request_id"] == "abc"
+
+    await manager.disable()
+    await bound.info("dropped")
+    assert len(handler.lines) == 1
+
+
+@mark.unit
+async def test_bound_loggers_reuse_the_level_decisions(sync_handler, async_handler):
+    logger, handler = _sync_logger(sync_handler)
+    async_logger, async_target = _async_logger(async_handler)
+    bound, async_bound = logger.bind(user=1), async_logger.bind(user=1)
+
+    # NOTE: Levels the logger switched off are not even given to the filter
+    bound.debug("hidden")
+    await async_bound.debug("hidden")
+    bound.info("shown")
+    await async_bound.info("shown")
+
+    assert logger.metrics.snapshot() == {"emitted": 1, "filtered": 0}
+    assert async_logger.metrics.snapshot() == {"emitted": 1, "filtered": 0}
+    assert len(handler.lines) == len(async_target.lines) == 1
+
+    sampled = SyncLogger(name="sampled", filter_=SamplingFilter(LogLevel.INFO, every=2))
+    sampled._add_handler(sync_handler())
+    [sampled.bind(user=1).info("sampled") for _ in range(4)]
+    assert sampled.metrics.snapshot() == {"emitted": 2, "filtered": 2}
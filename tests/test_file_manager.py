@@ -0,0 +1,178 @@
+from asyncio import CancelledError, gather, get_running_loop, sleep
+from threading import Thread
+
+from pytest import mark
+
+from aiologbuch.formatters import LineFormatter
+from aiologbuch.handlers import AsyncFileHandler
+from aiologbuch.handlers.file.manager import _ResourceManager
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.levels import LogLevel
+
+
+def _count_sends(resource):
+    calls = []
+    send = resource.stream.send
+
+    def _send(msg: bytes):
+        calls.append(msg)
+        return send(msg)
+
+    resource.stream.send = _send
+    return calls
+
+
+@mark.unit
+async def test_async_writes_are_coalesced(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    manager = _ResourceManager()
+
+    await manager.aopen_stream(filename=filename)
+    calls = _count_sends(manager.resources[filename])
+
+    messages = [f"line {i}\n".encode() for i in range(100)]
+    await gather(*[manager.asend_message(filename=filename, msg=m) for m in messages])
+    await manager.aclose_stream(filename=filename)
+
+    # NOTE: The flush only starts once the writer yields, so everything sent at once
+    # may well end up in a single batch
+    assert 1 <= len(calls) < len(messages)
+    assert b"".join(calls) == b"".join(messages)
+    with open(filename, "rb") as file:
+        assert file.read() == b"".join(messages)
+
+
+@mark.unit
+async def test_async_batches_respect_the_max_batch_bytes(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    manager = _ResourceManager()
+
+    await manager.aopen_stream(filename=filename)
+    calls = _count_sends(manager.resources[filename])
+
+    messages = [b"x" * (settings.BATCH_MAX_BYTES // 2) for _ in range(10)]
+    await gather(*[manager.asend_message(filename=filename, msg=m) for m in messages])
+    await manager.aclose_stream(filename=filename)
+
+    assert all(len(call) <= settings.BATCH_MAX_BYTES for call in calls)
+    assert b"".join(calls) == b"".join(messages)
+
+
+@mark.unit
+async def test_cancelled_writer_does_not_lose_queued_messages(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    manager = _ResourceManager()
+
+    await manager.aopen_stream(filename=filename)
+    resource = manager.resources[filename]
+    send = resource.stream.send
+
+    async def _slow_send(msg: bytes):
+        await sleep(0.02)
+        return await send(msg)
+
+    resource.stream.send = _slow_send
+
+    loop = get_running_loop()
+    messages = [f"line {i}\n".encode() for i in range(10)]
+    writer = loop.create_task(manager.asend_message(filename=filename, msg=messages[0]))
+    await sleep(0)
+    others = [
+        loop.create_task(manager.asend_message(filename=filename, msg=m))
+        for m in messages[1:]
+    ]
+    await sleep(0)
+    writer.cancel()
+
+    results = await gather(writer, *others, return_exceptions=True)
+    await manager.aclose_stream(filename=filename)
+
+    assert isinstance(results[0], CancelledError)
+    assert results[1:] == [None] * len(others)
+    with open(filename, "rb") as file:
+        assert file.read() == b"".join(messages)
+
+
+@mark.unit
+def test_sync_writes(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    manager = _ResourceManager()
+    manager.open_stream(filename=filename)
+
+    messages = [f"line {i}\n".encode() for i in range(10)]
+    [manager.send_message(filename=filename, msg=msg) for msg in messages]
+    manager.close_stream(filename=filename)
+
+    with open(filename, "rb") as file:
+        assert file.read() == b"".join(messages)
+
+
+@mark.unit
+def test_sync_writes_from_many_threads(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    manager = _ResourceManager()
+    resource = manager.open_stream(filename=filename)
+
+    def _write(index: int):
+        for i in range(50):
+            resource.send(msg=f"{index}-{i}\n".encode())
+
+    threads = [Thread(target=_write, args=(index,)) for index in range(4)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    manager.close_stream(filename=filename)
+
+    with open(filename, "rb") as file:
+        lines = file.read().splitlines()
+
+    assert sorted(lines) == sorted(
+        f"{index}-{i}".encode() for index in range(4) for i in range(50)
+    )
+
+
+@mark.unit
+async def test_file_handler_keeps_a_reference_to_its_resource(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    handler = AsyncFileHandler(filename=filename, formatter=LineFormatter())
+
+    assert handler.should_open_stream
+
+    await handler.write_and_flush(b"first\n", LogLevel.INFO)
+    resource = handler._resource
+    await handler.write_and_flush(b"second\n", LogLevel.INFO)
+
+    assert handler._resource is resource
+    assert handler.manager.resources[filename] is resource
+
+    await handler.close()
+
+    assert handler.should_open_stream
+    assert filename not in handler.manager.resources
+    with open(filename, "rb") as file:
+        assert file.read() == b"first\nsecond\n"
+
+
+@mark.unit
+async def test_file_handler_releases_its_resource_after_concurrent_first_writes(
+    tmp_path,
+):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    handler = AsyncFileHandler(filename=filename, formatter=LineFormatter())
+
+    messages = [f"line {i}\n".encode() for i in range(20)]
+    await gather(*[handler.write_and_flush(msg, LogLevel.INFO) for msg in messages])
+
+    assert handler.manager.resources[filename].reference_count == 1
+
+    await handler.close()
+
+    assert filename not in handler.manager.resources
+    with open(filename, "rb") as file:
+        assert file.read() == b"".join(messages)
@@ -1,8 +1,17 @@
 from unittest.mock import MagicMock
 
-from pytest import mark
+from pytest import mark, raises
 
-from aiologbuch.shared.filters import Filter
+from aiologbuch.formatters import LineFormatter
+from aiologbuch.loggers import AsyncLogger, SyncLogger
+from aiologbuch.shared import filters
+from aiologbuch.shared.filters import (
+    CallSiteRateLimitFilter,
+    Filter,
+    LevelSamplingFilter,
+    RateLimitFilter,
+    SamplingFilter,
+)
 from aiologbuch.shared.levels import LogLevel
 
 
@@ -23,3 +32,135 @@ def test_filter(filter_level: int, record_level: int, expected: bool):
 
     assert _filter.level == filter_level
     assert _filter.filter(record) == expected
+
+
+class _Handler:
+    formatter = LineFormatter()
+
+    def __init__(self):
+        self.records = []
+
+    def handle(self, record):
+        self.records.append(record)
+
+    def close(self): ...
+
+
+class _AsyncHandler(_Handler):
+    async def handle(self, record):
+        self.records.append(record)
+
+    async def close(self): ...
+
+
+@mark.unit
+def test_rate_limit_filter(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(filters, "monotonic", lambda: now[0])
+    _filter = RateLimitFilter(level=LogLevel.INFO, rate=2, burst=5)
+
+    assert not _filter.filter(level=LogLevel.DEBUG)
+    kept = [_filter.filter(level=LogLevel.INFO) for _ in range(8)]
+    assert kept == [True] * 5 + [False] * 3
+    assert _filter.suppressed == 3
+
+    now[0] += 1.0
+    kept = [_filter.filter(level=LogLevel.INFO) for _ in range(3)]
+    assert kept == [True, True, False]
+    assert _filter.suppressed == 4
+
+    _filter.reset()
+    assert _filter.suppressed == 0
+
+    with raises(ValueError):
+        RateLimitFilter(level=LogLevel.INFO, rate=0)
+
+
+@mark.unit
+def test_call_site_rate_limit_filter():
+    _filter = CallSiteRateLimitFilter(level=LogLevel.INFO, rate=0.001, burst=2)
+    logger = SyncLogger(name="call-site", filter_=_filter)
+    logger._add_handler(handler := _Handler())
+
+    for _ in range(10):
+        logger.warning("hot loop")
+    logger.warning("elsewhere")
+
+    assert [record.msg for record in handler.records] == [
+        "hot loop",
+        "hot loop",
+        "elsewhere",
+    ]
+    assert _filter.suppressed == 8
+
+
+@mark.unit
+async def test_call_site_rate_limit_filter_through_bound_loggers():
+    _filter = CallSiteRateLimitFilter(level=LogLevel.INFO, rate=0.001, burst=1)
+    logger = SyncLogger(name="bound-call-site", filter_=_filter)
+    logger._add_handler(handler := _Handler())
+    bound = logger.bind(user=1)
+
+    for _ in range(3):
+        bound.info("hot loop")
+    bound.info("elsewhere")
+
+    async_filter = CallSiteRateLimitFilter(level=LogLevel.INFO, rate=0.001, burst=1)
+    async_logger = AsyncLogger(name="bound-call-site", filter_=async_filter)
+    async_logger._add_handler(async_handler := _AsyncHandler())
+    async_bound = async_logger.bind(user=1)
+
+    for _ in range(3):
+        await async_bound.info("hot loop")
+    await async_bound.info("elsewhere")
+
+    for records in (handler.records, async_handler.records):
+        assert [record.msg for record in records] == ["hot loop", "elsewhere"]
+    assert {site[0] for site in _filter._buckets} == {__file__}
+    assert {site[0] for site in async_filter._buckets} == {__file__}
+
+
+@mark.unit
+def test_call_site_rate_limit_filter_tracks_a_bounded_number_of_sites():
+    _filter = CallSiteRateLimitFilter(
+        level=LogLevel.INFO, rate=0.001, burst=1, max_sites=2
+    )
+    logger = SyncLogger(name="call-sites", filter_=_filter)
+    logger._add_handler(handler := _Handler())
+
+    for _ in range(2):
+        logger.info("first")
+        logger.info("second")
+        logger.info("third")
+
+    # NOTE: Every site is evicted before it comes back, so none is ever limited
+    assert len(handler.records) == 6
+    assert len(_filter._buckets) == 2
+
+
+@mark.unit
+def test_sampling_filter():
+    _filter = SamplingFilter(level=LogLevel.INFO, every=3)
+    kept = [_filter.filter(level=LogLevel.INFO) for _ in range(9)]
+
+    assert kept == [True, False, False] * 3
+    assert _filter.suppressed == 6
+    assert not _filter.filter(level=LogLevel.DEBUG)
+
+
+@mark.unit
+def test_level_sampling_filter():
+    _filter = LevelSamplingFilter(
+        level=LogLevel.DEBUG,
+        rates={LogLevel.DEBUG: 0.1, LogLevel.INFO: 0.0},
+        seed=1,
+    )
+    kept = sum(_filter.filter(level=LogLevel.DEBUG) for _ in range(10_000))
+
+    assert 800 < kept < 1200
+    assert not any(_filter.filter(level=LogLevel.INFO) for _ in range(100))
+    assert all(_filter.filter(level=LogLevel.ERROR) for _ in range(100))
+    assert _filter.suppressed == 10_000 - kept + 100
+
+    with raises(ValueError):
+        LevelSamplingFilter(level=LogLevel.DEBUG, rates={LogLevel.DEBUG: 2})
@@ -0,0 +1,249 @@
+import gc
+import json
+import re
+import weakref
+from datetime import datetime, timezone
+from threading import Thread
+from time import strftime
+
+from pytest import mark, raises
+
+from aiologbuch.formatters import JsonFormatter, LineFormatter
+from aiologbuch.formatters.base import _cache_keys
+from aiologbuch.shared.context import new_context
+from aiologbuch.shared.levels import LogLevel
+from aiologbuch.shared.records import _UNSET, LogRecord
+
+
+def _record(created: float | None = None, **kwargs):
+    options = dict(
+        name="formatters",
+        level=LogLevel.INFO,
+        msg="hello",
+        pathname="app.py",
+        lineno=1,
+        func="main",
+    )
+    record = LogRecord(**(options | kwargs))
+    if created is not None:
+        record.created = created
+        record._created_ns = int(created) * 1_000_000_000 + round((created % 1) * 1e9)
+        record._msecs = (record._created_ns % 1_000_000_000) // 1_000_000 + 0.0
+    return record
+
+
+def _legacy_timestamp(record: LogRecord):
+    date = datetime.fromtimestamp(record.created, tz=timezone.utc).timetuple()
+    return "%s.%03dZ" % (strftime("%Y-%m-%dT%H:%M:%S", date), record.msecs)
+
+
+@mark.unit
+def test_timestamps_match_the_uncached_rendering():
+    formatter = JsonFormatter()
+    created = [1_700_000_000 + i * 0.137 for i in range(100)]
+
+    for value in created:
+        record = _record(created=value)
+        assert formatter._format_time(record) == _legacy_timestamp(record)
+
+
+@mark.unit
+def test_timestamps_support_custom_formats():
+    formatter = LineFormatter(date_format="%d/%m/%Y %H:%M:%S", msec_format="%s,%03d")
+    record = _record(created=1_700_000_000.25)
+
+    assert formatter._format_time(record) == "14/11/2023 22:13:20,250"
+
+
+@mark.unit
+def test_timestamp_cache_is_consistent_across_threads():
+    formatter, errors = JsonFormatter(), []
+
+    def _format(offset: int):
+        for i in range(2_000):
+            record = _record(created=1_700_000_000 + offset + (i % 7) + 0.5)
+            if formatter._format_time(record) != _legacy_timestamp(record):
+                errors.append(record)
+
+    threads = [Thread(target=_format, args=(offset,)) for offset in range(4)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+
+    assert errors == []
+
+
+def _legacy_json(formatter: JsonFormatter, record: LogRecord):
+    data = formatter.prepare_record(record=record)
+    return re.sub(r"\\", r"\\\\", json.dumps(data)).encode() + formatter.TERMINATOR
+
+
+_ENCODERS = ["stdlib"]
+
+_MESSAGES = [
+    "",
+    "hello",
+    "".join(chr(code) for code in range(128)),
+    'C:\\Users\\app\\"quoted"\\n',
+    "multi\nline\ttext\r\n",
+    "100% done, %s %d %%",
+    "olá, 世界 👋",
+    "lone \ud800 surrogate",
+    "\x7f\x80\xff",
+    {},
+    {"user": "ünïcode", "path": "a\\b", "nested": {"list": [1, 2.5, None, True]}},
+    {"nan": float("nan"), "inf": float("inf"), "big": 2**80, "%": "%s"},
+]
+
+
+@mark.unit
+@mark.parametrize("encoder", _ENCODERS)
+@mark.parametrize("msg", _MESSAGES)
+def test_json_output_matches_the_legacy_serializer(encoder: str, msg):
+    formatter = JsonFormatter(encoder=encoder)
+    record = _record(created=1_700_000_000.5, msg=msg, name='logger "%s" \\ é')
+
+    assert formatter.format(record) == _legacy_json(formatter, record)
+
+
+@mark.unit
+@mark.parametrize("encoder", _ENCODERS)
+@mark.parametrize("fields", [None, [], ["message"]])
+def test_json_context_is_spliced_like_the_legacy_serializer(encoder: str, fields):
+    formatter = JsonFormatter(encoder=encoder, fields=fields)
+    context = {"request_id": 'C:\\tmp "%s"', "user": "ü", "tags": [1, None]}
+    record = _record(created=1_700_000_000.5, context=new_context(context))
+
+    data = formatter.prepare_record(record=record) | context
+    expected = re.sub(r"\\", r"\\\\", json.dumps(data)).encode() + b"\n"
+    assert formatter.format(record) == expected
+
+
+@mark.unit
+@mark.parametrize("encoder", _ENCODERS)
+def test_json_output_matches_the_legacy_serializer_with_tracebacks(encoder: str):
+    formatter = JsonFormatter(encoder=encoder)
+    try:
+        raise ValueError("bad value: C:\\tmp\\ü")
+    except ValueError as exc:
+        record = _record(exc_info=(type(exc), exc, exc.__traceback__))
+
+    record.thread = 2**63 + 1
+    assert formatter.format(record) == _legacy_json(formatter, record)
+
+
+@mark.unit
+def test_json_formatter_rejects_unknown_encoders():
+    with raises(ValueError):
+        JsonFormatter(encoder="simdjson")
+
+
+@mark.unit
+def test_json_formatter_defaults_to_the_stdlib_encoder():
+    assert type(JsonFormatter().encoder).__name__ == "_StdlibEncoder"
+
+
+def _legacy_line(formatter: LineFormatter, record: LogRecord):
+    data, log = formatter.prepare_record(record=record), formatter.log_style
+    for key in data:
+        log = log.replace("{" + key + "}", str(data[key]))
+    return log.encode() + formatter.TERMINATOR
+
+
+@mark.unit
+@mark.parametrize(
+    "log_style",
+    [
+        None,
+        "{message}",
+        "plain text",
+        "100% {level} %s %(name)s {{message}} { name } {}",
+        "{name}{name}{message}",
+        "[{timestamp}] {level:>8} {process_id}/{thread_name} {filename}:{line_number}",
+        "{function_name} {traceback} {process_name} {thread_id} {message}",
+    ],
+)
+def test_line_output_matches_the_legacy_renderer(log_style: str | None):
+    formatter = LineFormatter(log_style=log_style)
+    for msg in ["hello", "ünïcode % {level}", {"key": "value"}]:
+        record = _record(created=1_700_000_000.5, msg=msg)
+        assert formatter.format(record) == _legacy_line(formatter, record)
+
+
+@mark.unit
+def test_line_formatter_rejects_unknown_placeholders():
+    with raises(ValueError, match="{lineno}"):
+        LineFormatter(log_style="{level} {lineno} {message}")
+
+
+@mark.unit
+def test_line_formatter_fields_follow_the_template():
+    formatter = LineFormatter(log_style="{message} {level} {message}")
+    assert formatter.fields == ("level", "message")
+
+
+@mark.unit
+@mark.parametrize("encoder", _ENCODERS)
+@mark.parametrize(
+    "fields",
+    [
+        [],
+        ["message"],
+        ["message", "level", "timestamp"],
+        ["traceback", "thread_id", "name", "line_number"],
+    ],
+)
+def test_json_formatter_only_emits_the_selected_fields(encoder: str, fields: list):
+    formatter = JsonFormatter(encoder=encoder, fields=fields)
+    record = _record(created=1_700_000_000.5, msg='C:\\temp "quoted"')
+
+    assert formatter.fields == tuple(fields)
+    assert list(json.loads(formatter.format(record).replace(b"\\\\", b"\\"))) == fields
+    assert formatter.format(record) == _legacy_json(formatter, record)
+
+
+@mark.unit
+def test_formatters_only_compute_the_fields_they_emit():
+    record = _record(exc_info=(ValueError, ValueError("boom"), None))
+
+    JsonFormatter(fields=["level", "message"]).format(record)
+    LineFormatter("{level} {message}").format(record)
+
+    assert record._process_name is _UNSET
+    assert record._thread_name is _UNSET
+    assert record._exc_text is _UNSET
+    assert record._msecs is _UNSET
+
+
+@mark.unit
+@mark.parametrize("fields", [["message", "lineno"], ["level", "level"]])
+def test_json_formatter_rejects_invalid_fields(fields: list):
+    with raises(ValueError):
+        JsonFormatter(fields=fields)
+
+
+@mark.unit
+def test_formatters_configured_alike_share_a_cache_key():
+    assert JsonFormatter().cache_key is JsonFormatter().cache_key
+    assert LineFormatter().cache_key is LineFormatter(log_style=None).cache_key
+
+    assert JsonFormatter().cache_key is not LineFormatter().cache_key
+    assert JsonFormatter().cache_key is not JsonFormatter(fields=["message"]).cache_key
+    assert (
+        JsonFormatter(encoder="stdlib").cache_key
+        is not JsonFormatter(date_format="%H:%M:%S", encoder="stdlib").cache_key
+    )
+    assert LineFormatter().cache_key is not LineFormatter("{message}").cache_key
+
+
+@mark.unit
+def test_cache_keys_are_forgotten_with_their_formatters():
+    class _Formatter(LineFormatter): ...
+
+    formatter = _Formatter()
+    key = weakref.ref(formatter.cache_key)
+    assert _cache_keys[formatter._config()] is key()
+
+    del formatter
+    gc.collect()
+    assert key() is None
+    assert not any(config[0] is _Formatter for config in _cache_keys)
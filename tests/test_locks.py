@@ -0,0 +1,78 @@
+from asyncio import create_task, gather, sleep
+from threading import Thread
+
+from pytest import mark, raises
+
+from aiologbuch.shared.exceptions import WouldDeadlock
+from aiologbuch.shared.locks import HybridLock
+
+
+@mark.unit
+async def test_hybrid_lock_is_mutually_exclusive_between_threads_and_coroutines():
+    lock, counter = HybridLock(), {"value": 0, "inside": 0, "max_inside": 0}
+
+    def _enter():
+        counter["inside"] += 1
+        counter["max_inside"] = max(counter["max_inside"], counter["inside"])
+
+    def _exit():
+        counter["value"] += 1
+        counter["inside"] -= 1
+
+    def _thread_worker():
+        for _ in range(200):
+            with lock:
+                _enter()
+                _exit()
+
+    async def _coroutine_worker():
+        for _ in range(200):
+            async with lock:
+                _enter()
+                await sleep(0)
+                _exit()
+
+    threads = [Thread(target=_thread_worker) for _ in range(3)]
+    [thread.start() for thread in threads]
+    await gather(*[_coroutine_worker() for _ in range(3)])
+    [thread.join() for thread in threads]
+
+    assert counter["value"] == 6 * 200
+    assert counter["max_inside"] == 1
+    assert not lock.locked()
+
+
+@mark.unit
+async def test_hybrid_lock_raises_instead_of_blocking_its_own_event_loop():
+    lock = HybridLock()
+
+    async def _hold():
+        async with lock:
+            await sleep(0.05)
+
+    task = create_task(_hold())
+    await sleep(0.01)
+
+    with raises(WouldDeadlock):
+        lock.acquire()
+
+    await task
+    assert not lock.locked()
+
+
+@mark.unit
+async def test_hybrid_lock_wakes_up_coroutines_waiting_on_a_thread():
+    lock = HybridLock()
+    lock.acquire()
+
+    waiter = create_task(lock.aacquire())
+    await sleep(0.01)
+    assert not waiter.done()
+
+    thread = Thread(target=lock.release)
+    thread.start()
+    thread.join()
+
+    await waiter
+    assert lock.locked()
+    lock.release()
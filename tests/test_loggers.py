@@ -0,0 +1,248 @@
+import json
+from inspect import currentframe
+
+from pytest import mark
+
+from aiologbuch.formatters import JsonFormatter, LineFormatter
+from aiologbuch.handlers.base import BaseSyncHandler
+from aiologbuch.loggers import AsyncLogger, SyncLogger
+from aiologbuch.shared.filters import Filter, SamplingFilter
+from aiologbuch.shared.levels import LogLevel
+
+
+class _Handler:
+    formatter = LineFormatter()
+
+    def __init__(self, blocking: bool):
+        self.blocking = blocking
+        self.records = []
+
+    async def handle(self, record):
+        self.records.append(record)
+
+    async def close(self): ...
+
+
+@mark.unit
+@mark.parametrize(
+    "blocking,inline,concurrent",
+    [
+        ([False], 1, 0),
+        ([True], 1, 0),
+        ([False, False], 2, 0),
+        ([True, False], 2, 0),
+        ([True, True], 0, 2),
+        ([True, True, False], 1, 2),
+    ],
+)
+async def test_async_logger_fanout(blocking: list[bool], inline: int, concurrent: int):
+    logger = AsyncLogger(name="fanout", filter_=Filter(level=LogLevel.INFO))
+    handlers = [_Handler(blocking=value) for value in blocking]
+    [logger._add_handler(handler) for handler in handlers]
+
+    assert len(logger._inline_handlers) == inline
+    assert len(logger._concurrent_handlers) == concurrent
+
+    await logger.info("hello")
+
+    assert all(len(handler.records) == 1 for handler in handlers)
+
+
+class _SyncHandler:
+    def __init__(self, formatter):
+        self.formatter = formatter
+        self.records = []
+
+    def handle(self, record):
+        self.records.append(record)
+
+    def close(self): ...
+
+
+@mark.unit
+@mark.parametrize(
+    "formatter,caller_info,expected",
+    [
+        (JsonFormatter(), True, True),
+        (JsonFormatter(), False, False),
+        (LineFormatter(), True, False),
+        (LineFormatter("{level} {function_name}:{line_number} {message}"), True, True),
+    ],
+)
+def test_caller_is_only_found_when_needed(formatter, caller_info: bool, expected: bool):
+    logger = SyncLogger(name="caller", filter_=Filter(level=LogLevel.INFO))
+    handler = _SyncHandler(formatter=formatter)
+    logger._add_handler(handler)
+    logger._set_caller_info(caller_info)
+
+    logger.info("hello")
+    line_number = currentframe().f_lineno - 1
+    (record,) = handler.records
+
+    if expected:
+        assert record.pathname == __file__
+        assert record.funcName == "test_caller_is_only_found_when_needed"
+        assert record.lineno == line_number
+    else:
+        assert record.pathname == "(unknown file)"
+        assert record.lineno == 0
+
+
+@mark.unit
+@mark.parametrize(
+    "formatter,expected",
+    [
+        (JsonFormatter(), True),
+        (JsonFormatter(fields=["timestamp", "level", "message"]), False),
+        (LineFormatter(), False),
+        (LineFormatter("{thread_name} {message}"), True),
+    ],
+)
+def test_thread_is_only_collected_when_needed(formatter, expected: bool):
+    logger = SyncLogger(name="thread", filter_=Filter(level=LogLevel.INFO))
+    handler = _SyncHandler(formatter=formatter)
+    logger._add_handler(handler)
+
+    logger.info("hello")
+    (record,) = handler.records
+
+    if expected:
+        assert record.thread is not None
+        assert record.threadName == "MainThread"
+    else:
+        assert record.thread is None
+        assert record.threadName is None
+
+
+class _CountingFormatter(JsonFormatter):
+    calls = 0
+
+    def format(self, record):
+        type(self).calls += 1
+        return super().format(record)
+
+
+class _FormattingHandler(BaseSyncHandler):
+    def __init__(self, formatter):
+        super().__init__(formatter=formatter)
+        self.messages = []
+
+    def write_and_flush(self, msg: bytes, level: int):
+        self.messages.append(msg)
+
+    def close(self): ...
+
+
+@mark.unit
+@mark.parametrize(
+    "formatters,calls",
+    [
+        ([_CountingFormatter()], 1),
+        ([_CountingFormatter(), _CountingFormatter(), _CountingFormatter()], 1),
+        ([_CountingFormatter(), _CountingFormatter(fields=["message"])], 2),
+    ],
+)
+def test_handlers_with_formatters_alike_format_once(formatters: list, calls: int):
+    _CountingFormatter.calls = 0
+    logger = SyncLogger(name="format-once", filter_=Filter(level=LogLevel.INFO))
+    handlers = [_FormattingHandler(formatter=formatter) for formatter in formatters]
+    [logger._add_handler(handler) for handler in handlers]
+
+    logger.info("hello")
+
+    assert _CountingFormatter.calls == calls
+    for handler, formatter in zip(handlers, formatters):
+        assert len(handler.messages) == 1
+        assert b'"message": "hello"' in handler.messages[0]
+        assert set(json.loads(handler.messages[0])) == set(formatter.fields)
+
+
+@mark.unit
+def test_sync_logger_binds_disabled_levels_to_a_no_op():
+    logger = SyncLogger(name="specialized", filter_=Filter(level=LogLevel.WARNING))
+    logger._add_handler(handler := _SyncHandler(formatter=LineFormatter()))
+
+    assert logger.debug is logger.info
+    assert logger.debug("hidden") is None
+    logger.info(msg="hidden")
+    assert logger.error is not logger.debug
+    logger.warning("shown")
+    logger.exception(ValueError("boom"))
+
+    assert [record.msg for record in handler.records] == ["shown", "boom"]
+    assert handler.records[1].exc_info[0] is ValueError
+
+    logger._disable()
+    assert logger.critical is logger.debug
+
+
+@mark.unit
+async def test_async_logger_binds_disabled_levels_to_a_no_op():
+    logger = AsyncLogger(name="specialized", filter_=Filter(level=LogLevel.WARNING))
+    logger._add_handler(handler := _Handler(blocking=False))
+
+    assert logger.debug is logger.info
+    await logger.debug("hidden")
+    await logger.info(msg="hidden")
+    await logger.warning("shown")
+    await logger.exception(ValueError("boom"), msg="failed")
+
+    assert [record.msg for record in handler.records] == ["shown", "failed"]
+
+    await logger._disable()
+    assert logger.critical is logger.debug
+    await logger.critical("hidden")
+    assert len(handler.records) == 2
+
+
+@mark.unit
+def test_specialized_levels_keep_the_caller():
+    logger = SyncLogger(name="specialized-caller", filter_=Filter(level=LogLevel.INFO))
+    logger._add_handler(handler := _SyncHandler(formatter=JsonFormatter()))
+
+    logger.info("hello")
+    line_number = currentframe().f_lineno - 1
+    (record,) = handler.records
+
+    assert "info" in logger.__dict__
+    assert record.pathname == __file__
+    assert record.lineno == line_number
+
+
+@mark.unit
+def test_dynamic_filters_are_asked_on_every_call():
+    _filter = SamplingFilter(level=LogLevel.INFO, every=2)
+    logger = SyncLogger(name="sampled", filter_=_filter)
+    logger._add_handler(handler := _SyncHandler(formatter=LineFormatter()))
+
+    assert "info" not in logger.__dict__
+    assert logger.debug("hidden") is None
+    [logger.info(f"message {i}") for i in range(4)]
+
+    assert [record.msg for record in handler.records] == ["message 0", "message 2"]
+
+
+class _SwitchFilter(Filter):
+    def __init__(self, level: int):
+        super().__init__(level=level)
+        self.enabled = True
+
+    def filter(self, level: int):
+        return self.enabled and super().filter(level=level)
+
+
+@mark.unit
+def test_filter_subclasses_are_asked_on_every_call():
+    _filter = _SwitchFilter(level=LogLevel.INFO)
+    _filter.enabled = False
+    logger = SyncLogger(name="switched", filter_=_filter)
+    logger._add_handler(handler := _SyncHandler(formatter=LineFormatter()))
+
+    assert not _filter.is_static
+    assert "info" not in logger.__dict__
+    logger.info("hidden")
+    _filter.enabled = True
+    logger.info("shown")
+    logger.debug("hidden")
+
+    assert [record.msg for record in handler.records] == ["shown"]
@@ -0,0 +1,135 @@
+import asyncio
+from threading import Thread
+from time import sleep
+
+from pytest import mark
+
+from aiologbuch.loggers import AsyncLogger, SyncLogger
+from aiologbuch.managers import AsyncManager, SyncManager
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.filters import Filter, SamplingFilter
+from aiologbuch.shared.levels import LogLevel
+from aiologbuch.shared.locks import HybridLock
+from aiologbuch.shared.metrics import Histogram, LockMetrics, get_lock_metrics
+
+
+@mark.unit
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    [histogram.observe(value) for value in (0.05, 0.1, 0.5, 2.0)]
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {0.1: 2, 1.0: 3, float("inf"): 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == 2.65
+
+
+@mark.unit
+def test_logger_and_handler_metrics(monkeypatch, sync_handler):
+    monkeypatch.setattr(settings, "RAISE_EXCEPTIONS", False)
+    logger = SyncLogger(name="metrics", filter_=SamplingFilter(LogLevel.INFO, every=2))
+    logger._add_handler(handler := sync_handler())
+    logger._add_handler(failing := sync_handler(fail=True))
+
+    [logger.info("hello") for _ in range(10)]
+    # NOTE: Disabled levels are bound to a no-op, which counts nothing
+    logger.debug("hidden")
+
+    assert logger.metrics.snapshot() == {"emitted": 5, "filtered": 5}
+    assert handler.metrics.records == 5
+    assert handler.metrics.bytes == 5 * len(b"hello\n")
+    assert handler.metrics.write_latency.count == 5
+    assert handler.metrics.errors == 0
+    assert (failing.metrics.records, failing.metrics.errors) == (0, 5)
+
+
+@mark.unit
+def test_lock_wait_time_is_only_measured_when_contended():
+    metrics = LockMetrics()
+    lock = HybridLock(metrics=metrics)
+
+    with lock:
+        ...
+    assert metrics.contended == 0
+
+    def _hold():
+        with lock:
+            sleep(0.05)
+
+    holder = Thread(target=_hold)
+    holder.start()
+    sleep(0.01)
+    with lock:
+        ...
+    holder.join()
+
+    assert metrics.contended == 1
+    assert metrics.wait_time.sum >= 0.02
+
+
+@mark.unit
+async def test_async_lock_wait_time():
+    metrics = LockMetrics()
+    lock = HybridLock(metrics=metrics)
+
+    async def _hold():
+        async with lock:
+            await asyncio.sleep(0.02)
+
+    async def _wait():
+        async with lock:
+            ...
+
+    await asyncio.gather(_hold(), _wait())
+
+    assert metrics.contended == 1
+    assert metrics.wait_time.sum >= 0.01
+
+
+@mark.unit
+def test_manager_exports_prometheus_text(sync_handler):
+    manager = SyncManager(SyncLogger)
+    logger, _ = manager.get_logger(name='my "app"', filter_=Filter(LogLevel.INFO))
+    logger._add_handler(sync_handler())
+    get_lock_metrics("stderr")
+
+    logger.info("hello")
+    snapshot = manager.metrics()
+    text = manager.metrics_text()
+
+    (handler,) = snapshot["loggers"]['my "app"']["handlers"]
+    assert handler["handler"] == "StubSyncHandler"
+    assert handler["records"] == 1
+    assert "stderr" in snapshot["locks"]
+
+    lines = text.splitlines()
+    assert "# TYPE aiologbuch_records_emitted_total counter" in lines
+    assert 'aiologbuch_records_emitted_total{logger="my \\"app\\""} 1' in lines
+    assert (
+        'aiologbuch_handler_bytes_total{logger="my \\"app\\"",'
+        'handler="StubSyncHandler",target=""} 6'
+    ) in lines
+    assert (
+        'aiologbuch_handler_write_seconds_bucket{logger="my \\"app\\"",'
+        'handler="StubSyncHandler",target="",le="+Inf"} 1'
+    ) in lines
+    assert lines.count("# TYPE aiologbuch_lock_wait_seconds histogram") == 1
+
+
+@mark.unit
+async def test_async_manager_reports_its_queue(async_handler):
+    settings.configure()
+    manager = AsyncManager(AsyncLogger)
+    logger, _ = manager.get_logger(name="queued", filter_=Filter(LogLevel.INFO))
+    logger._add_handler(async_handler())
+    logger._use_queue(manager)
+
+    await logger.info("hello")
+    await manager.flush()
+
+    snapshot = manager.metrics()
+    assert snapshot["queue"] == {"depth": 0, "dropped": 0, "delayed": 0}
+    assert snapshot["loggers"]["queued"]["handlers"][0]["target"] == "app.log"
+    assert "aiologbuch_queue_depth 0" in manager.metrics_text()
+
+    await manager.disable()
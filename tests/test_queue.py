@@ -0,0 +1,48 @@
+from pytest import mark
+
+from aiologbuch.formatters import LineFormatter
+from aiologbuch.loggers import AsyncLogger
+from aiologbuch.managers import get_logger_manager
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.enums import IOModeEnum
+from aiologbuch.shared.filters import Filter
+from aiologbuch.shared.levels import LogLevel
+
+
+class _RecordingHandler:
+    formatter = LineFormatter()
+
+    def __init__(self):
+        self.records = []
+        self.closed = False
+
+    async def handle(self, record):
+        self.records.append(record)
+
+    async def close(self):
+        self.closed = True
+
+
+@mark.unit
+async def test_queued_logger_hands_records_to_the_drain_task():
+    settings.configure()
+    manager = get_logger_manager(mode=IOModeEnum.ASYNC, logger_class=AsyncLogger)
+    logger, _ = manager.get_logger(name="queued", filter_=Filter(level=LogLevel.INFO))
+    handler = _RecordingHandler()
+    logger._add_handler(handler)
+    logger._use_queue(manager)
+
+    await logger.info("first")
+    await logger.info("second")
+
+    assert handler.records == []
+    assert manager.queue.qsize() == 2
+
+    await manager.flush()
+
+    assert [record.msg for record in handler.records] == ["first", "second"]
+
+    await manager.disable()
+
+    assert handler.closed
+    assert manager.queue is None
@@ -0,0 +1,57 @@
+import logging
+from threading import current_thread
+
+from pytest import mark
+
+from aiologbuch.shared.records import _UNSET, LogRecord
+
+
+def _record(**kwargs):
+    options = dict(
+        name="records",
+        level=logging.ERROR,
+        msg="hello",
+        pathname=__file__,
+        lineno=42,
+        func="test",
+    )
+    return LogRecord(**(options | kwargs))
+
+
+@mark.unit
+def test_log_record_matches_the_stdlib_attributes():
+    record = _record()
+    expected = logging.LogRecord(
+        "records", logging.ERROR, __file__, 42, "hello", None, None, func="test"
+    )
+
+    assert record.levelname == expected.levelname
+    assert record.process == expected.process
+    assert record.processName == expected.processName
+    assert record.thread == expected.thread
+    assert record.threadName == expected.threadName == current_thread().name
+    assert record.pathname == expected.pathname
+    assert record.funcName == expected.funcName
+    assert record.lineno == expected.lineno
+    assert record.exc_text is None
+    assert record.msecs == int(record.created * 1000) % 1000
+
+
+@mark.unit
+def test_log_record_renders_the_traceback_lazily():
+    try:
+        raise ValueError("oh no")
+    except ValueError as exc:
+        record = _record(exc_info=(type(exc), exc, exc.__traceback__))
+
+    assert record._exc_text is _UNSET
+    assert "Traceback (most recent call last)" in record.exc_text
+    assert record.exc_text.endswith("ValueError: oh no\n")
+
+    record.exc_text = "custom"
+    assert record.exc_text == "custom"
+
+
+@mark.unit
+def test_log_record_has_no_instance_dict():
+    assert not hasattr(_record(), "__dict__")
@@ -0,0 +1,165 @@
+import os
+import subprocess
+import sys
+from asyncio import gather
+
+from pytest import mark, raises
+
+from aiologbuch.handlers import AsyncRingHandler, SyncRingHandler
+from aiologbuch.handlers.ring import RingBuffer, read_records
+from aiologbuch.handlers.ring.buffer import HEADER_SIZE
+from aiologbuch.handlers.ring.reader import main
+from aiologbuch.shared.levels import LogLevel
+
+
+def _messages(count: int, start: int = 0):
+    return [f"record {i:05}\n".encode() for i in range(start, start + count)]
+
+
+@mark.unit
+def test_records_are_read_back_in_order(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    ring, messages = RingBuffer(filename=filename, size=64 * 1024), _messages(100)
+
+    ring.open()
+    [ring.write(msg) for msg in messages]
+    ring.close()
+
+    assert read_records(filename) == messages
+    assert os.path.getsize(filename) == HEADER_SIZE + 64 * 1024
+
+
+@mark.unit
+def test_old_records_are_overwritten_once_the_ring_is_full(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    ring, messages = RingBuffer(filename=filename, size=1024), _messages(500)
+
+    ring.open()
+    [ring.write(msg) for msg in messages]
+    ring.close()
+
+    records = read_records(filename)
+    assert 10 < len(records) < len(messages)
+    assert records == messages[-len(records) :]
+
+
+@mark.unit
+def test_frames_of_older_laps_are_wiped_on_wrap(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    ring = RingBuffer(filename=filename, size=1000)
+    small = [f"{i:04}\n".encode() for i in range(40)]
+    large = [f"{i:04}".encode().ljust(153, b".") + b"\n" for i in range(40, 52)]
+
+    ring.open()
+    [ring.write(msg) for msg in small + large]
+    ring.close()
+
+    # NOTE: The tail of the ring still held some of the small records when it wrapped
+    # around for the second time, which would come back before a gap
+    assert read_records(filename) == large[-5:]
+
+
+@mark.unit
+def test_writing_resumes_after_the_newest_record(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    first, second = _messages(60), _messages(60, start=60)
+
+    ring = RingBuffer(filename=filename, size=1024)
+    ring.open()
+    [ring.write(msg) for msg in first]
+    ring.close()
+
+    ring = RingBuffer(filename=filename, size=1024)
+    ring.open()
+    [ring.write(msg) for msg in second]
+    ring.close()
+
+    records = read_records(filename)
+    assert records == (first + second)[-len(records) :]
+    assert records[-1] == second[-1]
+
+
+@mark.unit
+def test_damaged_frames_are_skipped(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    ring, messages = RingBuffer(filename=filename, size=64 * 1024), _messages(10)
+
+    ring.open()
+    [ring.write(msg) for msg in messages]
+    ring.close()
+
+    # NOTE: Flips a byte in the payload of the fourth record
+    offset = HEADER_SIZE + 3 * (20 + len(messages[0])) + 20 + 2
+    with open(filename, "r+b") as file:
+        file.seek(offset)
+        file.write(b"X")
+
+    assert read_records(filename) == messages[:3] + messages[4:]
+
+
+@mark.unit
+def test_records_survive_the_process_crashing(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    script = (
+        "import os\n"
+        "from aiologbuch.handlers.ring import RingBuffer\n"
+        f"ring = RingBuffer(filename={filename!r}, size=64 * 1024)\n"
+        "ring.open()\n"
+        "for i in range(100):\n"
+        "    ring.write(f'record {i:05}\\n'.encode())\n"
+        "os._exit(1)\n"
+    )
+    env = os.environ | {"PYTHONPATH": os.getcwd()}
+    result = subprocess.run([sys.executable, "-c", script], env=env)
+
+    assert result.returncode == 1
+    assert read_records(filename) == _messages(100)
+
+
+@mark.unit
+def test_rings_are_validated(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    RingBuffer(filename=filename, size=1024).open()
+
+    with raises(ValueError):
+        RingBuffer(filename=filename, size=2048).open()
+
+    other = str(tmp_path / "app.log")
+    with open(other, "wb") as file:
+        file.write(b"not a ring" * 100)
+
+    with raises(ValueError):
+        RingBuffer(filename=other, size=1024).open()
+
+    ring = RingBuffer(filename=str(tmp_path / "small.ring"), size=100)
+    ring.open()
+    with raises(ValueError):
+        ring.write(b"x" * 100)
+
+
+@mark.unit
+async def test_async_ring_handler(tmp_path):
+    filename = str(tmp_path / "app.ring")
+    handler = AsyncRingHandler(filename=filename, formatter=None, size=64 * 1024)
+    messages = _messages(200)
+
+    await gather(*[handler.write_and_flush(msg, LogLevel.INFO) for msg in messages])
+    assert handler.manager.resources[filename] is handler._ring
+
+    await handler.close()
+
+    assert filename not in handler.manager.resources
+    assert read_records(filename) == messages
+
+
+@mark.unit
+def test_sync_ring_handler(tmp_path, capsysbinary):
+    filename = str(tmp_path / "app.ring")
+    handler = SyncRingHandler(filename=filename, formatter=None, size=64 * 1024)
+    messages = _messages(200)
+
+    [handler.write_and_flush(msg, LogLevel.INFO) for msg in messages]
+    handler.close()
+
+    assert main([filename]) == 0
+    assert capsysbinary.readouterr().out == b"".join(messages)
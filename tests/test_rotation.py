@@ -0,0 +1,171 @@
+import gzip
+import os
+import subprocess
+import sys
+from asyncio import gather
+from time import sleep
+
+from pytest import mark, raises
+
+from aiologbuch.handlers import AsyncRotatingFileHandler, SyncRotatingFileHandler
+from aiologbuch.handlers.file.manager import _ResourceManager
+from aiologbuch.handlers.file.rotation import RotationPolicy, rotation_worker
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.levels import LogLevel
+
+
+def _read(path: str):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as file:
+        return file.read()
+
+
+def _read_all(filename: str, policy: RotationPolicy):
+    # NOTE: From the oldest backup to the live file
+    rotation_worker.join()
+    backups = [
+        policy.backup_name(filename, index)
+        for index in range(policy.backup_count, 0, -1)
+        if os.path.exists(policy.backup_name(filename, index))
+    ]
+    return backups, b"".join(_read(path) for path in [*backups, filename])
+
+
+def _leftovers(directory):
+    return [
+        name
+        for name in os.listdir(directory)
+        if name.endswith((".rotating", ".partial"))
+    ]
+
+
+@mark.unit
+@mark.parametrize("compress", [True, False])
+async def test_async_handler_rotates_by_size(tmp_path, compress: bool):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    handler = AsyncRotatingFileHandler(
+        filename=filename,
+        formatter=None,
+        max_bytes=200,
+        backup_count=50,
+        compress=compress,
+    )
+
+    messages = [f"line {i:03}\n".encode() for i in range(100)]
+    for msg in messages:
+        await handler.write_and_flush(msg, LogLevel.INFO)
+    await handler.close()
+
+    backups, content = _read_all(filename, handler.rotation)
+
+    assert content == b"".join(messages)
+    assert len(backups) == 4
+    assert all(len(_read(path)) <= 200 for path in [*backups, filename])
+    assert all(path.endswith(".gz") == compress for path in backups)
+    assert _leftovers(tmp_path) == []
+
+
+@mark.unit
+async def test_async_handler_keeps_every_line_under_concurrency(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    handler = AsyncRotatingFileHandler(
+        filename=filename, formatter=None, max_bytes=1024, backup_count=100
+    )
+
+    messages = [f"line {i:04}\n".encode() for i in range(2_000)]
+    for start in range(0, len(messages), 50):
+        wave = messages[start : start + 50]
+        await gather(*[handler.write_and_flush(msg, LogLevel.INFO) for msg in wave])
+    await handler.close()
+
+    backups, content = _read_all(filename, handler.rotation)
+
+    assert len(backups) > 1
+    assert content == b"".join(messages)
+
+
+@mark.unit
+def test_sync_handler_only_keeps_the_configured_backups(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    handler = SyncRotatingFileHandler(
+        filename=filename, formatter=None, max_bytes=100, backup_count=2
+    )
+
+    messages = [f"line {i:03}\n".encode() for i in range(100)]
+    [handler.write_and_flush(msg, LogLevel.INFO) for msg in messages]
+    handler.close()
+
+    backups, content = _read_all(filename, handler.rotation)
+
+    assert backups == [f"{filename}.2.gz", f"{filename}.1.gz"]
+    assert b"".join(messages).endswith(content)
+    assert not os.path.exists(f"{filename}.3.gz")
+    assert _leftovers(tmp_path) == []
+
+
+@mark.unit
+def test_sync_handler_rotates_by_time(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    handler = SyncRotatingFileHandler(filename=filename, formatter=None, interval=0.05)
+
+    handler.write_and_flush(b"first\n", LogLevel.INFO)
+    handler.write_and_flush(b"second\n", LogLevel.INFO)
+    sleep(0.1)
+    handler.write_and_flush(b"third\n", LogLevel.INFO)
+    handler.close()
+
+    backups, content = _read_all(filename, handler.rotation)
+
+    assert [_read(path) for path in backups] == [b"first\nsecond\n"]
+    assert _read(filename) == b"third\n"
+
+
+@mark.unit
+async def test_leftover_segments_are_archived_on_open(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    stopped = subprocess.Popen([sys.executable, "-c", ""])
+    stopped.wait()
+    with open(f"{filename}.{stopped.pid}-0.rotating", "wb") as file:
+        file.write(b"from a previous run\n")
+    # NOTE: The segments of processes that are still running are left to them
+    running = [
+        f"app.log.{os.getppid()}-0.rotating",
+        f"app.log.{os.getpid()}-0.rotating",
+    ]
+    for name in running:
+        (tmp_path / name).write_bytes(b"still being archived\n")
+
+    manager, policy = _ResourceManager(), RotationPolicy(max_bytes=1024)
+    await manager.aopen_stream(filename=filename, rotation=policy)
+    await manager.aclose_stream(filename=filename)
+    rotation_worker.join()
+
+    assert _read(f"{filename}.1.gz") == b"from a previous run\n"
+    assert sorted(_leftovers(tmp_path)) == sorted(running)
+
+
+@mark.unit
+async def test_a_file_can_not_be_opened_with_different_rotations(tmp_path):
+    settings.configure()
+    filename = str(tmp_path / "app.log")
+    manager = _ResourceManager()
+
+    await manager.aopen_stream(filename=filename, rotation=RotationPolicy(max_bytes=10))
+    with raises(ValueError):
+        await manager.aopen_stream(filename=filename)
+    await manager.aclose_stream(filename=filename)
+
+
+@mark.unit
+@mark.parametrize(
+    "options",
+    [{}, {"max_bytes": -1}, {"interval": -1.0}, {"max_bytes": 1, "backup_count": -1}],
+)
+def test_rotation_policy_rejects_invalid_options(options: dict):
+    with raises(ValueError):
+        RotationPolicy(**options)
@@ -0,0 +1,69 @@
+import os
+from asyncio import ensure_future, gather, sleep
+
+from pytest import mark
+
+from aiologbuch.handlers.stderr.manager import _ResourceManager
+from aiologbuch.shared.buffers import OverflowBuffer
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.levels import LogLevel
+
+
+def _read_all(fd: int):
+    os.set_blocking(fd, False)
+    chunks = []
+    while True:
+        try:
+            chunk = os.read(fd, 1024 * 1024)
+        except BlockingIOError:
+            break
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@mark.unit
+async def test_messages_are_buffered_once_the_pipe_goes_over_the_high_water_mark():
+    settings.configure()
+    read_fd, write_fd = os.pipe()
+    buffer = OverflowBuffer[bytes](max_size=1_000, policy="drop_newest")
+    manager = _ResourceManager(stream=os.fdopen(write_fd, "w"), _buffer=buffer)
+
+    # NOTE: Nothing reads from the pipe at first, so it fills up quickly
+    messages = [f"{i:08}".encode() * 128 + b"\n" for i in range(2_000)]
+    await manager.asend_message(messages[0], LogLevel.INFO)
+    senders = ensure_future(
+        gather(*[manager.asend_message(msg, LogLevel.INFO) for msg in messages[1:]])
+    )
+    await sleep(0.05)
+
+    assert manager._protocol.paused
+    assert manager._flushing
+    assert buffer.stats.dropped > 0
+
+    received, transport = b"", manager._writer.transport
+    while (not senders.done()) or transport.get_write_buffer_size():
+        received += _read_all(read_fd)
+        await sleep(0.01)
+    await senders
+    received += _read_all(read_fd)
+
+    lines = received.splitlines(keepends=True)
+    assert len(lines) == len(messages) - buffer.stats.dropped
+    assert set(lines) <= set(messages)
+
+    manager._writer.close()
+    os.close(read_fd)
+
+
+@mark.unit
+def test_sync_messages_are_written_as_bytes(tmp_path):
+    settings.configure()
+    path = tmp_path / "stderr"
+    manager = _ResourceManager(stream=open(path, "w"))
+
+    manager.send_message("héllo\n".encode())
+    manager.send_message(b"world\n")
+
+    assert path.read_bytes() == "héllo\nworld\n".encode()
@@ -0,0 +1,144 @@
+from threading import current_thread, main_thread
+
+from pytest import fixture, mark
+
+from aiologbuch.formatters import JsonFormatter, LineFormatter
+from aiologbuch.loggers import AsyncLogger
+from aiologbuch.loggers import async_ as async_loggers
+from aiologbuch.shared import tracebacks
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.filters import Filter
+from aiologbuch.shared.levels import LogLevel
+from aiologbuch.shared.records import _UNSET
+from aiologbuch.shared.tracebacks import (
+    clear_cache,
+    render_traceback,
+    traceback_signature,
+)
+
+
+@fixture(autouse=True)
+def _empty_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def _fail(msg: str = "boom"):
+    raise ValueError(msg)
+
+
+def _catch(function, *args):
+    try:
+        function(*args)
+    except Exception as exc:
+        return exc
+
+
+def _chained():
+    try:
+        _fail("inner")
+    except ValueError as exc:
+        raise RuntimeError("outer") from exc
+
+
+def _recurse(depth: int):
+    if depth:
+        return _recurse(depth - 1)
+    _fail()
+
+
+@mark.unit
+def test_signature_identifies_where_an_exception_was_raised():
+    first, second = [_catch(_fail) for _ in range(2)]
+    other_message, other_place = _catch(_fail, "other"), _catch(_chained)
+
+    assert traceback_signature(first) == traceback_signature(second)
+    assert traceback_signature(first) != traceback_signature(other_message)
+    assert traceback_signature(first) != traceback_signature(other_place)
+    assert len(traceback_signature(other_place)) == 2
+
+
+@mark.unit
+def test_rendered_tracebacks_are_cached():
+    exceptions = [_catch(_fail) for _ in range(10)]
+    texts = [render_traceback(exc) for exc in exceptions]
+
+    assert all(text is texts[0] for text in texts)
+    assert texts[0].endswith("ValueError: boom\n")
+    assert (tracebacks.stats.hits, tracebacks.stats.misses) == (9, 1)
+
+    text = render_traceback(_catch(_chained))
+    assert "ValueError: inner" in text
+    assert text.endswith("RuntimeError: outer\n")
+    assert tracebacks.stats.misses == 2
+
+
+@mark.unit
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(settings, "TRACEBACK_CACHE_SIZE", 2)
+    [render_traceback(_catch(_fail, f"boom {i}")) for i in range(5)]
+
+    assert len(tracebacks._cache) == 2
+    assert tracebacks.stats.misses == 5
+
+
+@mark.unit
+def test_depth_and_size_are_capped(monkeypatch):
+    exc = _catch(_recurse, 50)
+    full = render_traceback(exc)
+
+    monkeypatch.setattr(settings, "TRACEBACK_LIMIT", 3)
+    limited = render_traceback(exc)
+    assert limited.count("File ") == 3 < full.count("File ")
+
+    monkeypatch.setattr(settings, "TRACEBACK_LIMIT", None)
+    monkeypatch.setattr(settings, "TRACEBACK_MAX_SIZE", 500)
+    truncated = render_traceback(exc)
+    assert truncated.startswith("[... truncated]\n  ")
+    assert len(truncated) <= 500 + len("[... truncated]\n")
+    assert truncated.endswith("ValueError: boom\n")
+
+
+class _Handler:
+    blocking = False
+
+    def __init__(self, formatter):
+        self.formatter = formatter
+        self.texts = []
+
+    async def handle(self, record):
+        self.texts.append(record._exc_text)
+
+    async def close(self): ...
+
+
+@mark.unit
+@mark.parametrize(
+    "formatter,rendered",
+    [(JsonFormatter(), True), (LineFormatter(), False)],
+)
+async def test_tracebacks_can_be_rendered_off_the_loop(
+    monkeypatch, formatter, rendered: bool
+):
+    threads = []
+
+    def _render(exc):
+        threads.append(current_thread())
+        return render_traceback(exc)
+
+    monkeypatch.setattr(settings, "TRACEBACK_OFF_LOOP", True)
+    monkeypatch.setattr(async_loggers, "render_traceback", _render)
+
+    logger = AsyncLogger(name="off-loop", filter_=Filter(level=LogLevel.INFO))
+    logger._add_handler(handler := _Handler(formatter=formatter))
+
+    for _ in range(3):
+        await logger.exception(_catch(_fail))
+
+    if rendered:
+        assert len(threads) == 1 and threads[0] is not main_thread()
+        assert all(text.endswith("ValueError: boom\n") for text in handler.texts)
+    else:
+        assert not threads
+        assert all(text is _UNSET for text in handler.texts)
@@ -0,0 +1,108 @@
+import asyncio
+import io
+import sys
+from time import sleep
+
+from pytest import mark, raises
+
+from aiologbuch.formatters import JsonFormatter, LineFormatter
+from aiologbuch.loggers import AsyncLogger, SyncLogger
+from aiologbuch.shared.conf import settings
+from aiologbuch.shared.filters import Filter
+from aiologbuch.shared.levels import LogLevel
+from aiologbuch.shared.watchdog import LoopWatchdog, format_report, registry
+
+
+class _SlowFormatter(LineFormatter):
+    def format(self, record):
+        sleep(0.02)
+        return super().format(record)
+
+
+@mark.unit
+async def test_slow_log_calls_are_attributed(async_handler):
+    logger = AsyncLogger(name="watched", filter_=Filter(level=LogLevel.INFO))
+    logger._add_handler(async_handler(formatter=_SlowFormatter("{message}")))
+    logger._add_handler(async_handler(formatter=JsonFormatter(), write_time=0.02))
+    logger._add_handler(
+        async_handler(formatter=LineFormatter(), blocking=False, write_time=0.01)
+    )
+
+    async with LoopWatchdog(interval=0.01, report_interval=None) as watchdog:
+        for _ in range(3):
+            await logger.info("hello")
+        snapshot = watchdog.snapshot()
+
+    assert registry.active is None
+    offenders = {o["formatter"]: o for o in snapshot["offenders"]}
+    # NOTE: The handler that awaits its write never held the loop
+    assert set(offenders) == {"_SlowFormatter", "LineFormatter"}
+
+    slow = offenders["_SlowFormatter"]
+    assert (slow["handler"], slow["target"], slow["calls"]) == (
+        "StubAsyncHandler",
+        "app.log",
+        3,
+    )
+    assert slow["blocked"] >= 0.06 and slow["worst"] >= 0.02
+    assert slow["max_size"] == len(b"hello\n")
+    assert snapshot["offenders"][0]["formatter"] == "_SlowFormatter"
+
+    assert snapshot["stalls"] >= 1
+    assert 0 < snapshot["logging_in_stalls"] <= snapshot["stalled"]
+
+
+@mark.unit
+async def test_sync_loggers_are_only_watched_inside_the_loop(sync_handler):
+    logger = SyncLogger(name="sync-watched", filter_=Filter(level=LogLevel.INFO))
+    logger._add_handler(sync_handler(formatter=LineFormatter(), write_time=0.01))
+
+    async with LoopWatchdog(report_interval=None) as watchdog:
+        logger.info("on the loop")
+        await asyncio.to_thread(logger.info, "in a thread")
+        (offender,) = watchdog.snapshot()["offenders"]
+
+    assert offender["handler"] == "StubSyncHandler"
+    assert offender["calls"] == 1
+
+
+@mark.unit
+async def test_reports_are_periodic():
+    reports = []
+
+    interval = 0.01
+
+    async with LoopWatchdog(
+        interval=interval, report_interval=0.03, report=reports.append
+    ):
+        await asyncio.sleep(0.1)
+        # NOTE: However late in the interval this starts, the loop wakes the watchdog
+        # up at least 'interval' late
+        sleep(0.05)
+        await asyncio.sleep(0.05)
+
+    assert len(reports) >= 2
+    assert reports[-1]["max_lag"] >= interval
+    assert format_report(reports[-1]).startswith("aiologbuch watchdog: ")
+
+
+@mark.unit
+async def test_reports_are_written_under_the_stderr_lock(monkeypatch):
+    settings.configure()
+    monkeypatch.setattr(sys, "stderr", stderr := io.StringIO())
+
+    async with LoopWatchdog(interval=0.01, report_interval=0.01):
+        async with settings.GLOBAL_STDERR_LOCK:
+            await asyncio.sleep(0.05)
+            assert stderr.getvalue() == ""
+        await asyncio.sleep(0.05)
+
+    assert stderr.getvalue().startswith("aiologbuch watchdog: ")
+
+
+@mark.unit
+async def test_only_one_watchdog_runs():
+    async with LoopWatchdog():
+        with raises(RuntimeError):
+            await LoopWatchdog().start()
+    assert registry.active is None